@@ -19,6 +19,25 @@ if __name__ == "__main__":
     parser.add_argument(
         "--log-level", type=str, default="INFO", help="Logging level (DEBUG, INFO, WARNING, ERROR)"
     )
+    parser.add_argument(
+        "--data-path", type=str, default="data", help="Directory containing the parquet files"
+    )
+    parser.add_argument(
+        "--watch-data", type=float, default=0, metavar="SECONDS",
+        help="Reload the data when the parquet files change, polling every SECONDS (0 to disable)"
+    )
+    parser.add_argument(
+        "--profile-sample-rate", type=float, default=0, metavar="RATE",
+        help="Profile this fraction of callback and loader calls (0 to disable)"
+    )
+    parser.add_argument(
+        "--profile-slow-ms", type=float, default=500, metavar="MS",
+        help="Save the profiles of calls slower than MS milliseconds to logs/profiles/"
+    )
+    parser.add_argument(
+        "--trace-file", type=str, default=None, metavar="PATH",
+        help="Write request tracing spans as JSON lines to PATH (e.g. logs/traces.jsonl)"
+    )
     
     args = parser.parse_args()
     
@@ -26,6 +45,12 @@ if __name__ == "__main__":
     os.environ["PORT"] = str(args.port)
     os.environ["DEBUG"] = str(args.debug).lower()
     os.environ["LOG_LEVEL"] = args.log_level.upper()
+    os.environ["DATA_PATH"] = args.data_path
+    os.environ["DATA_WATCH_INTERVAL"] = str(args.watch_data)
+    os.environ["PROFILE_SAMPLE_RATE"] = str(args.profile_sample_rate)
+    os.environ["PROFILE_SLOW_MS"] = str(args.profile_slow_ms)
+    if args.trace_file:
+        os.environ["TRACE_FILE"] = args.trace_file
     
     logger.info(f"Starting application with: port={args.port}, debug={args.debug}, log_level={args.log_level}")
     
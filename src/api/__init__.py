@@ -0,0 +1,3 @@
+"""
+HTTP API modules for the Flask server behind the Dash application.
+"""
@@ -0,0 +1,113 @@
+"""
+Administrative endpoints for operating a running instance.
+"""
+import hmac
+import os
+
+from flask import Blueprint, jsonify, request
+
+from src.data.reload import ReloadableLoader
+from src.utils import profiling
+from src.utils.logging import logger
+
+# Requests from these addresses need no token when ADMIN_TOKEN is unset
+LOCAL_ADDRESSES = {"127.0.0.1", "::1"}
+
+
+def is_authorized() -> bool:
+    """
+    Check the request against the ADMIN_TOKEN environment variable.
+
+    With a token configured, the request must send it as a bearer token;
+    without one, only local requests are allowed.
+    """
+    token = os.environ.get("ADMIN_TOKEN")
+    if not token:
+        return request.remote_addr in LOCAL_ADDRESSES
+    sent = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+    return hmac.compare_digest(sent, token)
+
+
+def create_admin_blueprint(loaders: ReloadableLoader) -> Blueprint:
+    """
+    Create the /api/admin blueprint.
+
+    Args:
+        loaders: The reloadable DataLoader holder.
+
+    Returns:
+        A Flask blueprint mounted under /api/admin.
+    """
+    admin = Blueprint("api_admin", __name__, url_prefix="/api/admin")
+
+    @admin.before_request
+    def check_authorization():
+        if not is_authorized():
+            return jsonify({"error": "Forbidden"}), 403
+        return None
+
+    @admin.route("/reload", methods=["GET"])
+    def reload_status():
+        """Report the current loader generation and the last reload."""
+        return jsonify(loaders.status())
+
+    @admin.route("/load-report")
+    def load_report():
+        """Report per-phase load timings and memory of the current generation."""
+        loader = loaders.current
+        if loader is None:
+            return jsonify({"error": "DataLoader not initialized"}), 503
+        return jsonify(loader.load_report())
+
+    @admin.route("/memory-report")
+    def memory_report():
+        """Report the memory of the current generation's structures; ?proteins=&edges= add a projection."""
+        loader = loaders.current
+        if loader is None:
+            return jsonify({"error": "DataLoader not initialized"}), 503
+        target_proteins = request.args.get("proteins", type=int)
+        target_edges = request.args.get("edges", type=int)
+        return jsonify(loader.memory_report(target_proteins, target_edges))
+
+    @admin.route("/reload", methods=["POST"])
+    def reload_data():
+        """Start building a new loader generation; ?wait=1 blocks until it is swapped in."""
+        wait = request.args.get("wait", "0").lower() in ("1", "true")
+        started = loaders.reload(wait=wait)
+        logger.info(f"Reload requested by {request.remote_addr} ({'started' if started else 'already running'})")
+
+        status = loaders.status()
+        if not started:
+            return jsonify(status), 409
+        return jsonify(status), 200 if wait else 202
+
+    @admin.route("/deltas", methods=["POST"])
+    def apply_deltas():
+        """Apply pending deltas from data/deltas/ to a copy of the current generation; ?wait=1 blocks."""
+        wait = request.args.get("wait", "0").lower() in ("1", "true")
+        started = loaders.apply_deltas(wait=wait)
+        logger.info(f"Delta ingest requested by {request.remote_addr} ({'started' if started else 'already running'})")
+
+        status = loaders.status()
+        if not started:
+            return jsonify(status), 409
+        return jsonify(status), 200 if wait else 202
+
+    @admin.route("/profiling", methods=["GET", "POST"])
+    def profiling_settings():
+        """Report the profiling settings; POST ?sample_rate=&slow_ms= changes them until restart."""
+        if request.method == "POST":
+            sample_rate = request.args.get("sample_rate", type=float)
+            slow_ms = request.args.get("slow_ms", type=float)
+            if sample_rate is not None and not 0 <= sample_rate <= 1:
+                return jsonify({"error": "sample_rate must be between 0 and 1"}), 400
+            profiling.configure(sample_rate=sample_rate, slow_ms=slow_ms)
+            logger.info(f"Profiling set to sample rate {profiling.config.sample_rate}, "
+                        f"threshold {profiling.config.slow_ms}ms by {request.remote_addr}")
+        return jsonify({
+            "sample_rate": profiling.config.sample_rate,
+            "slow_ms": profiling.config.slow_ms,
+            "directory": str(profiling.config.directory),
+        })
+
+    return admin
@@ -0,0 +1,105 @@
+"""
+HTTP caching for API and export responses, keyed on the dataset version.
+"""
+from email.utils import format_datetime
+from typing import Callable, Optional
+
+from flask import Blueprint, Response, g, request
+
+from src.data.loader import DataLoader
+from src.utils.metrics import metrics
+
+# Seconds clients may reuse a response before revalidating
+CACHE_MAX_AGE = 60
+
+
+def dataset_etag(loader: DataLoader) -> str:
+    """
+    Get the ETag shared by every response for the loaded dataset.
+
+    Responses only depend on the URL and the data, so the dataset version is
+    a valid validator for any URL. The tag is weak because results with tied
+    ranks are not guaranteed to be byte-identical across processes.
+
+    Args:
+        loader: The DataLoader.
+
+    Returns:
+        A weak ETag header value.
+    """
+    return f'W/"{loader.dataset_version}"'
+
+
+def _not_modified(loader: DataLoader, etag: str) -> bool:
+    """Check the request's conditional headers against the loaded dataset."""
+    if request.if_none_match:
+        # Weak comparison: a client may send the tag with or without the W/ prefix
+        return request.if_none_match.contains_weak(etag.removeprefix('W/').strip('"'))
+
+    if request.if_modified_since and loader.dataset_modified:
+        return loader.dataset_modified.replace(microsecond=0) <= request.if_modified_since
+    return False
+
+
+def request_loader(get_loader: Callable[[], Optional[DataLoader]]) -> Callable[[], Optional[DataLoader]]:
+    """
+    Pin the loader generation to the request.
+
+    A reload can swap generations between before_request, the view and
+    after_request; reading the current loader in each would put the new
+    generation's validators on a body built from the old one. The first call
+    in a request stores the loader on flask.g and later calls return it.
+
+    Args:
+        get_loader: Returns the current DataLoader (None if loading failed).
+
+    Returns:
+        A function returning the same DataLoader for the whole request.
+    """
+    def get_request_loader() -> Optional[DataLoader]:
+        if "loader" not in g:
+            g.loader = get_loader()
+        return g.loader
+
+    return get_request_loader
+
+
+def add_http_caching(blueprint: Blueprint, get_loader: Callable[[], Optional[DataLoader]]):
+    """
+    Add ETag / Last-Modified / Cache-Control headers and 304 responses to a blueprint's GET routes.
+
+    Args:
+        blueprint: The blueprint to cache.
+        get_loader: Returns the request's DataLoader, from request_loader() so
+            the headers match the generation the view used.
+    """
+
+    @blueprint.before_request
+    def answer_conditional_request():
+        loader = get_loader()
+        if request.method != "GET" or loader is None:
+            return None
+
+        etag = dataset_etag(loader)
+        not_modified = _not_modified(loader, etag)
+        metrics.record_cache("http_conditional", not_modified)
+        if not_modified:
+            response = Response(status=304)
+            _set_cache_headers(response, loader, etag)
+            return response
+        return None
+
+    @blueprint.after_request
+    def add_cache_headers(response: Response) -> Response:
+        loader = get_loader()
+        if request.method == "GET" and response.status_code == 200 and loader is not None:
+            _set_cache_headers(response, loader, dataset_etag(loader))
+        return response
+
+
+def _set_cache_headers(response: Response, loader: DataLoader, etag: str):
+    """Set the validators and freshness headers on a response."""
+    response.headers["ETag"] = etag
+    if loader.dataset_modified:
+        response.headers["Last-Modified"] = format_datetime(loader.dataset_modified, usegmt=True)
+    response.headers["Cache-Control"] = f"public, max-age={CACHE_MAX_AGE}"
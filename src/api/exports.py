@@ -0,0 +1,111 @@
+"""
+Streaming CSV and Parquet writers for exports.
+"""
+import io
+from typing import Iterable, Iterator, List
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def _flatten_lists(batch: pd.DataFrame) -> pd.DataFrame:
+    """Join list-valued cells with ';' so they fit in one CSV field."""
+    batch = batch.copy()
+    for column in batch.columns:
+        if batch[column].dtype == object and batch[column].map(
+            lambda value: isinstance(value, (list, np.ndarray))
+        ).any():
+            batch[column] = batch[column].map(
+                lambda value: ";".join(map(str, value)) if isinstance(value, (list, np.ndarray)) else value
+            )
+    return batch
+
+
+def stream_csv(batches: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+    """
+    Encode DataFrame batches as one CSV document, a chunk per batch.
+
+    Args:
+        batches: DataFrames with the same columns.
+
+    Yields:
+        UTF-8 encoded CSV chunks; the first includes the header.
+    """
+    header = True
+    for batch in batches:
+        buffer = io.StringIO()
+        _flatten_lists(batch).to_csv(buffer, header=header, index=False)
+        header = False
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink:
+    """Write-only file object that hands written bytes back to the caller."""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def stream_parquet(batches: Iterable[pd.DataFrame]) -> Iterator[bytes]:
+    """
+    Encode DataFrame batches as one Parquet file, a row group per batch.
+
+    The schema comes from the first batch (all-null columns become strings);
+    later batches are cast to it.
+
+    Args:
+        batches: DataFrames with the same columns.
+
+    Yields:
+        Chunks of the Parquet file as each row group is written.
+    """
+    sink = _ChunkSink()
+    writer = None
+    try:
+        for batch in batches:
+            if writer is None:
+                table = pa.Table.from_pandas(batch, preserve_index=False)
+                # Columns that are all-null in the first batch are assumed to hold strings
+                schema = pa.schema([
+                    field.with_type(pa.string()) if pa.types.is_null(field.type) else field
+                    for field in table.schema
+                ])
+                table = table.cast(schema)
+                writer = pq.ParquetWriter(sink, schema)
+            else:
+                table = pa.Table.from_pandas(batch, schema=writer.schema, preserve_index=False)
+            writer.write_table(table)
+            yield sink.drain()
+    finally:
+        if writer is not None:
+            writer.close()
+    yield sink.drain()
@@ -0,0 +1,32 @@
+"""
+Prometheus scrape endpoint for the in-process metrics.
+"""
+from flask import Blueprint, Response, jsonify
+
+from src.api.admin import is_authorized
+from src.utils.metrics import metrics
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def create_metrics_blueprint() -> Blueprint:
+    """
+    Create the blueprint serving /metrics.
+
+    Access follows the admin endpoints: local scrapers need no token unless
+    ADMIN_TOKEN is set, in which case it must be sent as a bearer token.
+
+    Returns:
+        A Flask blueprint with the /metrics route.
+    """
+    blueprint = Blueprint("metrics", __name__)
+
+    @blueprint.route("/metrics")
+    def prometheus_metrics():
+        """Serve callback and loader latencies and cache hit rates in Prometheus text format."""
+        if not is_authorized():
+            return jsonify({"error": "Forbidden"}), 403
+        return Response(metrics.render(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+    return blueprint
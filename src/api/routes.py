@@ -0,0 +1,134 @@
+"""
+HTTP endpoints served alongside the Dash application.
+"""
+import re
+from typing import Callable, Iterator, List, Optional
+
+import pandas as pd
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+
+from src.api.caching import add_http_caching, request_loader
+from src.api.exports import EXPORT_FORMATS, stream_csv, stream_parquet
+from src.data.loader import DataLoader
+from src.utils.logging import logger
+
+
+def request_identifiers() -> Optional[List[str]]:
+    """
+    Read identifiers from the request body.
+
+    Accepts a JSON body {"identifiers": [...]} or plain text with one
+    identifier per line (commas, semicolons and whitespace also separate).
+
+    Returns:
+        The identifiers, or None if a JSON body is malformed.
+    """
+    if request.is_json:
+        identifiers = (request.get_json(silent=True) or {}).get("identifiers")
+        if not isinstance(identifiers, list) or not all(isinstance(i, str) for i in identifiers):
+            return None
+        return identifiers
+    return [i for i in re.split(r"[\s,;]+", request.get_data(as_text=True)) if i]
+
+
+def _export_response(batches: Iterator[pd.DataFrame], filename: str):
+    """
+    Stream batches as a CSV or Parquet download, chosen by the format query parameter.
+
+    Args:
+        batches: DataFrame batches to export.
+        filename: Download file name without extension.
+
+    Returns:
+        A streaming Flask response, or a 400 error for unknown formats.
+    """
+    export_format = request.args.get("format", "csv")
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({"error": f"Unsupported format: {export_format}"}), 400
+
+    chunks = stream_csv(batches) if export_format == "csv" else stream_parquet(batches)
+    return Response(
+        stream_with_context(chunks),
+        mimetype=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
+
+
+def create_api_blueprint(get_loader: Callable[[], Optional[DataLoader]]) -> Blueprint:
+    """
+    Create the blueprint with the HTTP endpoints.
+
+    Args:
+        get_loader: Returns the current DataLoader (None if loading failed).
+
+    Returns:
+        A Flask blueprint mounted under /api.
+    """
+    api = Blueprint("api", __name__, url_prefix="/api")
+    # Every hook and view of a request sees the same generation
+    get_loader = request_loader(get_loader)
+
+    @api.route("/resolve", methods=["POST"])
+    def resolve_identifiers():
+        """Resolve identifiers in bulk (see request_identifiers for the body format)."""
+        loader = get_loader()
+        if loader is None:
+            return jsonify({"error": "DataLoader not initialized"}), 503
+
+        identifiers = request_identifiers()
+        if identifiers is None:
+            return jsonify({"error": "Expected {\"identifiers\": [string, ...]}"}), 400
+
+        logger.info(f"Resolving {len(identifiers)} identifiers")
+        resolution = loader.resolve_identifiers(identifiers)
+        resolution["counts"] = {key: len(resolution[key]) for key in ("resolved", "ambiguous", "unresolved")}
+        return jsonify(resolution)
+
+    @api.route("/export/search")
+    def export_search():
+        """Export all results of a search (q, type) as protein summary rows."""
+        loader = get_loader()
+        if loader is None:
+            return jsonify({"error": "DataLoader not initialized"}), 503
+
+        query = request.args.get("q", "")
+        search_type = request.args.get("type", "protein")
+        try:
+            protein_ids = loader.search_protein_ids(
+                query,
+                search_type,
+                namespace=request.args.get("namespace") or None,
+                min_score=request.args.get("min_score", type=float),
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        logger.info(f"Exporting {len(protein_ids)} search results for {query} ({search_type})")
+        return _export_response(loader.iter_protein_summary_batches(protein_ids), "search_results")
+
+    @api.route("/export/go/<go_id>")
+    def export_go_term_proteins(go_id):
+        """Export the proteins annotated with a GO term, highest score first."""
+        loader = get_loader()
+        if loader is None:
+            return jsonify({"error": "DataLoader not initialized"}), 503
+        if loader.get_go_term(go_id) is None:
+            return jsonify({"error": f"Unknown GO term: {go_id}"}), 404
+
+        logger.info(f"Exporting proteins for GO term {go_id}")
+        filename = re.sub(r"[^A-Za-z0-9_.-]", "_", go_id) + "_proteins"
+        return _export_response(loader.iter_go_term_protein_batches(go_id), filename)
+
+    @api.route("/export/interactions")
+    def export_interactions():
+        """Export protein-protein interactions, optionally of one protein (protein_id)."""
+        loader = get_loader()
+        if loader is None:
+            return jsonify({"error": "DataLoader not initialized"}), 503
+
+        protein_id = request.args.get("protein_id") or None
+        logger.info(f"Exporting interactions for {protein_id or 'all proteins'}")
+        return _export_response(loader.iter_interaction_batches(protein_id), "interactions")
+
+    add_http_caching(api, get_loader)
+    return api
@@ -0,0 +1,70 @@
+"""
+Fast JSON serialization for API responses, using orjson when it is installed.
+"""
+import datetime
+import json
+import math
+from typing import Any
+
+import numpy as np
+from flask import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Convert values the JSON encoders don't handle natively."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _clean(value: Any) -> Any:
+    """Replace NaN with None and unwrap NumPy values for the standard library encoder."""
+    if isinstance(value, dict):
+        return {key: _clean(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_clean(item) for item in value]
+    if isinstance(value, (np.generic, np.ndarray)):
+        return _clean(_default(value))
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def dumps(payload: Any) -> bytes:
+    """
+    Serialize a payload to JSON bytes.
+
+    NaN becomes null; NumPy scalars and arrays and dates are converted.
+
+    Args:
+        payload: JSON-compatible data.
+
+    Returns:
+        UTF-8 encoded JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(_clean(payload), default=_default, allow_nan=False).encode("utf-8")
+
+
+def json_response(payload: Any, status: int = 200) -> Response:
+    """
+    Create a JSON response.
+
+    Args:
+        payload: JSON-compatible data.
+        status: HTTP status code.
+
+    Returns:
+        A Flask response.
+    """
+    return Response(dumps(payload), status=status, mimetype="application/json")
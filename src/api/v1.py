@@ -0,0 +1,196 @@
+"""
+Versioned, read-only JSON API (/api/v1) over the DataLoader.
+"""
+import base64
+import json
+from typing import Callable, Optional, Tuple
+
+from flask import Blueprint, request
+
+from src.api.caching import add_http_caching, request_loader
+from src.api.routes import request_identifiers
+from src.api.serialization import json_response
+from src.data.loader import DataLoader
+from src.utils.logging import logger
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+
+
+class CursorError(ValueError):
+    """Raised for malformed cursors or cursors from another dataset version."""
+
+
+def encode_cursor(offset: int, version: str) -> str:
+    """
+    Encode a pagination position as an opaque cursor.
+
+    Args:
+        offset: Number of items already returned.
+        version: Dataset version the cursor belongs to.
+
+    Returns:
+        A URL-safe cursor string.
+    """
+    data = json.dumps({"offset": offset, "version": version}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], version: str) -> int:
+    """
+    Decode a cursor back to an offset.
+
+    Args:
+        cursor: Cursor from a previous response (None or empty for the first page).
+        version: Current dataset version.
+
+    Returns:
+        The offset to continue from.
+
+    Raises:
+        CursorError: If the cursor is malformed or from another dataset version.
+    """
+    if not cursor:
+        return 0
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        offset = int(data["offset"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise CursorError(f"Invalid cursor: {cursor}") from e
+    if data.get("version") != version or offset < 0:
+        raise CursorError("Cursor is from another dataset version; restart from the first page")
+    return offset
+
+
+def create_v1_blueprint(get_loader: Callable[[], Optional[DataLoader]]) -> Blueprint:
+    """
+    Create the /api/v1 blueprint.
+
+    Args:
+        get_loader: Returns the current DataLoader (None if loading failed).
+
+    Returns:
+        A Flask blueprint mounted under /api/v1.
+    """
+    api = Blueprint("api_v1", __name__, url_prefix="/api/v1")
+    # Every hook and view of a request sees the same generation
+    get_loader = request_loader(get_loader)
+
+    def page_args(loader: DataLoader) -> Tuple[int, int]:
+        """Read (offset, limit) from the cursor and limit query parameters."""
+        limit = request.args.get("limit", DEFAULT_PAGE_SIZE, type=int)
+        return decode_cursor(request.args.get("cursor"), loader.dataset_version), max(1, min(limit, MAX_PAGE_SIZE))
+
+    def next_cursor(loader: DataLoader, offset: int, limit: int, total: int) -> Optional[str]:
+        return encode_cursor(offset + limit, loader.dataset_version) if offset + limit < total else None
+
+    @api.errorhandler(CursorError)
+    def cursor_error(e):
+        return json_response({"error": str(e)}, 400)
+
+    @api.before_request
+    def require_loader():
+        if get_loader() is None:
+            return json_response({"error": "DataLoader not initialized"}, 503)
+
+    @api.route("/version")
+    def version():
+        """Dataset version and sizes."""
+        loader = get_loader()
+        return json_response({
+            "dataset_version": loader.dataset_version,
+            "proteins": len(loader.protein_index),
+            "go_terms": len(loader.go_terms),
+            "edges": len(loader.edges),
+        })
+
+    @api.route("/proteins/<path:protein_id>")
+    def protein(protein_id):
+        """Full protein details, including annotations and interactions."""
+        loader = get_loader()
+        if protein_id not in loader.id_to_details:
+            return json_response({"error": f"Unknown protein: {protein_id}"}, 404)
+        return json_response(loader.get_protein_details(protein_id))
+
+    @api.route("/proteins/<path:protein_id>/neighbors")
+    def neighbors(protein_id):
+        """Interaction partners of a protein, highest score first."""
+        loader = get_loader()
+        if protein_id not in loader.id_to_details:
+            return json_response({"error": f"Unknown protein: {protein_id}"}, 404)
+
+        offset, limit = page_args(loader)
+        page = loader.get_protein_neighbors(protein_id, offset, limit)
+        return json_response({
+            "protein_id": protein_id,
+            "total": page["total"],
+            "results": page["neighbors"],
+            "next_cursor": next_cursor(loader, offset, limit, page["total"]),
+        })
+
+    @api.route("/search")
+    def search():
+        """Search proteins (q, type, namespace, min_score) and return protein summaries."""
+        loader = get_loader()
+        query = request.args.get("q", "")
+        if not query:
+            return json_response({"error": "Missing query parameter q"}, 400)
+
+        offset, limit = page_args(loader)
+        try:
+            protein_ids = loader.search_protein_ids(
+                query,
+                request.args.get("type", "protein"),
+                namespace=request.args.get("namespace") or None,
+                min_score=request.args.get("min_score", type=float),
+            )
+        except ValueError as e:
+            return json_response({"error": str(e)}, 400)
+
+        return json_response({
+            "query": query,
+            "total": len(protein_ids),
+            "results": loader.get_protein_summaries(protein_ids[offset:offset + limit]),
+            "next_cursor": next_cursor(loader, offset, limit, len(protein_ids)),
+        })
+
+    @api.route("/go/<go_id>")
+    def go_term(go_id):
+        """GO term details."""
+        loader = get_loader()
+        term = loader.get_go_term(go_id)
+        if term is None:
+            return json_response({"error": f"Unknown GO term: {go_id}"}, 404)
+        return json_response(term)
+
+    @api.route("/go/<go_id>/proteins")
+    def go_term_proteins(go_id):
+        """Proteins annotated with a GO term, highest score first."""
+        loader = get_loader()
+        term = loader.get_go_term(go_id)
+        if term is None:
+            return json_response({"error": f"Unknown GO term: {go_id}"}, 404)
+
+        offset, limit = page_args(loader)
+        return json_response({
+            "go_id": go_id,
+            "total": term["protein_count"],
+            "results": loader.get_go_term_proteins(go_id, offset, limit),
+            "next_cursor": next_cursor(loader, offset, limit, term["protein_count"]),
+        })
+
+    @api.route("/resolve", methods=["POST"])
+    def resolve():
+        """Resolve identifiers given as {"identifiers": [...]} or one per line."""
+        loader = get_loader()
+        identifiers = request_identifiers()
+        if identifiers is None:
+            return json_response({"error": "Expected {\"identifiers\": [string, ...]}"}, 400)
+
+        logger.info(f"Resolving {len(identifiers)} identifiers")
+        resolution = loader.resolve_identifiers(identifiers)
+        resolution["counts"] = {key: len(resolution[key]) for key in ("resolved", "ambiguous", "unresolved")}
+        return json_response(resolution)
+
+    add_http_caching(api, get_loader)
+    return api
@@ -1,19 +1,47 @@
 """
 Main application file for the Protein Information Explorer.
 """
+import atexit
+import base64
 import os
+import re
+import threading
 from pathlib import Path
+from uuid import uuid4
+from urllib.parse import parse_qs, urlencode
 
 import dash
 import dash_bootstrap_components as dbc
-from dash import Input, Output, State, callback, dcc, html
+from dash import Input, Output, Patch, State, callback, dcc, html
 
+from src.api.admin import create_admin_blueprint
+from src.api.metrics import create_metrics_blueprint
+from src.api.routes import create_api_blueprint
+from src.api.v1 import create_v1_blueprint
+from src.components.go_term_card import create_go_term_result_card
 from src.components.layout import create_layout
+from src.components.search import (
+    create_export_links,
+    create_facet_controls,
+    create_motif_results,
+    create_protein_result_card,
+    format_protein_features,
+    format_protein_summary,
+    motif_status,
+    motif_table_rows,
+)
+from src.data.motif import MotifScanJob, create_scan_pool
 from src.data.loader import DataLoader
+from src.data.reload import ReloadableLoader
 from src.pages.about import create_about_page
+from src.pages.enrichment import create_enrichment_page, create_enrichment_results
+from src.pages.go_term_detail import create_go_term_detail_page
 from src.pages.home import create_home_page
+from src.pages.resolve import create_resolve_page, create_resolve_results, resolution_to_csv
 from src.pages.protein_detail import create_protein_detail_page
-from src.utils.logging import logger
+from src.utils.logging import log_hot, logger
+from src.utils.metrics import metrics, timed
+from src.utils.tracing import continue_trace, current_span, span
 
 # Initialize the Dash application
 app = dash.Dash(
@@ -27,19 +55,152 @@ app = dash.Dash(
 assets_dir = Path("assets")
 assets_dir.mkdir(exist_ok=True)
 
-# Initialize DataLoader
-logger.info("Initializing DataLoader...")
-try:
-    loader = DataLoader(data_path="data")
+# Worker processes for building missing or stale offline indexes (0 to only load them)
+INDEX_WORKERS = int(os.environ.get("INDEX_WORKERS", os.cpu_count() or 1))
+
+
+def load_data(data_path):
+    """
+    Build and load a DataLoader generation.
+    
+    Args:
+        data_path: Directory containing the parquet files
+        
+    Returns:
+        The loaded DataLoader
+    """
+    loader = DataLoader(data_path=data_path, index_workers=INDEX_WORKERS)
     logger.info(
         f"DataLoader initialized successfully. "
         f"Proteins: {len(loader.protein_nodes)}, "
         f"GO Terms: {len(loader.go_terms)}, "
         f"Edges: {len(loader.edges)}"
     )
-except Exception as e:
-    logger.error(f"Error initializing DataLoader: {e}")
-    loader = None
+    return loader
+
+
+# Initialize DataLoader; reloads build a new generation and swap it in atomically
+logger.info("Initializing DataLoader...")
+loaders = ReloadableLoader(
+    data_path=os.environ.get("DATA_PATH", "data"),
+    loader_factory=load_data,
+    compact_after=int(os.environ.get("DELTA_COMPACT_AFTER", 7)),
+)
+
+
+def get_loader():
+    """
+    Get the current DataLoader generation.
+    
+    Callbacks read it once so a request finishes on the generation it started with.
+    
+    Returns:
+        The DataLoader, or None if loading failed
+    """
+    return loaders.current
+
+
+# HTTP endpoints (identifier resolution, exports, JSON API, admin, metrics) on the underlying Flask server
+app.server.register_blueprint(create_api_blueprint(get_loader))
+app.server.register_blueprint(create_v1_blueprint(get_loader))
+app.server.register_blueprint(create_admin_blueprint(loaders))
+app.server.register_blueprint(create_metrics_blueprint())
+
+# Reload automatically when the data files change (seconds between polls, 0 to disable)
+DATA_WATCH_INTERVAL = float(os.environ.get("DATA_WATCH_INTERVAL", 0))
+if DATA_WATCH_INTERVAL > 0:
+    loaders.watch(DATA_WATCH_INTERVAL)
+
+# Number of proteins shown per page on GO term pages
+GO_TERM_PAGE_SIZE = 50
+
+# Running and recent motif scans, keyed by job ID
+MAX_MOTIF_JOBS = 20
+# Matches sent to the browser per scan; the rest are only counted
+MAX_MOTIF_ROWS = 2000
+motif_jobs = {}
+
+# One process pool shared by all motif scans, started by the first scan
+MOTIF_WORKERS = int(os.environ.get("MOTIF_WORKERS", os.cpu_count() or 1))
+motif_pool = None
+motif_pool_lock = threading.Lock()
+
+
+def get_motif_pool():
+    """
+    Get the shared motif scan pool, starting it on first use.
+    
+    Importing the app (tools, benchmarks, WSGI servers) therefore starts no
+    worker processes until a motif search is made.
+    
+    Returns:
+        The process pool
+    """
+    global motif_pool
+    with motif_pool_lock:
+        if motif_pool is None:
+            motif_pool = create_scan_pool(MOTIF_WORKERS)
+            atexit.register(motif_pool.shutdown, wait=False, cancel_futures=True)
+        return motif_pool
+
+
+def drop_finished_motif_jobs(old_loader, new_loader):
+    """
+    Forget completed motif scans when a new generation is swapped in.
+    
+    Running scans keep their reference to the old generation and finish on it.
+    
+    Args:
+        old_loader: The replaced DataLoader
+        new_loader: The new DataLoader
+    """
+    for job_id, job in list(motif_jobs.items()):
+        if job.done:
+            motif_jobs.pop(job_id, None)
+
+
+loaders.on_swap(drop_finished_motif_jobs)
+
+# Protein IDs of recent faceted searches, keyed by dataset version and query
+MAX_FACET_RESULTS = 32
+facet_results = {}
+
+
+def facet_protein_ids(loader, facet_query, protein_ids=None):
+    """
+    Get the protein IDs a faceted search matched, from the cache or by re-running the search.
+    
+    Args:
+        loader: The DataLoader serving the request
+        facet_query: Keyword arguments of search_protein_ids for the search
+        protein_ids: IDs the search already produced, to cache instead of re-running it
+        
+    Returns:
+        All protein IDs matched by the search
+    """
+    key = (loader.dataset_version, *sorted(facet_query.items()))
+    cached = facet_results.get(key)
+    metrics.record_cache("facet_results", cached is not None)
+    if cached is None:
+        cached = protein_ids if protein_ids is not None else loader.search_protein_ids(**facet_query)
+        facet_results[key] = cached
+        while len(facet_results) > MAX_FACET_RESULTS:
+            facet_results.pop(next(iter(facet_results)), None)
+    return cached
+
+
+def drop_facet_results(old_loader, new_loader):
+    """
+    Forget cached facet results when a new generation is swapped in.
+    
+    Args:
+        old_loader: The replaced DataLoader
+        new_loader: The new DataLoader
+    """
+    facet_results.clear()
+
+
+loaders.on_swap(drop_facet_results)
 
 # Define app layout with URL routing
 app.layout = html.Div(
@@ -55,31 +216,85 @@ app.layout = html.Div(
 @callback(
     Output("page-content", "children"),
     Input("url", "pathname"),
+    Input("url", "search"),
     State("protein-store", "data"),
 )
-def display_page(pathname, protein_data):
+@timed("callback")
+def display_page(pathname, search, protein_data):
     """
     Route to the appropriate page based on the URL path.
     
     Args:
         pathname: The URL path
+        search: The URL query string
         protein_data: Stored protein data
         
     Returns:
         The page layout
     """
-    logger.info(f"Navigating to: {pathname}")
+    loader = get_loader()
+    
+    log_hot("Navigating to: {}{}", pathname, search or "", pathname=pathname)
     
     if pathname == "/":
         return create_home_page()
     elif pathname == "/protein" and protein_data:
-        return create_protein_detail_page(protein_data)
+        # Trace the render together with the click that stored the protein
+        continue_trace(protein_data.get("trace_id"))
+        with span(
+            "render.protein_detail_page",
+            protein_id=protein_data.get("id"),
+            annotations=len(protein_data.get("functional_annotations", [])),
+            interactions=len(protein_data.get("protein_interactions", [])),
+        ):
+            return create_protein_detail_page(protein_data)
+    elif pathname and pathname.startswith("/go/") and loader:
+        go_id = pathname[len("/go/"):]
+        go_term = loader.get_go_term(go_id)
+        if not go_term:
+            return create_go_term_detail_page(None, [])
+        
+        try:
+            page = max(1, int(parse_qs((search or "").lstrip("?")).get("page", ["1"])[0]))
+        except ValueError:
+            page = 1
+        proteins = loader.get_go_term_proteins(
+            go_id, offset=(page - 1) * GO_TERM_PAGE_SIZE, limit=GO_TERM_PAGE_SIZE
+        )
+        return create_go_term_detail_page(go_term, proteins, page=page, page_size=GO_TERM_PAGE_SIZE)
+    elif pathname == "/enrichment":
+        return create_enrichment_page()
+    elif pathname == "/resolve":
+        return create_resolve_page()
     elif pathname == "/about":
         return create_about_page()
     else:
         return create_home_page()
 
 
+def with_facets(facet_query, result_cards, export_href=None):
+    """
+    Wrap search result cards with facet controls over the full result set.
+    
+    Only the query is sent to the browser; the matched protein IDs stay on
+    the server (see facet_protein_ids).
+    
+    Args:
+        facet_query: Keyword arguments of search_protein_ids for the search
+        result_cards: The initially displayed result components
+        export_href: Export URL for the full result set, if exportable
+        
+    Returns:
+        A list of components for the search results card
+    """
+    return [
+        dcc.Store(id="facet-query", data=facet_query),
+        create_export_links(export_href) if export_href else html.Div(),
+        create_facet_controls(),
+        html.Div(result_cards, id="faceted-results"),
+    ]
+
+
 # Callback for search functionality
 @callback(
     [
@@ -92,28 +307,46 @@ def display_page(pathname, protein_data):
     [
         State("search-input", "value"),
         State("search-type", "value"),
+        State("go-query-namespace", "value"),
+        State("go-query-min-score", "value"),
     ],
     prevent_initial_call=True,
 )
-def perform_search(n_clicks, search_term, search_type):
+@timed("callback")
+def perform_search(n_clicks, search_term, search_type, go_namespace=None, go_min_score=None):
     """
     Perform a search based on the input term and type.
     
     Args:
         n_clicks: Button click count
         search_term: The search term
-        search_type: The search type (protein or go_term)
+        search_type: The search type (protein, go_term, go_query, sequence,
+            similar_sequence or motif)
+        go_namespace: Namespace restriction for GO queries
+        go_min_score: Minimum annotation score for GO queries
         
     Returns:
         Tuple of (results_style, results_content, error_visible, error_message)
     """
+    loader = get_loader()
+    
     if not n_clicks or not search_term:
         return {"display": "none"}, [], False, ""
     
     if not loader:
         return {"display": "block"}, [], True, "Error: DataLoader not initialized."
     
-    logger.info(f"Performing search: {search_term} (type: {search_type})")
+    log_hot("Performing search: {} (type: {})", search_term, search_type, search_term=search_term, search_type=search_type)
+    export_params = {"q": search_term, "type": search_type}
+    if search_type == "go_query":
+        export_params.update({"namespace": go_namespace or "", "min_score": go_min_score or ""})
+    export_href = f"/api/export/search?{urlencode(export_params)}"
+    facet_query = {
+        "query": search_term,
+        "search_type": search_type,
+        "namespace": go_namespace or None,
+        "min_score": go_min_score,
+    }
     
     try:
         if search_type == "protein":
@@ -121,85 +354,437 @@ def perform_search(n_clicks, search_term, search_type):
             if not results:
                 return {"display": "block"}, [], True, f"No proteins found for: {search_term}"
             
-            logger.info(f"Found {len(results)} proteins")
+            log_hot("Found {} proteins", len(results), results=len(results))
             
-            # Create result cards
+            # Create result cards from the precomputed protein summaries
             result_cards = []
-            for i, protein_id in enumerate(results[:20]):  # Limit to 20 results
-                protein_details = loader.get_protein_details(protein_id)
-                card = dbc.Card(
-                    [
-                        dbc.CardBody(
-                            [
-                                html.H5(protein_details.get("name", protein_id)),
-                                html.P(f"ID: {protein_id}"),
-                                html.P(f"UUID: {protein_details.get('uuid', 'N/A')}"),
-                                dbc.Button(
-                                    "View Details",
-                                    id={"type": "protein-button", "index": i},
-                                    color="primary",
-                                    className="mt-2",
-                                ),
-                                # Hidden div to store protein data
-                                html.Div(
-                                    id={"type": "protein-data", "index": i},
-                                    style={"display": "none"},
-                                    **{"data-protein": str(protein_id)},
-                                ),
-                            ]
-                        )
-                    ],
-                    className="mb-3",
+            for i, protein in enumerate(loader.get_protein_summaries(results[:20])):  # Limit to 20 results
+                card = create_protein_result_card(
+                    i,
+                    protein["protein_id"],
+                    protein["name"],
+                    format_protein_summary(protein),
                 )
                 result_cards.append(card)
             
-            return {"display": "block"}, result_cards, False, ""
+            facet_protein_ids(loader, facet_query, results)
+            return {"display": "block"}, with_facets(facet_query, result_cards, export_href), False, ""
         
         elif search_type == "go_term":
-            # Handle GO term search
-            go_results = loader.search_by_go_term(search_term)
+            go_term = loader.get_go_term(search_term)
+            if not go_term:
+                # Not a GO identifier: full-text search over GO term names and definitions
+                go_terms = loader.search_go_terms(search_term, limit=20)
+                if not go_terms:
+                    return {"display": "block"}, [], True, f"No GO terms found for: {search_term}"
+                
+                log_hot("Found {} GO terms matching text", len(go_terms), results=len(go_terms))
+                return {"display": "block"}, [create_go_term_result_card(t) for t in go_terms], False, ""
+            
+            # Handle GO term search using the precomputed posting lists
+            go_results = loader.get_go_term_proteins(search_term, offset=0, limit=20)
             if not go_results:
                 return {"display": "block"}, [], True, f"No GO terms found for: {search_term}"
             
-            logger.info(f"Found {len(go_results)} proteins for GO term")
+            log_hot("Found {} proteins for GO term", go_term["protein_count"], results=go_term["protein_count"])
+            
+            # Link to the full, paginated GO term page
+            result_cards = [
+                dcc.Link(
+                    f"View all {go_term['protein_count']} proteins for {search_term}",
+                    href=f"/go/{search_term}",
+                    className="d-block mb-3",
+                )
+            ]
             
             # Create result cards for proteins associated with this GO term
-            result_cards = []
             for i, protein in enumerate(go_results[:20]):  # Limit to 20 results
                 protein_id = protein.get("protein_id")
-                card = dbc.Card(
-                    [
-                        dbc.CardBody(
-                            [
-                                html.H5(protein.get("name", protein_id)),
-                                html.P(f"ID: {protein_id}"),
-                                html.P(f"Score: {protein.get('score', 'N/A')}"),
-                                dbc.Button(
-                                    "View Details",
-                                    id={"type": "protein-button", "index": i},
-                                    color="primary",
-                                    className="mt-2",
-                                ),
-                                # Hidden div to store protein data
-                                html.Div(
-                                    id={"type": "protein-data", "index": i},
-                                    style={"display": "none"},
-                                    **{"data-protein": str(protein_id)},
-                                ),
-                            ]
-                        )
-                    ],
-                    className="mb-3",
+                card = create_protein_result_card(
+                    i,
+                    protein_id,
+                    protein.get("name", protein_id),
+                    f"Score: {protein.get('score', 'N/A')}",
+                )
+                result_cards.append(card)
+            
+            # The full ID list is only built if a facet control changes
+            return {"display": "block"}, with_facets(facet_query, result_cards, export_href), False, ""
+    
+        elif search_type == "go_query":
+            # Boolean GO query evaluated over the GO term bitmaps
+            results = loader.query_go_terms(
+                search_term, namespace=go_namespace or None, min_score=go_min_score
+            )
+            if not results:
+                return {"display": "block"}, [], True, f"No proteins match: {search_term}"
+            
+            log_hot("Found {} proteins for GO query", len(results), results=len(results))
+            
+            result_cards = [html.P(f"{len(results)} matching proteins", className="text-muted")]
+            for i, protein in enumerate(loader.get_protein_summaries(results[:20])):  # Limit to 20 results
+                card = create_protein_result_card(
+                    i,
+                    protein["protein_id"],
+                    protein["name"],
+                    format_protein_summary(protein),
+                )
+                result_cards.append(card)
+            
+            facet_protein_ids(loader, facet_query, results)
+            return {"display": "block"}, with_facets(facet_query, result_cards, export_href), False, ""
+    
+        elif search_type == "sequence":
+            # Peptide search using the k-mer index
+            results = loader.search_sequence(search_term)
+            if not results:
+                return {"display": "block"}, [], True, f"No sequences contain: {search_term}"
+            
+            log_hot("Found {} proteins containing peptide", len(results), results=len(results))
+            
+            result_cards = [html.P(f"{len(results)} matching proteins", className="text-muted")]
+            for i, protein in enumerate(results[:20]):  # Limit to 20 results
+                positions = ", ".join(str(p) for p in protein["positions"][:10])
+                card = create_protein_result_card(
+                    i,
+                    protein["protein_id"],
+                    protein["name"],
+                    f"Match at position: {positions}",
+                )
+                result_cards.append(card)
+            
+            facet_protein_ids(loader, facet_query, [protein["protein_id"] for protein in results])
+            return {"display": "block"}, with_facets(facet_query, result_cards, export_href), False, ""
+        
+        elif search_type == "similar_sequence":
+            # Sketch-based candidates reranked by banded alignment
+            results = loader.search_similar_sequences(search_term, k=20, rerank=True)
+            if not results:
+                return {"display": "block"}, [], True, f"No similar sequences found for: {search_term}"
+            
+            log_hot("Found {} similar sequences", len(results), results=len(results))
+            
+            result_cards = []
+            for i, protein in enumerate(results):
+                card = create_protein_result_card(
+                    i,
+                    protein["protein_id"],
+                    protein["name"],
+                    f"Aligned identity: {protein['identity']:.0%} "
+                    f"(k-mer sketch similarity: {protein['jaccard']:.0%})",
                 )
                 result_cards.append(card)
             
             return {"display": "block"}, result_cards, False, ""
     
+        elif search_type == "motif":
+            # Scan all sequences in the background; results are polled below
+            job_id = str(uuid4())
+            motif_jobs[job_id] = MotifScanJob(
+                loader.stream_motif_matches(search_term, workers=MOTIF_WORKERS, pool=get_motif_pool())
+            )
+            while len(motif_jobs) > MAX_MOTIF_JOBS:
+                motif_jobs.pop(next(iter(motif_jobs))).cancel()
+            
+            logger.info(f"Started motif scan {job_id}")
+            
+            content = [
+                dcc.Store(id="motif-job-id", data=job_id),
+                dcc.Store(id="motif-cursor", data=0),
+                dcc.Interval(id="motif-poll", interval=500),
+                html.Div(create_motif_results(), id="motif-results"),
+            ]
+            return {"display": "block"}, content, False, ""
+    
     except Exception as e:
         logger.error(f"Error during search: {e}")
         return {"display": "block"}, [], True, f"Error: {str(e)}"
 
 
+# Callback for filtering and sorting search results by protein features
+@callback(
+    Output("faceted-results", "children"),
+    [
+        Input("facet-min-length", "value"),
+        Input("facet-max-length", "value"),
+        Input("facet-min-annotations", "value"),
+        Input("facet-min-degree", "value"),
+        Input("facet-min-score", "value"),
+        Input("facet-sort", "value"),
+        Input("facet-sort-order", "value"),
+    ],
+    State("facet-query", "data"),
+    prevent_initial_call=True,
+)
+@timed("callback")
+def apply_facets(min_length, max_length, min_annotations, min_degree, min_score, sort_by, sort_order, facet_query):
+    """
+    Filter and sort the current search results by precomputed protein features.
+    
+    Args:
+        min_length: Minimum sequence length
+        max_length: Maximum sequence length
+        min_annotations: Minimum number of GO annotations
+        min_degree: Minimum number of interactions
+        min_score: Minimum max. interaction score
+        sort_by: Feature to sort by ("" for search order)
+        sort_order: "asc" or "desc"
+        facet_query: The search the results came from (see with_facets)
+        
+    Returns:
+        The filtered result components
+    """
+    loader = get_loader()
+    
+    if not loader or not facet_query:
+        return dash.no_update
+    
+    protein_ids = facet_protein_ids(loader, facet_query)
+    if not protein_ids:
+        return dash.no_update
+    
+    filters = {
+        "sequence_length": (min_length, max_length),
+        "go_annotations": (min_annotations, None),
+        "interaction_degree": (min_degree, None),
+        "max_interaction_score": (min_score, None),
+    }
+    result = loader.facet_search(
+        protein_ids,
+        filters=filters,
+        sort_by=sort_by or None,
+        descending=sort_order != "asc",
+        limit=20,
+    )
+    
+    components = [html.P(f"{result['total']} of {len(protein_ids)} proteins match the filters", className="text-muted")]
+    for i, protein in enumerate(result["proteins"]):
+        card = create_protein_result_card(
+            i,
+            protein["protein_id"],
+            protein["name"],
+            format_protein_features(protein),
+        )
+        components.append(card)
+    
+    return components
+
+
+# Callback for streaming motif scan results
+@callback(
+    [
+        Output("motif-status", "children"),
+        Output("motif-table", "data"),
+        Output("motif-poll", "disabled"),
+        Output("motif-cursor", "data"),
+    ],
+    Input("motif-poll", "n_intervals"),
+    [
+        State("motif-job-id", "data"),
+        State("motif-cursor", "data"),
+    ],
+    prevent_initial_call=True,
+)
+@timed("callback")
+def poll_motif_scan(n_intervals, job_id, cursor):
+    """
+    Append the matches a running motif scan has found since the last poll.
+    
+    Args:
+        n_intervals: Number of polls so far
+        job_id: The motif scan job ID
+        cursor: Number of matches taken by earlier polls
+        
+    Returns:
+        Tuple of (status, table_rows_patch, polling_disabled, new_cursor)
+    """
+    job = motif_jobs.get(job_id)
+    if job is None:
+        return motif_status(0, 0, True, "Motif scan expired. Please search again."), dash.no_update, True, cursor
+    
+    cursor = cursor or 0
+    new_matches, total, done, error = job.snapshot(since=cursor)
+    # Only the new rows are sent; the browser appends them to the table
+    rows = Patch()
+    rows.extend(motif_table_rows(new_matches[:max(0, MAX_MOTIF_ROWS - cursor)]))
+    if done:
+        logger.info(f"Motif scan {job_id} finished with {total} proteins")
+    return motif_status(total, min(total, MAX_MOTIF_ROWS), done, error), rows, done, total
+
+
+# Callback for GO term page navigation
+@callback(
+    Output("url", "search"),
+    Input("go-term-pagination", "active_page"),
+    State("url", "search"),
+    prevent_initial_call=True,
+)
+@timed("callback")
+def change_go_term_page(active_page, search):
+    """
+    Update the URL query string when a GO term page is selected.
+    
+    Args:
+        active_page: The selected page number
+        search: The current URL query string
+        
+    Returns:
+        The new URL query string
+    """
+    new_search = f"?page={active_page or 1}"
+    if new_search == (search or "?page=1"):
+        return dash.no_update
+    return new_search
+
+
+# Callback for loading an uploaded protein list into the enrichment input
+@callback(
+    Output("enrichment-input", "value"),
+    Input("enrichment-upload", "contents"),
+    prevent_initial_call=True,
+)
+@timed("callback")
+def load_enrichment_upload(contents):
+    """
+    Decode an uploaded text file into the enrichment input box.
+    
+    Args:
+        contents: The uploaded file as a base64 data URL
+        
+    Returns:
+        The file contents as text
+    """
+    if not contents:
+        return dash.no_update
+    
+    _, encoded = contents.split(",", 1)
+    return base64.b64decode(encoded).decode("utf-8", errors="replace")
+
+
+# Callback for GO enrichment analysis
+@callback(
+    Output("enrichment-results", "children"),
+    Input("enrichment-button", "n_clicks"),
+    State("enrichment-input", "value"),
+    prevent_initial_call=True,
+)
+@timed("callback")
+def run_enrichment(n_clicks, identifiers_text):
+    """
+    Run GO enrichment for the entered protein set.
+    
+    Args:
+        n_clicks: Button click count
+        identifiers_text: Identifiers separated by newlines, commas or whitespace
+        
+    Returns:
+        The enrichment results component
+    """
+    loader = get_loader()
+    
+    if not n_clicks or not identifiers_text:
+        return html.P("Enter at least one protein identifier.", className="text-danger")
+    
+    if not loader:
+        return html.P("Error: DataLoader not initialized.", className="text-danger")
+    
+    identifiers = [i for i in re.split(r"[\s,;]+", identifiers_text) if i]
+    logger.info(f"Running GO enrichment for {len(identifiers)} identifiers")
+    
+    try:
+        enrichment = loader.enrich_go_terms(identifiers)
+        logger.info(f"Found {len(enrichment['terms'])} enriched GO terms")
+        return create_enrichment_results(enrichment)
+    except Exception as e:
+        logger.error(f"Error during enrichment: {e}")
+        return html.P(f"Error: {str(e)}", className="text-danger")
+
+
+# Callback for loading an uploaded identifier list into the mapping input
+@callback(
+    Output("resolve-input", "value"),
+    Input("resolve-upload", "contents"),
+    prevent_initial_call=True,
+)
+@timed("callback")
+def load_resolve_upload(contents):
+    """
+    Decode an uploaded text file into the identifier mapping input box.
+    
+    Args:
+        contents: The uploaded file as a base64 data URL
+        
+    Returns:
+        The file contents as text
+    """
+    return load_enrichment_upload(contents)
+
+
+# Callback for bulk identifier mapping
+@callback(
+    Output("resolve-results", "children"),
+    Input("resolve-button", "n_clicks"),
+    State("resolve-input", "value"),
+    prevent_initial_call=True,
+)
+@timed("callback")
+def run_resolve(n_clicks, identifiers_text):
+    """
+    Map the entered identifiers to protein IDs.
+    
+    Args:
+        n_clicks: Button click count
+        identifiers_text: Identifiers separated by newlines, commas or whitespace
+        
+    Returns:
+        The mapping results component
+    """
+    loader = get_loader()
+    
+    if not n_clicks or not identifiers_text:
+        return html.P("Enter at least one identifier.", className="text-danger")
+    
+    if not loader:
+        return html.P("Error: DataLoader not initialized.", className="text-danger")
+    
+    identifiers = [i for i in re.split(r"[\s,;]+", identifiers_text) if i]
+    logger.info(f"Resolving {len(identifiers)} identifiers")
+    
+    try:
+        return create_resolve_results(loader.resolve_identifiers(identifiers))
+    except Exception as e:
+        logger.error(f"Error during identifier mapping: {e}")
+        return html.P(f"Error: {str(e)}", className="text-danger")
+
+
+# Callback for downloading the full identifier mapping
+@callback(
+    Output("resolve-download", "data"),
+    Input("resolve-download-button", "n_clicks"),
+    State("resolve-input", "value"),
+    prevent_initial_call=True,
+)
+@timed("callback")
+def download_resolve(n_clicks, identifiers_text):
+    """
+    Download the mapping of the entered identifiers as CSV.
+    
+    Args:
+        n_clicks: Button click count
+        identifiers_text: Identifiers separated by newlines, commas or whitespace
+        
+    Returns:
+        The CSV download
+    """
+    loader = get_loader()
+    
+    if not n_clicks or not identifiers_text or not loader:
+        return dash.no_update
+    
+    identifiers = [i for i in re.split(r"[\s,;]+", identifiers_text) if i]
+    return dcc.send_string(resolution_to_csv(loader.resolve_identifiers(identifiers)), "identifier_mapping.csv")
+
+
 # Callback for protein button clicks
 @callback(
     [
@@ -210,6 +795,7 @@ def perform_search(n_clicks, search_term, search_type):
     State({"type": "protein-data", "index": dash.ALL}, "data-protein"),
     prevent_initial_call=True,
 )
+@timed("callback")
 def view_protein_details(n_clicks, protein_ids):
     """
     Handle clicks on protein buttons and load protein details.
@@ -221,6 +807,8 @@ def view_protein_details(n_clicks, protein_ids):
     Returns:
         Tuple of (protein_data, new_pathname)
     """
+    loader = get_loader()
+    
     ctx = dash.callback_context
     if not ctx.triggered:
         return dash.no_update, dash.no_update
@@ -230,11 +818,16 @@ def view_protein_details(n_clicks, protein_ids):
     index = int(eval(button_id)["index"])
     protein_id = protein_ids[index]
     
-    logger.info(f"Loading details for protein: {protein_id}")
+    log_hot("Loading details for protein: {}", protein_id, protein_id=protein_id)
+    view_span = current_span()
+    view_span.set("protein_id", protein_id)
     
     try:
         # Get protein details using loader
         protein_details = loader.get_protein_details(protein_id)
+        protein_details["similar_proteins"] = loader.get_similar_proteins(protein_id, k=10)
+        # Lets the rendering request's spans be joined to this one
+        protein_details["trace_id"] = view_span.trace_id
         return protein_details, "/protein"
     except Exception as e:
         logger.error(f"Error loading protein details: {e}")
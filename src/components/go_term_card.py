@@ -73,6 +73,37 @@ def create_go_term_card(go_term_details):
         ]
     )
 
+def create_go_term_result_card(go_term: Dict):
+    """
+    Create a search result card for a GO term.
+    
+    Args:
+        go_term: Dictionary containing GO term information.
+        
+    Returns:
+        A Dash card component linking to the GO term page.
+    """
+    go_id = go_term.get("go_id", "N/A")
+    return dbc.Card(
+        [
+            dbc.CardBody(
+                [
+                    html.H5(go_term.get("name", go_id)),
+                    html.P(f"GO ID: {go_id}"),
+                    html.P(f"Namespace: {go_term.get('namespace', 'N/A')}"),
+                    html.P(f"Annotated proteins: {go_term.get('protein_count', 0)}"),
+                    dbc.Button(
+                        "View Proteins",
+                        href=f"/go/{go_id}",
+                        color="primary",
+                        className="mt-2",
+                    ),
+                ]
+            )
+        ],
+        className="mb-3",
+    )
+
 def create_go_term_proteins_list(proteins: List[Dict]):
     """
     Create a component to display proteins associated with a GO term.
@@ -91,24 +122,35 @@ def create_go_term_proteins_list(proteins: List[Dict]):
         html.Th("Protein UUID"),
         html.Th("Primary Identifier"),
         html.Th("Score"),
+        html.Th("GO Annotations"),
+        html.Th("Interactions"),
         html.Th("Actions"),
     ]))
     
     # Create table rows
     rows = []
-    for protein in proteins:
+    for i, protein in enumerate(proteins):
+        protein_id = protein.get('protein_id')
         row = html.Tr([
             html.Td(protein.get('uuid', 'N/A')),
-            html.Td(protein.get('primary_identifier', 'N/A')),
+            html.Td(protein.get('primary_identifier', protein.get('name', protein_id))),
             html.Td(f"{protein.get('score', 'N/A'):.4f}" if protein.get('score') is not None else 'N/A'),
-            html.Td(
+            html.Td(protein.get('go_annotations', 'N/A')),
+            html.Td(protein.get('interaction_degree', 'N/A')),
+            html.Td([
                 dbc.Button(
                     "View",
-                    id={"type": "view-protein-button", "uuid": protein.get('uuid')},
+                    id={"type": "protein-button", "index": i},
                     color="primary",
                     size="sm",
-                )
-            ),
+                ),
+                # Hidden div to store protein data
+                html.Div(
+                    id={"type": "protein-data", "index": i},
+                    style={"display": "none"},
+                    **{"data-protein": str(protein_id)},
+                ),
+            ]),
         ])
         rows.append(row)
     
@@ -117,4 +159,4 @@ def create_go_term_proteins_list(proteins: List[Dict]):
     # Create table
     table = dbc.Table([header, body], bordered=True, hover=True, responsive=True, striped=True)
     
-    return table 
\ No newline at end of file
+    return table
@@ -26,6 +26,8 @@ def create_navbar():
                     [
                         dbc.NavItem(dbc.NavLink("Home", href="/")),
                         dbc.NavItem(dbc.NavLink("Search", href="/search")),
+                        dbc.NavItem(dbc.NavLink("Enrichment", href="/enrichment")),
+                        dbc.NavItem(dbc.NavLink("ID Mapping", href="/resolve")),
                         dbc.NavItem(dbc.NavLink("About", href="/about")),
                     ],
                     className="ms-auto",
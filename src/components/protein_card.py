@@ -98,6 +98,38 @@ def create_protein_card(protein_details):
         ]
     )
 
+def create_similar_proteins_card(similar_proteins: List[Dict]):
+    """
+    Create a card listing proteins with similar GO annotations.
+    
+    Args:
+        similar_proteins: List of dictionaries from DataLoader.get_similar_proteins
+        
+    Returns:
+        A Dash card component
+    """
+    return dbc.Card(
+        [
+            dbc.CardHeader(html.H5("Proteins with Similar Function")),
+            dbc.CardBody(
+                dash_table.DataTable(
+                    data=similar_proteins,
+                    columns=[
+                        {"name": "Protein ID", "id": "protein_id"},
+                        {"name": "Name", "id": "name"},
+                        {"name": "Jaccard", "id": "jaccard", "type": "numeric", "format": {"specifier": ".3f"}},
+                        {"name": "Estimated", "id": "estimated_jaccard", "type": "numeric", "format": {"specifier": ".3f"}},
+                    ],
+                    style_table={"overflowX": "auto"},
+                    style_cell={"textAlign": "left"},
+                    style_header={"fontWeight": "bold"},
+                    page_size=10,
+                ) if similar_proteins else html.P("No proteins with shared GO annotations found.")
+            ),
+        ],
+        className="mt-3 mb-3",
+    )
+
 def create_protein_detail_card(protein_data: Dict):
     """
     Create a detailed card component for a protein.
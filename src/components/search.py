@@ -2,7 +2,9 @@
 Search components for the Dash application.
 """
 import dash_bootstrap_components as dbc
-from dash import dcc, html
+from dash import dash_table, dcc, html
+
+from src.data.features import FEATURE_LABELS
 
 
 def create_search_form():
@@ -17,7 +19,7 @@ def create_search_form():
             [
                 html.H4("Search", className="card-title"),
                 html.P(
-                    "Search for proteins by identifier or GO terms",
+                    "Search for proteins by identifier or peptide sequence, or for GO terms by ID or keywords",
                     className="card-text",
                 ),
                 dbc.Row(
@@ -26,7 +28,7 @@ def create_search_form():
                             [
                                 dbc.Input(
                                     id="search-input",
-                                    placeholder="Enter protein ID, name, or GO term...",
+                                    placeholder="Enter protein ID, name, GO term ID or GO term keywords...",
                                     type="text",
                                     className="mb-2",
                                 ),
@@ -40,6 +42,10 @@ def create_search_form():
                                     options=[
                                         {"label": "Protein", "value": "protein"},
                                         {"label": "GO Term", "value": "go_term"},
+                                        {"label": "GO Query", "value": "go_query"},
+                                        {"label": "Sequence", "value": "sequence"},
+                                        {"label": "Motif", "value": "motif"},
+                                        {"label": "Similar Sequence", "value": "similar_sequence"},
                                     ],
                                     value="protein",
                                     className="mb-2",
@@ -49,6 +55,39 @@ def create_search_form():
                         ),
                     ]
                 ),
+                dbc.Row(
+                    [
+                        dbc.Col(
+                            dbc.Select(
+                                id="go-query-namespace",
+                                options=[
+                                    {"label": "Any namespace", "value": ""},
+                                    {"label": "Biological Process", "value": "BiologicalProcess"},
+                                    {"label": "Molecular Function", "value": "MolecularFunction"},
+                                    {"label": "Cellular Component", "value": "CellularComponent"},
+                                ],
+                                value="",
+                            ),
+                            width=4,
+                        ),
+                        dbc.Col(
+                            dbc.Input(
+                                id="go-query-min-score",
+                                placeholder="Min. annotation score",
+                                type="number",
+                                min=0,
+                                max=1,
+                                step=0.05,
+                            ),
+                            width=4,
+                        ),
+                        dbc.Col(
+                            dbc.FormText("GO Query filters, e.g. GO:0005634 AND NOT GO:0005737"),
+                            width=4,
+                        ),
+                    ],
+                    className="mb-2",
+                ),
                 dbc.Button(
                     "Search",
                     id="search-button",
@@ -94,4 +133,230 @@ def create_search_results():
         id="search-results-card",
         className="mb-4",
         style={"display": "none"},
-    ) 
\ No newline at end of file
+    ) 
+
+
+def create_export_links(href):
+    """
+    Create CSV and Parquet download links for an export endpoint.
+    
+    Args:
+        href: Export URL, without the format parameter
+        
+    Returns:
+        A Dash component with the download links
+    """
+    separator = "&" if "?" in href else "?"
+    return html.Div(
+        [
+            html.Span("Export: ", className="text-muted"),
+            html.A("CSV", href=f"{href}{separator}format=csv", className="me-2"),
+            html.A("Parquet", href=f"{href}{separator}format=parquet"),
+        ],
+        className="mb-3",
+    )
+
+
+def create_protein_result_card(index, protein_id, name, detail):
+    """
+    Create a search result card for a protein.
+    
+    Args:
+        index: Position of the card in the results, used for the button ID
+        protein_id: The protein ID
+        name: The protein name
+        detail: An extra line of information (e.g. UUID or score)
+        
+    Returns:
+        A Dash card component with a "View Details" button
+    """
+    return dbc.Card(
+        [
+            dbc.CardBody(
+                [
+                    html.H5(name),
+                    html.P(f"ID: {protein_id}"),
+                    html.P(detail),
+                    dbc.Button(
+                        "View Details",
+                        id={"type": "protein-button", "index": index},
+                        color="primary",
+                        className="mt-2",
+                    ),
+                    # Hidden div to store protein data
+                    html.Div(
+                        id={"type": "protein-data", "index": index},
+                        style={"display": "none"},
+                        **{"data-protein": str(protein_id)},
+                    ),
+                ]
+            )
+        ],
+        className="mb-3",
+    )
+
+
+def create_motif_results():
+    """
+    Create the motif scan status line and an empty match table, filled in by polling.
+    
+    Returns:
+        A Dash component with the scan status and matches
+    """
+    return html.Div(
+        [
+            html.P("Scanning sequences...", id="motif-status", className="text-muted"),
+            dash_table.DataTable(
+                id="motif-table",
+                data=[],
+                columns=[
+                    {"name": "Protein ID", "id": "protein_id"},
+                    {"name": "Name", "id": "name"},
+                    {"name": "Positions", "id": "positions"},
+                    {"name": "First Match", "id": "match"},
+                ],
+                style_table={"overflowX": "auto"},
+                style_cell={"textAlign": "left"},
+                style_header={"fontWeight": "bold"},
+                page_size=20,
+            ),
+        ]
+    )
+
+
+def motif_table_rows(matches):
+    """
+    Convert motif scan matches to rows of the match table.
+    
+    Args:
+        matches: Match dictionaries from DataLoader.stream_motif_matches
+        
+    Returns:
+        A list of table rows
+    """
+    return [
+        {
+            "protein_id": match["protein_id"],
+            "name": match["name"],
+            "positions": ", ".join(str(m["start"]) for m in match["matches"][:10]),
+            "match": match["matches"][0]["match"],
+        }
+        for match in matches
+    ]
+
+
+def motif_status(total, shown, done, error=None):
+    """
+    Create the motif scan status line.
+    
+    Args:
+        total: Number of proteins matched so far
+        shown: Number of them in the table
+        done: Whether the scan has finished
+        error: Error message if the scan failed
+        
+    Returns:
+        The status component
+    """
+    if error:
+        return html.Span(f"Error: {error}", className="text-danger")
+    
+    status = (
+        f"Scan complete: {total} proteins matched."
+        if done
+        else f"Scanning sequences... {total} proteins matched so far."
+    )
+    if shown < total:
+        status += f" Showing the first {shown}."
+    return status
+
+
+def create_facet_controls():
+    """
+    Create filter and sort controls for search results.
+    
+    Returns:
+        A Dash component with feature range inputs and sort options
+    """
+    def number_input(component_id, placeholder, step=1):
+        return dbc.Input(id=component_id, placeholder=placeholder, type="number", min=0, step=step, size="sm")
+    
+    return dbc.Card(
+        dbc.CardBody(
+            [
+                dbc.Row(
+                    [
+                        dbc.Col(number_input("facet-min-length", "Min. length"), width=2),
+                        dbc.Col(number_input("facet-max-length", "Max. length"), width=2),
+                        dbc.Col(number_input("facet-min-annotations", "Min. GO annotations"), width=2),
+                        dbc.Col(number_input("facet-min-degree", "Min. interactions"), width=2),
+                        dbc.Col(number_input("facet-min-score", "Min. interaction score", step="any"), width=2),
+                    ],
+                    className="mb-2",
+                ),
+                dbc.Row(
+                    [
+                        dbc.Col(
+                            dbc.Select(
+                                id="facet-sort",
+                                options=[{"label": "Sort: relevance", "value": ""}]
+                                + [{"label": f"Sort: {label}", "value": name} for name, label in FEATURE_LABELS.items()],
+                                value="",
+                                size="sm",
+                            ),
+                            width=4,
+                        ),
+                        dbc.Col(
+                            dbc.Select(
+                                id="facet-sort-order",
+                                options=[
+                                    {"label": "Descending", "value": "desc"},
+                                    {"label": "Ascending", "value": "asc"},
+                                ],
+                                value="desc",
+                                size="sm",
+                            ),
+                            width=2,
+                        ),
+                    ]
+                ),
+            ]
+        ),
+        className="mb-3",
+    )
+
+
+def format_protein_features(protein):
+    """
+    Summarize a protein's precomputed features in one line.
+    
+    Args:
+        protein: Protein dictionary from DataLoader.facet_search
+        
+    Returns:
+        A short description string
+    """
+    score = protein.get("max_interaction_score")
+    return (
+        f"Length: {protein['sequence_length']} | "
+        f"GO annotations: {protein['go_annotations']} | "
+        f"Interactions: {protein['interaction_degree']}"
+        + (f" (max. score {score:g})" if score is not None else "")
+    )
+
+
+def format_protein_summary(protein):
+    """
+    Summarize a protein's UUID, annotation and interaction counts in one line.
+    
+    Args:
+        protein: Protein summary dictionary from DataLoader.get_protein_summaries
+        
+    Returns:
+        A short description string
+    """
+    return (
+        f"UUID: {protein.get('uuid') or 'N/A'} | "
+        f"GO annotations: {protein['go_annotations']} | "
+        f"Interactions: {protein['interaction_degree']}"
+    )
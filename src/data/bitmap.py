@@ -0,0 +1,224 @@
+"""
+Compressed protein bitmaps and a boolean query engine over GO terms.
+"""
+import re
+from typing import Callable, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from src.data.go_index import GoTermPostings
+
+QUERY_TOKEN_PATTERN = re.compile(r"\(|\)|[^\s()]+")
+
+
+class ProteinBitmap:
+    """
+    A set of protein row ids stored as packed 64-bit words.
+    """
+
+    def __init__(self, words: np.ndarray, size: int):
+        self.words = words
+        self.size = size
+
+    @classmethod
+    def from_rows(cls, rows: np.ndarray, size: int) -> "ProteinBitmap":
+        """
+        Create a bitmap from protein row ids.
+
+        Args:
+            rows: Protein row ids.
+            size: Number of proteins in the universe.
+
+        Returns:
+            A ProteinBitmap.
+        """
+        words = np.zeros((size + 63) // 64, dtype=np.uint64)
+        rows = np.asarray(rows, dtype=np.uint64)
+        np.bitwise_or.at(words, rows >> np.uint64(6), np.uint64(1) << (rows & np.uint64(63)))
+        return cls(words, size)
+
+    def __and__(self, other: "ProteinBitmap") -> "ProteinBitmap":
+        return ProteinBitmap(self.words & other.words, self.size)
+
+    def __or__(self, other: "ProteinBitmap") -> "ProteinBitmap":
+        return ProteinBitmap(self.words | other.words, self.size)
+
+    def __invert__(self) -> "ProteinBitmap":
+        words = ~self.words
+        # Clear the padding bits past the last protein
+        if self.size % 64:
+            words[-1] &= np.uint64((1 << (self.size % 64)) - 1)
+        return ProteinBitmap(words, self.size)
+
+    def __len__(self) -> int:
+        return int(np.unpackbits(self.words.view(np.uint8)).sum())
+
+    def rows(self) -> np.ndarray:
+        """
+        Get the protein row ids in the bitmap.
+
+        Returns:
+            A sorted array of protein row ids.
+        """
+        bits = np.unpackbits(self.words.view(np.uint8), bitorder="little")
+        return np.flatnonzero(bits[:self.size])
+
+
+class GoTermBitmaps:
+    """
+    GO term -> protein sets, stored roaring-style.
+
+    Terms annotating few proteins keep a sorted array of protein row ids,
+    broad terms keep a packed bitmap, whichever is smaller. Both are turned
+    into word bitmaps for evaluation, so AND/OR/NOT are word-wise operations.
+    """
+
+    # A uint32 array beats a bitmap below size / 32 proteins
+    ARRAY_LIMIT_RATIO = 32
+
+    def __init__(
+        self,
+        postings: GoTermPostings,
+        protein_lookup: pd.Index,
+        edges: pd.DataFrame,
+        functional_types: List[str],
+    ):
+        """
+        Build the bitmaps.
+
+        Args:
+            postings: Score-sorted GO term posting lists.
+            protein_lookup: Index mapping protein IDs to protein row ids.
+            edges: The edges DataFrame.
+            functional_types: Relationship types that count as functional annotations.
+        """
+        self.size = len(protein_lookup)
+        self.postings = postings
+        self.posting_rows = protein_lookup.get_indexer(postings.protein_ids).astype(np.int64)
+
+        array_limit = max(1, self.size // self.ARRAY_LIMIT_RATIO)
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._bitmaps: Dict[str, ProteinBitmap] = {}
+        for term, start, end in postings.iter_ranges():
+            rows = np.unique(self.posting_rows[start:end])
+            rows = rows[rows >= 0]
+            if len(rows) < array_limit:
+                self._arrays[term] = rows.astype(np.uint32)
+            else:
+                self._bitmaps[term] = ProteinBitmap.from_rows(rows, self.size)
+
+        # Proteins with at least one annotation in each namespace
+        self.namespaces: Dict[str, ProteinBitmap] = {}
+        for relationship in functional_types:
+            sources = edges.loc[edges['relationship'] == relationship, 'source']
+            rows = protein_lookup.get_indexer(sources.unique())
+            self.namespaces[relationship.split('-')[0]] = ProteinBitmap.from_rows(rows[rows >= 0], self.size)
+
+    def term(self, go_term_id: str, min_score: Optional[float] = None) -> ProteinBitmap:
+        """
+        Get the proteins annotated with a GO term.
+
+        Args:
+            go_term_id: The internal GO term ID.
+            min_score: Only include annotations with at least this ML_prediction_score.
+
+        Returns:
+            A ProteinBitmap.
+        """
+        if min_score is not None:
+            # Posting lists are sorted by descending score, so this is a prefix
+            start, end = self.postings.term_range(go_term_id)
+            cut = start + int(np.searchsorted(-self.postings.scores[start:end], -min_score, side="right"))
+            rows = self.posting_rows[start:cut]
+            return ProteinBitmap.from_rows(rows[rows >= 0], self.size)
+
+        if go_term_id in self._bitmaps:
+            return self._bitmaps[go_term_id]
+        return ProteinBitmap.from_rows(self._arrays.get(go_term_id, []), self.size)
+
+    def evaluate(
+        self, tree: Union[str, tuple], resolve: Callable[[str], str], min_score: Optional[float] = None
+    ) -> ProteinBitmap:
+        """
+        Evaluate a parsed GO query.
+
+        Args:
+            tree: A query tree from parse_go_query.
+            resolve: Maps a GO identifier from the query to an internal GO term ID.
+            min_score: Only count annotations with at least this ML_prediction_score.
+
+        Returns:
+            A ProteinBitmap of matching proteins.
+        """
+        if isinstance(tree, str):
+            return self.term(resolve(tree), min_score)
+        if tree[0] == "not":
+            return ~self.evaluate(tree[1], resolve, min_score)
+
+        left = self.evaluate(tree[1], resolve, min_score)
+        right = self.evaluate(tree[2], resolve, min_score)
+        return left & right if tree[0] == "and" else left | right
+
+
+def parse_go_query(expression: str) -> Union[str, tuple]:
+    """
+    Parse a boolean GO query into a nested tuple tree.
+
+    Supports AND, OR, NOT and parentheses (case-insensitive), with NOT binding
+    tighter than AND and AND tighter than OR. Adjacent terms are ANDed.
+
+    Args:
+        expression: The query (e.g. "GO:0005634 AND (GO:0016301 OR GO:0004672) NOT GO:0005737").
+
+    Returns:
+        A GO identifier, or a tuple of ("and" | "or", left, right) or ("not", operand).
+
+    Raises:
+        ValueError: If the expression is malformed.
+    """
+    tokens = QUERY_TOKEN_PATTERN.findall(expression or "")
+    position = 0
+
+    def peek():
+        return tokens[position].upper() if position < len(tokens) else None
+
+    def advance():
+        nonlocal position
+        position += 1
+        return tokens[position - 1]
+
+    def parse_or():
+        node = parse_and()
+        while peek() == "OR":
+            advance()
+            node = ("or", node, parse_and())
+        return node
+
+    def parse_and():
+        node = parse_not()
+        while peek() not in (None, "OR", ")"):
+            if peek() == "AND":
+                advance()
+            node = ("and", node, parse_not())
+        return node
+
+    def parse_not():
+        if peek() == "NOT":
+            advance()
+            return ("not", parse_not())
+        if peek() == "(":
+            advance()
+            node = parse_or()
+            if peek() != ")":
+                raise ValueError("Missing closing parenthesis in GO query")
+            advance()
+            return node
+        if peek() in (None, "AND", "OR", ")"):
+            raise ValueError(f"Expected a GO term in query: {expression}")
+        return advance()
+
+    tree = parse_or()
+    if position != len(tokens):
+        raise ValueError(f"Unexpected '{tokens[position]}' in GO query")
+    return tree
@@ -0,0 +1,139 @@
+"""
+Incremental dataset deltas: additions and tombstones applied on top of the base parquet files.
+
+A delta is a directory under data/deltas/, applied in name order (e.g. one
+per day: deltas/2024-06-01/). Every file is optional:
+
+- protein_nodes.parquet, protein_id_records.parquet, edges.parquet: rows to
+  add, with the same schema as the base files. A protein node or ID record
+  for an existing protein replaces that protein's node or records.
+- removed_proteins.parquet: column id; the proteins and all their edges are removed.
+- removed_edges.parquet: columns source, target, relationship.
+"""
+import argparse
+from pathlib import Path
+from typing import List, Optional
+
+import duckdb
+import pandas as pd
+
+from src.data.version import dataset_modified, dataset_version
+
+DELTA_DIR = "deltas"
+REMOVED_PROTEINS_FILE = "removed_proteins.parquet"
+REMOVED_EDGES_FILE = "removed_edges.parquet"
+DELTA_FILES = [
+    "protein_nodes.parquet",
+    "protein_id_records.parquet",
+    "edges.parquet",
+    REMOVED_PROTEINS_FILE,
+    REMOVED_EDGES_FILE,
+]
+
+# Columns identifying an edge for tombstones
+EDGE_KEY = ['source', 'target', 'relationship']
+
+
+class Delta:
+    """
+    The contents of one delta directory.
+    """
+
+    def __init__(self, path: Path, con: Optional[duckdb.DuckDBPyConnection] = None):
+        """
+        Read a delta directory.
+
+        Args:
+            path: The delta directory.
+            con: DuckDB connection to read with (a new in-memory one if None).
+
+        Raises:
+            ValueError: If a tombstone file lacks its key columns.
+        """
+        self.path = Path(path)
+        self.name = self.path.name
+        con = con or duckdb.connect(':memory:')
+
+        def read(name: str) -> Optional[pd.DataFrame]:
+            file = self.path / name
+            return con.execute(f"SELECT * FROM '{file}'").df() if file.exists() else None
+
+        self.protein_nodes = read("protein_nodes.parquet")
+        self.protein_ids = read("protein_id_records.parquet")
+        self.edges = read("edges.parquet")
+
+        removed_proteins = read(REMOVED_PROTEINS_FILE)
+        if removed_proteins is not None and 'id' not in removed_proteins.columns:
+            raise ValueError(f"{REMOVED_PROTEINS_FILE} in {self.name} needs an id column")
+        self.removed_proteins = set() if removed_proteins is None else set(removed_proteins['id'].dropna())
+
+        self.removed_edges = read(REMOVED_EDGES_FILE)
+        if self.removed_edges is not None and not set(EDGE_KEY) <= set(self.removed_edges.columns):
+            raise ValueError(f"{REMOVED_EDGES_FILE} in {self.name} needs columns {', '.join(EDGE_KEY)}")
+
+        self.version = dataset_version(self.path, DELTA_FILES)
+        self.modified = dataset_modified(self.path, DELTA_FILES)
+
+
+def list_deltas(data_path: Path) -> List[Path]:
+    """
+    Find the delta directories of a dataset.
+
+    Args:
+        data_path: Directory containing the base parquet files.
+
+    Returns:
+        Delta directories in application order; names starting with "." are skipped.
+    """
+    delta_dir = Path(data_path) / DELTA_DIR
+    if not delta_dir.is_dir():
+        return []
+    return sorted(p for p in delta_dir.iterdir() if p.is_dir() and not p.name.startswith('.'))
+
+
+def write_delta(
+    path: Path,
+    protein_nodes: Optional[pd.DataFrame] = None,
+    protein_ids: Optional[pd.DataFrame] = None,
+    edges: Optional[pd.DataFrame] = None,
+    removed_proteins: Optional[List[str]] = None,
+    removed_edges: Optional[pd.DataFrame] = None,
+):
+    """
+    Write a delta directory.
+
+    Args:
+        path: The delta directory to create.
+        protein_nodes: Protein nodes to add or replace.
+        protein_ids: Protein ID records to add or replace.
+        edges: Edges to add.
+        removed_proteins: IDs of proteins to remove.
+        removed_edges: Edges to remove (source, target, relationship).
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    frames = {
+        "protein_nodes.parquet": protein_nodes,
+        "protein_id_records.parquet": protein_ids,
+        "edges.parquet": edges,
+        REMOVED_PROTEINS_FILE: None if removed_proteins is None else pd.DataFrame({'id': list(removed_proteins)}),
+        REMOVED_EDGES_FILE: None if removed_edges is None else removed_edges[EDGE_KEY],
+    }
+    for name, frame in frames.items():
+        if frame is not None:
+            frame.to_parquet(path / name, index=False)
+
+
+if __name__ == "__main__":
+    from src.data.loader import DataLoader
+
+    parser = argparse.ArgumentParser(description="Fold dataset deltas into the base parquet files")
+    parser.add_argument("--data-path", type=str, default="data", help="Directory containing the parquet files")
+    args = parser.parse_args()
+
+    loader = DataLoader(data_path=args.data_path)
+    if loader.applied_deltas:
+        loader.compact()
+        print(f"Compacted {len(loader.applied_deltas)} deltas into {args.data_path}")
+    else:
+        print("No deltas to compact.")
@@ -0,0 +1,200 @@
+"""
+Precomputed per-protein feature columns for faceted filtering and sorting.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# Feature column -> label, in display order
+FEATURE_LABELS = {
+    'sequence_length': "Sequence length",
+    'go_annotations': "GO annotations",
+    'biological_process_annotations': "Biological Process annotations",
+    'molecular_function_annotations': "Molecular Function annotations",
+    'cellular_component_annotations': "Cellular Component annotations",
+    'interaction_degree': "Interaction degree",
+    'max_interaction_score': "Max. interaction score",
+}
+
+NAMESPACE_COLUMNS = {
+    'BiologicalProcess': 'biological_process_annotations',
+    'MolecularFunction': 'molecular_function_annotations',
+    'CellularComponent': 'cellular_component_annotations',
+}
+
+# A filter is an exact value, or an inclusive (min, max) range with None for an open end
+FeatureFilter = Union[float, Tuple[Optional[float], Optional[float]]]
+
+
+class ProteinFeatures:
+    """
+    Columnar table of protein features, one NumPy array per feature aligned to protein row ids.
+
+    Counts follow get_protein_details: annotations count functional
+    annotation edges to known GO terms, and the interaction degree counts
+    interaction edges in either direction. Proteins without a sequence have
+    length 0, and proteins without scored interactions a NaN max score.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        """
+        Create the table from precomputed columns.
+
+        Args:
+            columns: Feature column -> array over protein row ids (see FEATURE_LABELS).
+        """
+        self.columns = {name: np.asarray(columns[name]) for name in FEATURE_LABELS}
+        self.size = len(self.columns['sequence_length'])
+
+    @classmethod
+    def from_edges(
+        cls,
+        protein_index: pd.Index,
+        sequences: Sequence[Optional[str]],
+        edges: pd.DataFrame,
+        go_term_ids: pd.Index,
+        functional_types: List[str],
+        interaction_type: str,
+    ) -> "ProteinFeatures":
+        """
+        Compute the feature columns from the raw data.
+
+        Args:
+            protein_index: Protein IDs by row id.
+            sequences: Sequence for every protein row id (None if missing).
+            edges: The edges DataFrame.
+            go_term_ids: Internal IDs of the known GO terms.
+            functional_types: Relationship types of functional annotation edges.
+            interaction_type: Relationship type of protein-protein interaction edges.
+
+        Returns:
+            A ProteinFeatures table.
+        """
+        n = len(protein_index)
+        columns: Dict[str, np.ndarray] = {}
+
+        columns['sequence_length'] = np.array(
+            [len(s) if isinstance(s, str) else 0 for s in sequences], dtype=np.int64
+        )
+
+        annotations = edges[edges['relationship'].isin(functional_types) & edges['target'].isin(go_term_ids)]
+        rows = protein_index.get_indexer(annotations['source'])
+        known = rows >= 0
+        namespaces = annotations['relationship'].str.split('-').str[0].to_numpy()
+        columns['go_annotations'] = np.bincount(rows[known], minlength=n)
+        for namespace, column in NAMESPACE_COLUMNS.items():
+            in_namespace = known & (namespaces == namespace)
+            columns[column] = np.bincount(rows[in_namespace], minlength=n)
+
+        interactions = edges[edges['relationship'] == interaction_type]
+        ends = np.concatenate([
+            protein_index.get_indexer(interactions['source']),
+            protein_index.get_indexer(interactions['target']),
+        ])
+        if 'string_combined_score' in interactions.columns:
+            scores = pd.to_numeric(interactions['string_combined_score'], errors='coerce').to_numpy(dtype=np.float64)
+        else:
+            scores = np.full(len(interactions), np.nan)
+        scores = np.concatenate([scores, scores])
+        known = ends >= 0
+        columns['interaction_degree'] = np.bincount(ends[known], minlength=n)
+
+        max_score = np.full(n, -np.inf)
+        scored = known & ~np.isnan(scores)
+        np.maximum.at(max_score, ends[scored], scores[scored])
+        max_score[np.isneginf(max_score)] = np.nan
+        columns['max_interaction_score'] = max_score
+
+        return cls(columns)
+
+    def mask(self, filters: Dict[str, FeatureFilter], rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Evaluate feature filters.
+
+        Args:
+            filters: Feature column -> exact value or (min, max) range.
+            rows: Protein row ids to restrict to (None for all proteins).
+
+        Returns:
+            A boolean mask over protein row ids.
+
+        Raises:
+            ValueError: If a filter names an unknown feature.
+        """
+        if rows is None:
+            mask = np.ones(self.size, dtype=bool)
+        else:
+            mask = np.zeros(self.size, dtype=bool)
+            mask[rows] = True
+
+        for name, condition in filters.items():
+            if name not in self.columns:
+                raise ValueError(f"Unknown feature: {name}")
+            values = self.columns[name]
+            if isinstance(condition, (tuple, list)):
+                low, high = condition
+                if low is not None:
+                    mask &= values >= low
+                if high is not None:
+                    mask &= values <= high
+            elif condition is not None:
+                mask &= values == condition
+        return mask
+
+    def query(
+        self,
+        filters: Optional[Dict[str, FeatureFilter]] = None,
+        rows: Optional[np.ndarray] = None,
+        sort_by: Optional[str] = None,
+        descending: bool = True,
+    ) -> np.ndarray:
+        """
+        Filter and sort proteins by their features.
+
+        Args:
+            filters: Feature column -> exact value or (min, max) range.
+            rows: Protein row ids to restrict to, in their original order
+                (None for all proteins).
+            sort_by: Feature column to sort by (None keeps the input order).
+            descending: Whether to sort from the highest value.
+
+        Returns:
+            Array of matching protein row ids; missing values sort last.
+
+        Raises:
+            ValueError: If a filter or the sort names an unknown feature.
+        """
+        mask = self.mask(filters or {}, rows)
+        if rows is None:
+            result = np.flatnonzero(mask)
+        else:
+            rows = np.asarray(rows, dtype=np.int64)
+            result = rows[mask[rows]]
+
+        if sort_by is not None:
+            if sort_by not in self.columns:
+                raise ValueError(f"Unknown feature: {sort_by}")
+            values = self.columns[sort_by][result].astype(np.float64)
+            keys = -values if descending else values
+            result = result[np.lexsort((keys, np.isnan(values)))]
+        return result
+
+    def row(self, row: int) -> Dict:
+        """
+        Get the features of one protein.
+
+        Args:
+            row: Protein row id.
+
+        Returns:
+            Dictionary of feature column -> value (None when missing).
+        """
+        features = {}
+        for name, values in self.columns.items():
+            value = values[row]
+            if np.issubdtype(values.dtype, np.integer):
+                features[name] = int(value)
+            else:
+                features[name] = None if np.isnan(value) else float(value)
+        return features
@@ -0,0 +1,101 @@
+"""
+GO term posting lists for the protein information application.
+"""
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class GoTermPostings:
+    """
+    Precomputed GO term -> proteins posting lists.
+
+    All functional annotation edges are sorted once by (GO term, descending
+    ML_prediction_score) into flat arrays, so the proteins for a term are a
+    contiguous slice and any page of results is read without touching edges.
+    """
+
+    def __init__(self, edges: pd.DataFrame, functional_types: List[str]):
+        """
+        Build the posting lists.
+
+        Args:
+            edges: The edges DataFrame.
+            functional_types: Relationship types that count as functional annotations.
+        """
+        annotations = edges[edges['relationship'].isin(functional_types)]
+
+        codes, terms = pd.factorize(annotations['target'])
+        scores = annotations['ML_prediction_score'].to_numpy(dtype=float)
+
+        # Missing scores sort after every scored protein
+        sort_scores = np.where(np.isnan(scores), -np.inf, scores)
+        order = np.lexsort((-sort_scores, codes))
+
+        self.terms = terms
+        self.term_codes = codes[order]
+        self.protein_ids = annotations['source'].to_numpy()[order]
+        self.scores = scores[order]
+
+        counts = np.bincount(codes, minlength=len(terms))
+        ends = np.cumsum(counts)
+        starts = ends - counts
+        self._ranges: Dict[str, Tuple[int, int]] = {
+            term: (int(start), int(end)) for term, start, end in zip(terms, starts, ends)
+        }
+
+    def __contains__(self, go_term_id: str) -> bool:
+        return go_term_id in self._ranges
+
+    def count(self, go_term_id: str) -> int:
+        """
+        Get the number of proteins annotated with a GO term.
+
+        Args:
+            go_term_id: The internal GO term ID.
+
+        Returns:
+            The number of annotated proteins.
+        """
+        start, end = self.term_range(go_term_id)
+        return end - start
+
+    def term_range(self, go_term_id: str) -> Tuple[int, int]:
+        """
+        Get the slice of the flat arrays holding a GO term's posting list.
+
+        Args:
+            go_term_id: The internal GO term ID.
+
+        Returns:
+            Tuple of (start, end) positions; (0, 0) for an unknown term.
+        """
+        return self._ranges.get(go_term_id, (0, 0))
+
+    def iter_ranges(self) -> Iterator[Tuple[str, int, int]]:
+        """
+        Iterate over the posting lists of all GO terms.
+
+        Yields:
+            Tuples of (go_term_id, start, end).
+        """
+        for go_term_id, (start, end) in self._ranges.items():
+            yield go_term_id, start, end
+
+    def page(self, go_term_id: str, offset: int = 0, limit: int = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get a page of a GO term's posting list, highest scores first.
+
+        Args:
+            go_term_id: The internal GO term ID.
+            offset: Number of proteins to skip.
+            limit: Maximum number of proteins to return (None for all).
+
+        Returns:
+            Tuple of (protein_ids, scores) arrays for the requested page.
+        """
+        start, end = self.term_range(go_term_id)
+        begin = min(start + max(offset, 0), end)
+        stop = end if limit is None else min(begin + max(limit, 0), end)
+        return self.protein_ids[begin:stop], self.scores[begin:stop]
@@ -0,0 +1,70 @@
+"""
+Bulk identifier resolution against a flattened identifier index.
+"""
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+class IdentifierResolver:
+    """
+    Identifier -> protein ID index stored CSR-style for vectorized lookups.
+
+    Identifiers live in a hashed pandas Index; the protein IDs of identifier i
+    are targets[offsets[i]:offsets[i + 1]]. Resolving a batch is one
+    get_indexer call plus array arithmetic, with no per-identifier fallback.
+    """
+
+    def __init__(self, identifier_to_ids: Dict[str, List[str]]):
+        """
+        Build the index.
+
+        Args:
+            identifier_to_ids: Identifier -> protein IDs it refers to.
+        """
+        identifiers = [identifier for identifier, ids in identifier_to_ids.items() if ids]
+        counts = np.fromiter((len(identifier_to_ids[i]) for i in identifiers), dtype=np.int64, count=len(identifiers))
+
+        self.identifiers = pd.Index(identifiers, dtype=object)
+        self.offsets = np.concatenate([[0], np.cumsum(counts)])
+        self.targets = np.array(
+            [protein_id for identifier in identifiers for protein_id in identifier_to_ids[identifier]], dtype=object
+        )
+
+    def resolve(self, identifiers: List[str]) -> Dict[str, List]:
+        """
+        Map a batch of identifiers to protein IDs.
+
+        Args:
+            identifiers: Identifiers to resolve; surrounding whitespace is ignored.
+
+        Returns:
+            A dictionary with 'resolved' (dicts of identifier and protein_id for
+            identifiers with exactly one protein), 'ambiguous' (dicts of
+            identifier and protein_ids for identifiers with several) and
+            'unresolved' (identifiers with no match), each in input order.
+        """
+        queries = pd.Index(identifiers, dtype=object).str.strip()
+        positions = self.identifiers.get_indexer(queries)
+        found = positions >= 0
+        counts = np.zeros(len(positions), dtype=np.int64)
+        counts[found] = self.offsets[positions[found] + 1] - self.offsets[positions[found]]
+
+        exact = np.flatnonzero(counts == 1)
+        exact_ids = self.targets[self.offsets[positions[exact]]]
+        resolved = [
+            {'identifier': identifiers[i], 'protein_id': protein_id}
+            for i, protein_id in zip(exact.tolist(), exact_ids.tolist())
+        ]
+
+        ambiguous = [
+            {
+                'identifier': identifiers[i],
+                'protein_ids': self.targets[self.offsets[positions[i]]:self.offsets[positions[i] + 1]].tolist(),
+            }
+            for i in np.flatnonzero(counts > 1).tolist()
+        ]
+
+        unresolved = [identifiers[i] for i in np.flatnonzero(~found).tolist()]
+        return {'resolved': resolved, 'ambiguous': ambiguous, 'unresolved': unresolved}
@@ -1,8 +1,38 @@
+import copy
+import numpy as np
 import pandas as pd
 import duckdb
 import os
+import re
+import shutil
+import time
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Tuple
+from typing import Dict, Iterator, List, Optional, Union, Tuple
+
+from src.data.bitmap import GoTermBitmaps, parse_go_query
+from src.data.delta import DELTA_DIR, EDGE_KEY, Delta, list_deltas
+from src.data.enrichment import GoEnrichment
+from src.data.features import ProteinFeatures
+from src.data.go_index import GoTermPostings
+from src.data.identifiers import IdentifierResolver
+from src.data.memory import extrapolate, memory_report
+from src.data.motif import iter_motif_matches
+from src.data.sequence_index import INVALID_CODE, KmerIndex, encode_sequence
+from src.data.sequence_sketch import SKETCH_FILE, SequenceSketchIndex, align_candidates
+from src.data.similarity import SIGNATURE_FILE, MinHashIndex
+from src.data.summary import (
+    SUMMARY_FILE,
+    build_protein_summary,
+    load_protein_summary,
+    save_protein_summary,
+    summary_features,
+)
+from src.data.text_index import GoTermTextIndex
+from src.data.version import chain_version, dataset_modified, dataset_version
+from src.utils.metrics import metrics, timed
+from src.utils.timing import PhaseRecorder
+from src.utils.tracing import current_span, span
 
 class DataLoader:
     """
@@ -10,14 +40,21 @@ class DataLoader:
     Handles loading and querying of the parquet files.
     """
     
-    def __init__(self, data_path: str = "data"):
+    def __init__(self, data_path: str = "data", index_workers: Optional[int] = 0, offline_indexes: bool = True):
         """
         Initialize the data loader.
         
         Args:
             data_path: Path to the directory containing the parquet files.
+            index_workers: Worker processes for building the offline indexes when
+                their files are missing or stale, and after deltas (None for all
+                cores, 0 to only load them from disk).
+            offline_indexes: Whether to load the offline indexes at all; the
+                command line builders turn this off.
         """
         self.data_path = Path(data_path)
+        self.index_workers = index_workers
+        self.offline_indexes = offline_indexes
         self.duckdb_con = duckdb.connect(':memory:')
         self.protein_nodes = None
         self.go_terms = None
@@ -29,6 +66,24 @@ class DataLoader:
         self.uuid_to_ids = {}    # Map UUIDs to protein IDs
         self.identifier_to_ids = {}  # Map all identifiers to protein IDs
         self.name_to_ids = {}    # Map protein names to protein IDs
+        self.identifier_resolver = None  # Vectorized bulk identifier lookups
+        self.id_to_uuid = {}     # Map protein IDs back to their UUID
+        self.go_id_to_term = {}  # Map GO identifiers (GO:...) to GO term rows
+        self.go_term_id_to_term = {}  # Map internal GO term IDs to GO term rows
+        self.protein_index = None  # Protein IDs by row id, for array-backed indexes
+        self.go_postings = None  # GO term -> score-sorted proteins
+        self.go_text_index = None  # Full-text index over GO term names/definitions
+        self.go_bitmaps = None   # GO term -> protein bitmaps for boolean queries
+        self.go_enrichment = None  # Protein x GO term incidence for enrichment analysis
+        self.similarity_index = None  # MinHash/LSH index over GO term sets
+        self.kmer_index = None   # Amino-acid k-mer -> proteins for sequence search
+        self.sequence_sketches = None  # k-mer MinHash sketches for sequence similarity
+        self.protein_features = None  # Per-protein feature columns for faceted search
+        self.protein_summary = None  # Materialized per-protein summary, aligned to row ids
+        self.dataset_version = None  # Content hash of the data files
+        self.dataset_modified = None  # Latest modification time of the data files
+        self.applied_deltas = []  # Names of the deltas applied on top of the base files
+        self.load_phases = PhaseRecorder("DataLoader.load_data")  # Timing and memory per load phase
         
         # Constants for the data model
         self.FUNCTIONAL_ANNOTATION_TYPES = [
@@ -43,35 +98,145 @@ class DataLoader:
         
     def load_data(self):
         """Load all parquet files and create necessary indexes."""
+        self.load_phases = PhaseRecorder("DataLoader.load_data")
+        phases = self.load_phases
+        
         # Load the data using DuckDB
         print("Loading protein_nodes.parquet...")
-        self.protein_nodes = self.duckdb_con.execute(
-            f"SELECT * FROM '{self.data_path}/protein_nodes.parquet'"
-        ).df()
+        with phases.phase("read_protein_nodes") as phase:
+            self.protein_nodes = self.duckdb_con.execute(
+                f"SELECT * FROM '{self.data_path}/protein_nodes.parquet'"
+            ).df()
+            phase['rows'] = len(self.protein_nodes)
         
         print("Loading go_term_nodes.parquet...")
-        self.go_terms = self.duckdb_con.execute(
-            f"SELECT * FROM '{self.data_path}/go_term_nodes.parquet'"
-        ).df()
+        with phases.phase("read_go_term_nodes") as phase:
+            self.go_terms = self.duckdb_con.execute(
+                f"SELECT * FROM '{self.data_path}/go_term_nodes.parquet'"
+            ).df()
+            phase['rows'] = len(self.go_terms)
         
         print("Loading edges.parquet...")
-        self.edges = self.duckdb_con.execute(
-            f"SELECT * FROM '{self.data_path}/edges.parquet'"
-        ).df()
+        with phases.phase("read_edges") as phase:
+            self.edges = self.duckdb_con.execute(
+                f"SELECT * FROM '{self.data_path}/edges.parquet'"
+            ).df()
+            phase['rows'] = len(self.edges)
         
         print("Loading protein_id_records.parquet...")
-        self.protein_ids = self.duckdb_con.execute(
-            f"SELECT * FROM '{self.data_path}/protein_id_records.parquet'"
-        ).df()
+        with phases.phase("read_protein_id_records") as phase:
+            self.protein_ids = self.duckdb_con.execute(
+                f"SELECT * FROM '{self.data_path}/protein_id_records.parquet'"
+            ).df()
+            phase['rows'] = len(self.protein_ids)
         
         print("Creating lookup maps...")
-        # Create lookup maps for efficient searching
+        # Create lookup maps for efficient searching (timed per step inside)
         self._create_lookup_maps()
         
+        print("Building GO term posting lists...")
+        with phases.phase("go_indexes", rows=len(self.go_terms)) as phase:
+            self._create_go_indexes()
+            phase['annotations'] = len(self.go_postings.protein_ids)
+        
+        print("Building sequence k-mer index...")
+        with phases.phase("sequence_index", rows=len(self.protein_index)):
+            self._create_sequence_index()
+        
+        print("Loading protein summary table...")
+        with phases.phase("protein_summary", rows=len(self.protein_index)) as phase:
+            phase['cached'] = self._create_protein_summary()
+            metrics.record_cache("protein_summary", phase['cached'])
+        
+        if self.offline_indexes:
+            print("Loading GO similarity signatures...")
+            with phases.phase("similarity_index") as phase:
+                phase['loaded'] = self._load_similarity_index()
+            
+            print("Loading sequence sketches...")
+            with phases.phase("sequence_sketches") as phase:
+                phase['loaded'] = self._load_sequence_sketches()
+        
+        with phases.phase("apply_deltas") as phase:
+            phase['rows'] = len(self.apply_pending_deltas())
+        
+        phases.log_summary()
+    
+    def load_report(self) -> Dict:
+        """
+        Get the timing and memory profile of the last load_data call.
+        
+        Returns:
+            A dictionary with 'operation', 'dataset_version', 'phases' and
+            'total'. Each phase has 'phase', 'rows', 'wall_seconds',
+            'cpu_seconds', 'rss_delta_bytes' and 'peak_rss_delta_bytes'
+            (None where memory cannot be measured), plus phase-specific
+            fields such as 'cached' for the protein summary.
+        """
+        report = self.load_phases.report()
+        report['dataset_version'] = self.dataset_version
+        return report
+    
+    def memory_report(self, target_proteins: Optional[int] = None, target_edges: Optional[int] = None) -> Dict:
+        """
+        Measure the memory held by the loaded DataFrames, lookup maps and indexes.
+        
+        Strings shared between structures (e.g. protein IDs that are keys in
+        several maps) are counted once, for the first structure holding them.
+        This walks every object, so it takes seconds on a full dataset.
+        
+        Args:
+            target_proteins: Number of proteins to extrapolate the footprint to.
+            target_edges: Number of edges to extrapolate to (scaled with the proteins if omitted).
+            
+        Returns:
+            The report from src.data.memory.memory_report, with
+            'dataset_version' and, if a target was given, 'projection'.
+        """
+        report = memory_report(self)
+        report['dataset_version'] = self.dataset_version
+        if target_proteins is not None or target_edges is not None:
+            scale = target_proteins / report['proteins'] if target_proteins and report['proteins'] else 1.0
+            report['projection'] = extrapolate(
+                report,
+                target_proteins if target_proteins is not None else report['proteins'],
+                target_edges if target_edges is not None else int(report['edges'] * scale),
+            )
+        return report
+    
     def _create_lookup_maps(self):
         """Create maps for efficient lookup."""
+        phases = self.load_phases
+        
         # First, map each protein ID to its details from protein_nodes
-        for _, row in self.protein_nodes.iterrows():
+        with phases.phase("lookup_maps.protein_nodes", rows=len(self.protein_nodes)):
+            self._index_protein_nodes(self.protein_nodes)
+        
+        # Next, create mappings from UUID and other identifiers to protein IDs
+        with phases.phase("lookup_maps.protein_id_records", rows=len(self.protein_ids)):
+            self._index_protein_records(self.protein_ids)
+        
+        # Fill in missing mappings by checking the edges file
+        with phases.phase("lookup_maps.edge_scan", rows=len(self.edges)) as phase:
+            known = len(self.id_to_details)
+            protein_ids_from_edges = set(self.edges['source'].unique()) | set(self.edges['target'].unique())
+            self._index_edge_proteins(protein_ids_from_edges)
+            phase['proteins_added'] = len(self.id_to_details) - known
+        
+        # Assign each protein a stable row id for array-backed indexes
+        self.protein_index = pd.Index(list(self.id_to_details.keys()))
+        
+        with phases.phase("lookup_maps.identifier_resolver", rows=len(self.identifier_to_ids)):
+            self.identifier_resolver = IdentifierResolver(self.identifier_to_ids)
+    
+    def _index_protein_nodes(self, protein_nodes: pd.DataFrame):
+        """
+        Add protein nodes to the lookup maps.
+        
+        Args:
+            protein_nodes: Rows of the protein nodes DataFrame.
+        """
+        for _, row in protein_nodes.iterrows():
             protein_id = row['id']
             name = row.get('name')
             self.id_to_details[protein_id] = row.to_dict()
@@ -92,9 +257,15 @@ class DataLoader:
                     self.identifier_to_ids[name] = []
                 if protein_id not in self.identifier_to_ids[name]:
                     self.identifier_to_ids[name].append(protein_id)
+    
+    def _index_protein_records(self, protein_ids: pd.DataFrame):
+        """
+        Add protein ID records (UUIDs, names, secondary identifiers) to the lookup maps.
         
-        # Next, create mappings from UUID and other identifiers to protein IDs
-        for _, row in self.protein_ids.iterrows():
+        Args:
+            protein_ids: Rows of the protein ID records DataFrame.
+        """
+        for _, row in protein_ids.iterrows():
             uuid = row['uuid']
             external_id = row.get('external_id')
             name = row.get('name')
@@ -105,6 +276,8 @@ class DataLoader:
                     self.uuid_to_ids[uuid] = []
                 if external_id not in self.uuid_to_ids[uuid]:
                     self.uuid_to_ids[uuid].append(external_id)
+                if external_id not in self.id_to_uuid:
+                    self.id_to_uuid[external_id] = uuid
             
             # Map UUID to protein ID in identifier_to_ids
             if uuid:
@@ -152,12 +325,18 @@ class DataLoader:
                         self.identifier_to_ids[identifier] = []
                     if external_id and external_id not in self.identifier_to_ids[identifier]:
                         self.identifier_to_ids[identifier].append(external_id)
+    
+    def _index_edge_proteins(self, protein_ids_from_edges):
+        """
+        Add proteins that only appear in edges to the lookup maps.
         
-        # Fill in missing mappings by checking the edges file
-        protein_ids_from_edges = set(self.edges['source'].unique()) | set(self.edges['target'].unique())
-        for protein_id in protein_ids_from_edges:
+        Args:
+            protein_ids_from_edges: Edge endpoints to check.
+        """
+        # Sorted so that protein row ids are the same on every load
+        for protein_id in sorted(p for p in protein_ids_from_edges if isinstance(p, str)):
             # Only consider protein IDs
-            if isinstance(protein_id, str) and protein_id.startswith('Protein::'):
+            if protein_id.startswith('Protein::'):
                 # If this protein ID is not in our lookup yet, add it
                 if protein_id not in self.identifier_to_ids:
                     self.identifier_to_ids[protein_id] = [protein_id]
@@ -171,6 +350,411 @@ class DataLoader:
                         'name': protein_id
                     }
     
+    def _create_go_indexes(self):
+        """Create GO term lookups and score-sorted posting lists."""
+        for row in self.go_terms.to_dict('records'):
+            external_id = row.get('external_id')
+            if external_id and external_id not in self.go_id_to_term:
+                self.go_id_to_term[external_id] = row
+            if row['id'] not in self.go_term_id_to_term:
+                self.go_term_id_to_term[row['id']] = row
+        
+        self.go_text_index = GoTermTextIndex(self.go_terms)
+        self._create_annotation_indexes()
+    
+    def _create_annotation_indexes(self):
+        """Create the indexes over functional annotation edges."""
+        self.go_postings = GoTermPostings(self.edges, self.FUNCTIONAL_ANNOTATION_TYPES)
+        self.go_bitmaps = GoTermBitmaps(
+            self.go_postings, self.protein_index, self.edges, self.FUNCTIONAL_ANNOTATION_TYPES
+        )
+        self.go_enrichment = GoEnrichment(
+            self.go_postings, self.go_bitmaps.posting_rows, len(self.protein_index)
+        )
+    
+    def _create_sequence_index(self):
+        """Create the k-mer index over protein sequences, aligned to protein row ids."""
+        if 'sequence' in self.protein_nodes.columns:
+            sequences = self.protein_nodes.drop_duplicates('id').set_index('id')['sequence']
+            sequences = sequences.reindex(self.protein_index)
+            sequences = sequences.where(sequences.notna(), None).tolist()
+        else:
+            sequences = [None] * len(self.protein_index)
+        
+        self.kmer_index = KmerIndex(sequences)
+    
+    def _create_protein_summary(self) -> bool:
+        """
+        Load the protein summary for this dataset version, building and saving it if needed.
+        
+        Returns:
+            True if a saved summary was loaded, False if it was built.
+        """
+        self.dataset_version = dataset_version(self.data_path)
+        self.dataset_modified = dataset_modified(self.data_path)
+        summary_path = self.data_path / SUMMARY_FILE
+        
+        summary = load_protein_summary(summary_path, self.dataset_version)
+        if summary is not None and summary['protein_id'].tolist() == self.protein_index.tolist():
+            self.protein_summary = summary
+            self.protein_features = summary_features(summary)
+            return True
+        
+        print(f"Building {SUMMARY_FILE} for dataset version {self.dataset_version}...")
+        self.protein_features = ProteinFeatures.from_edges(
+            self.protein_index,
+            self.kmer_index.sequences,
+            self.edges,
+            pd.Index(self.go_terms['id']),
+            self.FUNCTIONAL_ANNOTATION_TYPES,
+            self.PROTEIN_INTERACTION_TYPE,
+        )
+        self.protein_summary = build_protein_summary(
+            self.protein_index,
+            self.id_to_details,
+            self.id_to_uuid,
+            self.protein_features,
+            self.edges,
+            self.go_terms,
+            self.FUNCTIONAL_ANNOTATION_TYPES,
+        )
+        try:
+            save_protein_summary(self.protein_summary, summary_path, self.dataset_version)
+        except OSError as e:
+            print(f"Could not save {SUMMARY_FILE}: {e}")
+        return False
+    
+    def _load_similarity_index(self) -> bool:
+        """
+        Load the offline-built MinHash signatures.
+        
+        If they are missing or stale, they are built and saved with
+        index_workers processes, or left out when index_workers is 0.
+        
+        Returns:
+            True if the signatures were loaded from disk.
+        """
+        signature_path = self.data_path / SIGNATURE_FILE
+        state = "missing"
+        if signature_path.exists():
+            index = MinHashIndex.load(signature_path)
+            if index.matches(self.protein_index, self.go_enrichment.terms):
+                self.similarity_index = index
+                return True
+            state = "stale"
+        
+        if self.index_workers == 0:
+            print(f"{SIGNATURE_FILE} is {state}; similar proteins are unavailable until it is built with: "
+                  f"python -m src.data.similarity --data-path {self.data_path}")
+            return False
+        
+        print(f"{SIGNATURE_FILE} is {state}; building the similarity index with {self.index_workers or 'all'} workers.")
+        self._build_similarity_index()
+        try:
+            self.similarity_index.save(signature_path)
+        except OSError as e:
+            print(f"Could not save {SIGNATURE_FILE}: {e}")
+        return False
+    
+    def _build_similarity_index(self):
+        """Build the MinHash/LSH index over the current GO annotation sets with index_workers processes."""
+        self.similarity_index = MinHashIndex.build(
+            self.go_enrichment.incidence, self.protein_index, self.go_enrichment.terms, workers=self.index_workers
+        )
+    
+    def _load_sequence_sketches(self) -> bool:
+        """
+        Load the offline-built sequence sketches.
+        
+        If they are missing or stale, they are built and saved with
+        index_workers processes, or left out when index_workers is 0.
+        
+        Returns:
+            True if the sketches were loaded from disk.
+        """
+        sketch_path = self.data_path / SKETCH_FILE
+        state = "missing"
+        if sketch_path.exists():
+            index = SequenceSketchIndex.load(sketch_path)
+            if index.matches(self.protein_index):
+                self.sequence_sketches = index
+                return True
+            state = "stale"
+        
+        if self.index_workers == 0:
+            print(f"{SKETCH_FILE} is {state}; similar sequence search is unavailable until it is built with: "
+                  f"python -m src.data.sequence_sketch --data-path {self.data_path}")
+            return False
+        
+        print(f"{SKETCH_FILE} is {state}; building the sequence sketches with {self.index_workers or 'all'} workers.")
+        self._build_sequence_sketches()
+        try:
+            self.sequence_sketches.save(sketch_path)
+        except OSError as e:
+            print(f"Could not save {SKETCH_FILE}: {e}")
+        return False
+    
+    def _build_sequence_sketches(self):
+        """Sketch every protein sequence with index_workers processes."""
+        self.sequence_sketches = SequenceSketchIndex.build(
+            self.kmer_index.sequences, self.protein_index, workers=self.index_workers
+        )
+    
+    def copy(self) -> "DataLoader":
+        """
+        Copy the loader so that a delta can be applied while this one keeps serving.
+        
+        Indexes and DataFrames are shared, since apply_delta replaces rather
+        than modifies them; the lookup maps, which it updates in place, are copied.
+        
+        Returns:
+            A new DataLoader over the same data.
+        """
+        clone = copy.copy(self)
+        clone.id_to_details = dict(self.id_to_details)
+        clone.id_to_uuid = dict(self.id_to_uuid)
+        clone.uuid_to_ids = {key: list(ids) for key, ids in self.uuid_to_ids.items()}
+        clone.identifier_to_ids = {key: list(ids) for key, ids in self.identifier_to_ids.items()}
+        clone.name_to_ids = {key: list(ids) for key, ids in self.name_to_ids.items()}
+        clone.applied_deltas = list(self.applied_deltas)
+        return clone
+    
+    def apply_pending_deltas(self) -> List[Dict]:
+        """
+        Apply the deltas under data/deltas/ that have not been applied yet, in name order.
+        
+        Returns:
+            The statistics of every applied delta (see apply_delta).
+        """
+        pending = [path for path in list_deltas(self.data_path) if path.name not in self.applied_deltas]
+        return [self.apply_delta(path) for path in pending]
+    
+    def apply_delta(self, delta_path: Union[str, Path]) -> Dict:
+        """
+        Apply one delta of added and removed proteins and edges.
+        
+        Only the proteins the delta touches are re-indexed in the lookup maps,
+        summary and feature columns; new proteins get new row ids at the end.
+        Removed proteins keep their row ids, unreachable from the lookup maps,
+        until the deltas are compacted. The loader is modified in place, so
+        apply deltas to a copy() of a loader that is serving requests.
+        
+        Args:
+            delta_path: The delta directory.
+            
+        Returns:
+            A dictionary with the delta name, proteins_added, proteins_updated,
+            proteins_removed, edges_added, edges_removed and seconds.
+        
+        Raises:
+            ValueError: If a delta file is malformed.
+        """
+        start = time.perf_counter()
+        # A cursor of its own: copy() shares the connection with the generation serving requests
+        cursor = self.duckdb_con.cursor()
+        try:
+            delta = Delta(Path(delta_path), cursor)
+        finally:
+            cursor.close()
+        print(f"Applying delta {delta.name}...")
+        
+        removed = delta.removed_proteins
+        node_ids = set() if delta.protein_nodes is None else set(delta.protein_nodes['id'])
+        record_ids = set() if delta.protein_ids is None else set(delta.protein_ids['external_id'].dropna())
+        
+        # Unlink the identifiers of every protein whose node or records change
+        touched = {p for p in node_ids | record_ids | removed if p in self.id_to_details}
+        self._unindex_proteins(touched)
+        
+        # New node and record rows replace those of the same protein
+        protein_nodes = self.protein_nodes[~self.protein_nodes['id'].isin(node_ids | removed)]
+        if delta.protein_nodes is not None:
+            protein_nodes = pd.concat(
+                [protein_nodes, delta.protein_nodes[~delta.protein_nodes['id'].isin(removed)]], ignore_index=True
+            )
+        protein_ids = self.protein_ids[~self.protein_ids['external_id'].isin(record_ids | removed)]
+        if delta.protein_ids is not None:
+            protein_ids = pd.concat(
+                [protein_ids, delta.protein_ids[~delta.protein_ids['external_id'].isin(removed)]], ignore_index=True
+            )
+        
+        # Tombstoned edges and every edge of a removed protein are dropped
+        edges = self.edges
+        dropped = edges['source'].isin(removed) | edges['target'].isin(removed)
+        if delta.removed_edges is not None and len(delta.removed_edges):
+            candidates = edges['source'].isin(delta.removed_edges['source'])
+            keys = pd.MultiIndex.from_frame(edges.loc[candidates, EDGE_KEY])
+            dropped.loc[candidates] |= keys.isin(pd.MultiIndex.from_frame(delta.removed_edges[EDGE_KEY]))
+        added_edges = delta.edges
+        if added_edges is not None:
+            added_edges = added_edges[~(added_edges['source'].isin(removed) | added_edges['target'].isin(removed))]
+        changed_edges = pd.concat([edges[dropped], added_edges], ignore_index=True)
+        if dropped.any() or (added_edges is not None and len(added_edges)):
+            edges = pd.concat([edges[~dropped], added_edges], ignore_index=True)
+        
+        self.protein_nodes, self.protein_ids, self.edges = protein_nodes, protein_ids, edges
+        
+        # Re-index the touched and new proteins from their current rows
+        indexed = (node_ids | record_ids | touched) - removed
+        self._index_protein_nodes(protein_nodes[protein_nodes['id'].isin(indexed)])
+        self._index_protein_records(protein_ids[protein_ids['external_id'].isin(indexed)])
+        added_endpoints = set() if added_edges is None else set(added_edges['source']) | set(added_edges['target'])
+        on_edges = edges['source'].isin(indexed) | edges['target'].isin(indexed)
+        edge_endpoints = set(edges.loc[on_edges, 'source']) | set(edges.loc[on_edges, 'target'])
+        self._index_edge_proteins(added_endpoints | (edge_endpoints & indexed))
+        
+        # Proteins seen for the first time get row ids after the existing ones
+        candidates = pd.Index(sorted(p for p in indexed | added_endpoints if p in self.id_to_details))
+        new_ids = candidates[self.protein_index.get_indexer(candidates) < 0].tolist()
+        old_size = len(self.protein_index)
+        if new_ids:
+            self.protein_index = self.protein_index.append(pd.Index(new_ids))
+        self.identifier_resolver = IdentifierResolver(self.identifier_to_ids)
+        
+        # Sequences of new, replaced and removed proteins
+        replaced = pd.Index(sorted(node_ids | removed))
+        sequence_ids = replaced[self.protein_index.get_indexer(replaced) >= 0].tolist()
+        sequence_ids = sorted(set(sequence_ids) - set(new_ids)) + new_ids
+        if sequence_ids:
+            sequences = (
+                protein_nodes.drop_duplicates('id').set_index('id')['sequence'].reindex(sequence_ids)
+                if 'sequence' in protein_nodes.columns else pd.Series(None, index=sequence_ids, dtype=object)
+            )
+            self.kmer_index = self.kmer_index.with_sequences(
+                self.protein_index.get_indexer(sequence_ids), sequences.where(sequences.notna(), None).tolist()
+            )
+        
+        annotations_changed = changed_edges['relationship'].isin(self.FUNCTIONAL_ANNOTATION_TYPES).any()
+        if annotations_changed or new_ids:
+            self._create_annotation_indexes()
+            # The saved signatures no longer line up; rebuilt here, on the reload thread, if allowed
+            if self.offline_indexes and self.index_workers != 0:
+                self._build_similarity_index()
+            elif self.similarity_index is not None:
+                self.similarity_index = None
+                print(f"Delta {delta.name} changed annotations; similar proteins are unavailable until "
+                      f"python -m src.data.similarity --data-path {self.data_path} is run and the data reloaded.")
+        if sequence_ids:
+            if self.offline_indexes and self.index_workers != 0:
+                self._build_sequence_sketches()
+            elif self.sequence_sketches is not None:
+                self.sequence_sketches = None
+                print(f"Delta {delta.name} changed sequences; similar sequence search is unavailable until "
+                      f"python -m src.data.sequence_sketch --data-path {self.data_path} is run and the data reloaded.")
+        
+        endpoints = set(changed_edges['source']) | set(changed_edges['target'])
+        affected = self.protein_index.get_indexer(pd.Index(sorted(touched | indexed | endpoints, key=str)))
+        self._update_protein_summary(np.sort(affected[affected >= 0]), old_size)
+        
+        self.dataset_version = chain_version(self.dataset_version, delta.version)
+        if delta.modified and (self.dataset_modified is None or delta.modified > self.dataset_modified):
+            self.dataset_modified = delta.modified
+        self.applied_deltas.append(delta.name)
+        
+        return {
+            'delta': delta.name,
+            'proteins_added': len(new_ids),
+            'proteins_updated': len(touched - removed),
+            'proteins_removed': len(removed & touched),
+            'edges_added': 0 if added_edges is None else len(added_edges),
+            'edges_removed': int(dropped.sum()),
+            'seconds': time.perf_counter() - start,
+        }
+    
+    def _unindex_proteins(self, protein_ids: set):
+        """
+        Remove proteins from the lookup maps, using their current node and record rows.
+        
+        Args:
+            protein_ids: IDs of the proteins to remove.
+        """
+        if not protein_ids:
+            return
+        nodes = self.protein_nodes[self.protein_nodes['id'].isin(protein_ids)]
+        records = self.protein_ids[self.protein_ids['external_id'].isin(protein_ids)]
+        
+        keys = set(protein_ids) | set(nodes['name'].dropna()) | set(records['uuid'].dropna())
+        if 'name' in records.columns:
+            keys |= set(records['name'].dropna())
+        for column in ('secondary_ids', 'ambiguous_secondary_ids'):
+            if column in records.columns:
+                for identifiers in records[column]:
+                    if isinstance(identifiers, list):
+                        keys.update(identifiers)
+        
+        for mapping in (self.identifier_to_ids, self.name_to_ids, self.uuid_to_ids):
+            for key in keys:
+                ids = mapping.get(key)
+                if ids is None:
+                    continue
+                remaining = [p for p in ids if p not in protein_ids]
+                # A UUID key listing only itself belonged to a removed record
+                if remaining and remaining != [key]:
+                    mapping[key] = remaining
+                else:
+                    del mapping[key]
+        
+        for protein_id in protein_ids:
+            self.id_to_details.pop(protein_id, None)
+            self.id_to_uuid.pop(protein_id, None)
+    
+    def _update_protein_summary(self, rows: np.ndarray, old_size: int):
+        """
+        Recompute the summary and feature rows of some proteins, extending the table to new row ids.
+        
+        Args:
+            rows: Protein row ids to recompute (must include every new row id).
+            old_size: Number of rows before the new proteins were added.
+        """
+        proteins = self.protein_index[rows]
+        involved = self.edges[self.edges['source'].isin(proteins) | self.edges['target'].isin(proteins)]
+        features = ProteinFeatures.from_edges(
+            proteins,
+            self.kmer_index.sequences[rows],
+            involved,
+            pd.Index(self.go_terms['id']),
+            self.FUNCTIONAL_ANNOTATION_TYPES,
+            self.PROTEIN_INTERACTION_TYPE,
+        )
+        updated = build_protein_summary(
+            proteins,
+            self.id_to_details,
+            self.id_to_uuid,
+            features,
+            involved,
+            self.go_terms,
+            self.FUNCTIONAL_ANNOTATION_TYPES,
+        ).set_axis(rows)
+        
+        unchanged = np.setdiff1d(np.arange(old_size), rows)
+        summary = pd.concat([self.protein_summary.iloc[unchanged], updated]).sort_index()
+        self.protein_summary = summary.reset_index(drop=True).astype(self.protein_summary.dtypes.to_dict())
+        self.protein_features = summary_features(self.protein_summary)
+    
+    def compact(self):
+        """
+        Fold the applied deltas into the base parquet files and delete the delta directories.
+        
+        Each file is written next to the original and renamed over it. The
+        in-memory indexes keep their delta layout; load a new DataLoader
+        afterwards for compact row ids and indexes.
+        """
+        frames = {
+            "protein_nodes.parquet": self.protein_nodes,
+            "edges.parquet": self.edges,
+            "protein_id_records.parquet": self.protein_ids,
+        }
+        for name, frame in frames.items():
+            path = self.data_path / name
+            temporary = path.with_name(f".{name}.tmp")
+            frame.to_parquet(temporary, index=False)
+            os.replace(temporary, path)
+        
+        for name in self.applied_deltas:
+            shutil.rmtree(self.data_path / DELTA_DIR / name, ignore_errors=True)
+        print(f"Compacted {len(self.applied_deltas)} deltas into {self.data_path}")
+    
+    @timed("loader")
     def search_protein(self, identifier: str) -> List[str]:
         """
         Search for proteins by identifier.
@@ -202,6 +786,25 @@ class DataLoader:
         # No matches found
         return []
     
+    @timed("loader")
+    def resolve_identifiers(self, identifiers: List[str]) -> Dict[str, List]:
+        """
+        Map many identifiers to canonical protein IDs at once.
+        
+        Unlike search_protein, only exact identifiers (IDs, names, UUIDs,
+        secondary and ambiguous IDs) are matched; there is no fuzzy fallback.
+        
+        Args:
+            identifiers: Identifiers to resolve.
+            
+        Returns:
+            A dictionary with 'resolved' (identifier and protein_id),
+            'ambiguous' (identifier and protein_ids) and 'unresolved'
+            (identifiers with no match), each in input order.
+        """
+        return self.identifier_resolver.resolve(identifiers)
+    
+    @timed("loader")
     def get_protein_details(self, protein_id: str) -> Dict:
         """
         Get details for a specific protein.
@@ -212,6 +815,8 @@ class DataLoader:
         Returns:
             A dictionary containing protein details.
         """
+        current_span().set('protein_id', protein_id)
+        
         # Start with basic details from our lookup
         if protein_id in self.id_to_details:
             result = dict(self.id_to_details[protein_id])
@@ -219,16 +824,20 @@ class DataLoader:
             result = {'id': protein_id, 'name': protein_id}
         
         # Add UUID if available
-        for uuid, ids in self.uuid_to_ids.items():
-            if protein_id in ids:
-                result['uuid'] = uuid
-                break
+        with span("loader.uuid_lookup") as uuid_span:
+            if protein_id in self.id_to_uuid:
+                result['uuid'] = self.id_to_uuid[protein_id]
+            uuid_span.set('found', 'uuid' in result)
         
         # Add functional annotations
-        result['functional_annotations'] = self._get_functional_annotations(protein_id)
+        with span("loader.functional_annotations") as annotations_span:
+            result['functional_annotations'] = self._get_functional_annotations(protein_id)
+            annotations_span.set('count', len(result['functional_annotations']))
         
         # Add protein-protein interactions
-        result['protein_interactions'] = self._get_protein_interactions(protein_id)
+        with span("loader.protein_interactions") as interactions_span:
+            result['protein_interactions'] = self._get_protein_interactions(protein_id)
+            interactions_span.set('count', len(result['protein_interactions']))
         
         return result
     
@@ -306,10 +915,8 @@ class DataLoader:
                 interaction['name'] = self.id_to_details[target_id]['name']
             
             # Add UUID if available
-            for uuid, ids in self.uuid_to_ids.items():
-                if target_id in ids:
-                    interaction['protein_uuid'] = uuid
-                    break
+            if target_id in self.id_to_uuid:
+                interaction['protein_uuid'] = self.id_to_uuid[target_id]
             
             interactions.append(interaction)
         
@@ -328,55 +935,642 @@ class DataLoader:
                 interaction['name'] = self.id_to_details[source_id]['name']
             
             # Add UUID if available
-            for uuid, ids in self.uuid_to_ids.items():
-                if source_id in ids:
-                    interaction['protein_uuid'] = uuid
-                    break
+            if source_id in self.id_to_uuid:
+                interaction['protein_uuid'] = self.id_to_uuid[source_id]
             
             interactions.append(interaction)
         
         return interactions
     
-    def search_by_go_term(self, go_term_id: str) -> List[Dict]:
+    @timed("loader")
+    def get_go_term(self, go_term_id: str) -> Optional[Dict]:
         """
-        Search for proteins by GO term.
+        Get details for a GO term.
         
         Args:
-            go_term_id: The GO term ID to search for.
+            go_term_id: The GO term ID (e.g. "GO:0005624").
             
         Returns:
-            A list of protein dictionaries associated with the GO term.
+            A dictionary containing GO term details, or None if not found.
         """
-        # Find GO term using external_id
-        go_term = self.go_terms[self.go_terms['external_id'] == go_term_id]
+        go_term = self.go_id_to_term.get(go_term_id)
+        if go_term is None:
+            return None
+        
+        return {
+            'go_term_id': go_term['id'],
+            'go_id': go_term_id,
+            'name': go_term.get('name'),
+            'namespace': go_term.get('namespace', go_term.get('node_type')),
+            'description': go_term.get('description'),
+            'protein_count': self.go_postings.count(go_term['id']),
+        }
+    
+    @timed("loader")
+    def search_go_terms(self, query: str, limit: int = 20) -> List[Dict]:
+        """
+        Full-text search over GO term names and definitions.
+        
+        Every query word must match (as a whole word or a word prefix).
+        Matches in the term name rank above matches in the definition.
         
-        if go_term.empty:
+        Args:
+            query: Free-text query (e.g. "kinase activity").
+            limit: Maximum number of GO terms to return.
+            
+        Returns:
+            A list of GO term dictionaries, most relevant first.
+        """
+        results = []
+        for position, relevance in self.go_text_index.search(query, limit=limit):
+            external_id = self.go_terms.iloc[position].get('external_id')
+            go_term = self.get_go_term(external_id)
+            if go_term:
+                go_term['relevance'] = relevance
+                results.append(go_term)
+        
+        return results
+    
+    @timed("loader")
+    def get_go_term_proteins(self, go_term_id: str, offset: int = 0, limit: Optional[int] = 50) -> List[Dict]:
+        """
+        Get one page of proteins annotated with a GO term, highest score first.
+        
+        Args:
+            go_term_id: The GO term ID (e.g. "GO:0005624").
+            offset: Number of proteins to skip.
+            limit: Maximum number of proteins to return (None for all).
+            
+        Returns:
+            A list of protein summary dictionaries (see get_protein_summaries)
+            with the annotation score, for the requested page.
+        """
+        go_term = self.go_id_to_term.get(go_term_id)
+        if go_term is None:
             return []
         
-        go_term_id_internal = go_term.iloc[0]['id']
+        protein_ids, scores = self.go_postings.page(go_term['id'], offset, limit)
         
-        # Find proteins linked to this GO term
-        annotations = self.edges[
-            self.edges['relationship'].isin(self.FUNCTIONAL_ANNOTATION_TYPES) & 
-            (self.edges['target'] == go_term_id_internal)
-        ]
+        # Summary fields come from the materialized table; edge-only sources
+        # missing from the protein index keep just their ID and score
+        rows = self.protein_index.get_indexer(protein_ids)
+        summaries = iter(self._summary_records(rows[rows >= 0]))
         
         results = []
-        for _, annotation in annotations.iterrows():
-            protein_id = annotation['source']
+        for protein_id, row, score in zip(protein_ids, rows, scores):
+            result = next(summaries) if row >= 0 else {'protein_id': protein_id, 'name': protein_id}
+            if result.get('uuid') is None:
+                result.pop('uuid', None)
+            result['score'] = None if pd.isna(score) else float(score)
+            results.append(result)
+        
+        return results
+    
+    @timed("loader")
+    def query_go_terms(
+        self, expression: str, namespace: Optional[str] = None, min_score: Optional[float] = None
+    ) -> List[str]:
+        """
+        Find proteins matching a boolean expression over GO terms.
+        
+        Args:
+            expression: Query using GO IDs with AND, OR, NOT and parentheses,
+                e.g. "GO:0005634 AND (GO:0016301 OR GO:0004672) AND NOT GO:0005737".
+            namespace: Only return proteins with an annotation in this namespace
+                (BiologicalProcess, MolecularFunction or CellularComponent).
+            min_score: Only count annotations with at least this ML_prediction_score.
+            
+        Returns:
+            A list of matching protein IDs.
+            
+        Raises:
+            ValueError: If the expression is malformed or names an unknown GO term.
+        """
+        tree = parse_go_query(expression)
+        
+        def resolve(go_term_id: str) -> str:
+            go_term = self.go_id_to_term.get(go_term_id) or self.go_id_to_term.get(go_term_id.upper())
+            if go_term is None:
+                raise ValueError(f"Unknown GO term: {go_term_id}")
+            return go_term['id']
+        
+        matches = self.go_bitmaps.evaluate(tree, resolve, min_score)
+        if namespace:
+            if namespace not in self.go_bitmaps.namespaces:
+                raise ValueError(f"Unknown GO namespace: {namespace}")
+            matches = matches & self.go_bitmaps.namespaces[namespace]
+        
+        return self.protein_index[matches.rows()].tolist()
+    
+    @timed("loader")
+    def enrich_go_terms(self, identifiers: List[str], max_q_value: float = 1.0, limit: Optional[int] = 100) -> Dict:
+        """
+        Run GO term over-representation analysis for a set of proteins.
+        
+        Uses a one-sided hypergeometric test against all annotated proteins,
+        with Benjamini-Hochberg correction across every GO term.
+        
+        Args:
+            identifiers: Protein IDs or other identifiers known to search_protein.
+            max_q_value: Only return GO terms with an FDR-adjusted p-value at or below this.
+            limit: Maximum number of GO terms to return (None for all).
+            
+        Returns:
+            A dictionary with 'study_size', 'population_size', 'unmapped'
+            (identifiers that matched no protein) and 'terms' (GO term
+            dictionaries sorted by p-value).
+        """
+        protein_ids = []
+        unmapped = []
+        for identifier in identifiers:
+            if identifier in self.id_to_details:
+                protein_ids.append(identifier)
+            elif identifier in self.identifier_to_ids:
+                protein_ids.extend(self.identifier_to_ids[identifier])
+            else:
+                unmapped.append(identifier)
+        
+        rows = self.protein_index.get_indexer(protein_ids)
+        results = self.go_enrichment.run(rows[rows >= 0])
+        study_size = int(results['study_size'].iloc[0]) if len(results) else 0
+        results = results[(results['study_count'] > 0) & (results['q_value'] <= max_q_value)]
+        if limit is not None:
+            results = results.head(limit)
+        
+        terms = []
+        for row in results.to_dict('records'):
+            go_term = self.go_term_id_to_term.get(row['go_term_id'], {})
+            row['go_id'] = go_term.get('external_id')
+            row['name'] = go_term.get('name')
+            row['namespace'] = go_term.get('namespace', go_term.get('node_type'))
+            terms.append(row)
+        
+        return {
+            'study_size': study_size,
+            'population_size': self.go_enrichment.population_size,
+            'unmapped': unmapped,
+            'terms': terms,
+        }
+    
+    @timed("loader")
+    def get_similar_proteins(self, protein_id: str, k: int = 10) -> List[Dict]:
+        """
+        Find proteins with the most similar sets of GO annotations.
+        
+        Candidates come from the MinHash LSH index and are reranked by exact
+        Jaccard similarity of the GO term sets.
+        
+        Args:
+            protein_id: The protein ID.
+            k: Number of similar proteins to return.
+            
+        Returns:
+            A list of dictionaries with protein_id, name, uuid, jaccard and
+            estimated_jaccard, most similar first.
+        """
+        # Built by load_data and apply_delta; never built on the request path
+        row = self.protein_index.get_indexer([protein_id])[0]
+        if self.similarity_index is None or row < 0:
+            return []
+        
+        results = []
+        for other, jaccard, estimated in self.similarity_index.similar(row, self.go_enrichment.incidence, k):
+            other_id = self.protein_index[other]
+            result = {
+                'protein_id': other_id,
+                'name': self.id_to_details.get(other_id, {}).get('name', other_id),
+                'jaccard': jaccard,
+                'estimated_jaccard': estimated,
+            }
+            if other_id in self.id_to_uuid:
+                result['uuid'] = self.id_to_uuid[other_id]
+            results.append(result)
+        
+        return results
+    
+    @timed("loader")
+    def search_sequence(self, peptide: str) -> List[Dict]:
+        """
+        Find proteins whose sequence contains a peptide.
+        
+        Args:
+            peptide: Amino-acid peptide (e.g. "GKSTL").
+            
+        Returns:
+            A list of dictionaries with protein_id, name, uuid and the
+            1-based positions of every match.
             
+        Raises:
+            ValueError: If the peptide contains characters that are not amino acids.
+        """
+        results = []
+        for row, positions in self.kmer_index.search(peptide):
+            protein_id = self.protein_index[row]
             result = {
                 'protein_id': protein_id,
                 'name': self.id_to_details.get(protein_id, {}).get('name', protein_id),
-                'score': annotation.get('ML_prediction_score', None)
+                'positions': [position + 1 for position in positions],
             }
+            if protein_id in self.id_to_uuid:
+                result['uuid'] = self.id_to_uuid[protein_id]
+            results.append(result)
+        
+        return results
+    
+    @timed("loader")
+    def search_similar_sequences(self, query: str, k: int = 10, rerank: bool = False) -> List[Dict]:
+        """
+        Find proteins with sequences similar to a protein or a raw sequence.
+        
+        Candidates are ranked by k-mer sketch similarity (an estimated Jaccard
+        of the k-mer sets, which is not a sequence identity) and can be
+        reranked by the identity of a banded global alignment.
+        
+        Args:
+            query: A protein identifier, or an amino-acid sequence.
+            k: Number of similar proteins to return.
+            rerank: Whether to align the top candidates and sort by aligned identity.
             
-            # Add UUID if available
-            for uuid, ids in self.uuid_to_ids.items():
-                if protein_id in ids:
-                    result['uuid'] = uuid
-                    break
+        Returns:
+            A list of dictionaries with protein_id, name, uuid and jaccard (plus
+            identity when reranked), most similar first.
             
+        Raises:
+            ValueError: If the sequence sketches are not loaded, or the query is
+                neither a known protein with a sequence nor a valid amino-acid sequence.
+        """
+        if self.sequence_sketches is None:
+            raise ValueError(f"Sequence sketches are not loaded; build them with: "
+                             f"python -m src.data.sequence_sketch --data-path {self.data_path}")
+        
+        exclude = None
+        sequence = None
+        # Exact identifier lookups only; fuzzy name matching would catch short sequences
+        query = query.strip()
+        for protein_id in self.identifier_to_ids.get(query) or self.name_to_ids.get(query, []):
+            row = self.protein_index.get_indexer([protein_id])[0]
+            if row >= 0 and isinstance(self.kmer_index.sequences[row], str):
+                exclude, sequence = row, self.kmer_index.sequences[row]
+                break
+        if sequence is None:
+            sequence = re.sub(r"\s+", "", query).upper()
+            if not sequence or (encode_sequence(sequence) == INVALID_CODE).any():
+                raise ValueError(f"Not a known protein or amino-acid sequence: {query}")
+        
+        # Rerank a wider pool of sketch candidates by alignment
+        hits = self.sequence_sketches.top(
+            self.sequence_sketches.sketch(sequence), k=k * 3 if rerank else k, exclude=exclude
+        )
+        results = []
+        for row, jaccard in hits:
+            protein_id = self.protein_index[row]
+            result = {
+                'protein_id': protein_id,
+                'name': self.id_to_details.get(protein_id, {}).get('name', protein_id),
+                'jaccard': jaccard,
+            }
+            if protein_id in self.id_to_uuid:
+                result['uuid'] = self.id_to_uuid[protein_id]
             results.append(result)
         
-        return results 
\ No newline at end of file
+        if rerank and results:
+            candidates = [self.kmer_index.sequences[row] for row, _ in hits]
+            for result, identity in zip(results, align_candidates(sequence, candidates)):
+                result['identity'] = identity
+            results.sort(key=lambda result: (-result['identity'], -result['jaccard']))
+        
+        return results[:k]
+    
+    def stream_motif_matches(
+        self, pattern: str, workers: Optional[int] = None, prefilter: bool = True, pool: Optional[Executor] = None
+    ) -> Iterator[List[Dict]]:
+        """
+        Scan all sequences for a PROSITE pattern or regular expression.
+        
+        Sequences are split into chunks scanned in a process pool; each chunk's
+        matches are yielded as soon as it finishes.
+        
+        Args:
+            pattern: PROSITE pattern (e.g. "C-x(2,4)-C-x(3)-[LIVMFYWC]") or regex.
+            workers: Number of worker processes (None for all cores).
+            prefilter: Whether to narrow the scan with the k-mer index using
+                fixed fragments of the motif.
+            pool: Long-lived process pool to scan in (a pool is created per scan if None).
+            
+        Yields:
+            Lists of dictionaries with protein_id, name and matches
+            (1-based start, end and matched text).
+            
+        Raises:
+            ValueError: If the pattern is invalid.
+        """
+        for chunk in iter_motif_matches(
+            pattern, self.kmer_index, workers=workers, prefilter=prefilter, pool=pool
+        ):
+            results = []
+            for row, matches in chunk:
+                protein_id = self.protein_index[row]
+                results.append({
+                    'protein_id': protein_id,
+                    'name': self.id_to_details.get(protein_id, {}).get('name', protein_id),
+                    'matches': [
+                        {'start': start + 1, 'end': end, 'match': text} for start, end, text in matches
+                    ],
+                })
+            yield results
+    
+    @timed("loader")
+    def scan_motif(self, pattern: str, workers: Optional[int] = None, prefilter: bool = True) -> List[Dict]:
+        """
+        Scan all sequences for a motif and collect every match.
+        
+        Args:
+            pattern: PROSITE pattern or regular expression.
+            workers: Number of worker processes (None for all cores).
+            prefilter: Whether to narrow the scan with the k-mer index.
+            
+        Returns:
+            A list of match dictionaries (see stream_motif_matches), in protein order.
+        """
+        results = [
+            result
+            for chunk in self.stream_motif_matches(pattern, workers=workers, prefilter=prefilter)
+            for result in chunk
+        ]
+        row_of = {protein_id: row for row, protein_id in enumerate(self.protein_index)}
+        return sorted(results, key=lambda result: row_of[result['protein_id']])
+    
+    @timed("loader")
+    def get_protein_summaries(self, protein_ids: List[str]) -> List[Dict]:
+        """
+        Get summary rows for proteins from the materialized summary table.
+        
+        Args:
+            protein_ids: Protein IDs; unknown IDs are skipped.
+            
+        Returns:
+            A list of dictionaries with protein_id, name, uuid, annotation and
+            interaction counts, sequence length and the top GO terms
+            (top_go_ids, top_go_names), in input order.
+        """
+        rows = self.protein_index.get_indexer(protein_ids)
+        return self._summary_records(rows[rows >= 0])
+    
+    @timed("loader")
+    def get_protein_summary(self, protein_id: str) -> Optional[Dict]:
+        """
+        Get the summary row for a protein.
+        
+        Args:
+            protein_id: The protein ID.
+            
+        Returns:
+            A summary dictionary (see get_protein_summaries), or None if the
+            protein is unknown.
+        """
+        summaries = self.get_protein_summaries([protein_id])
+        return summaries[0] if summaries else None
+    
+    def _summary_records(self, rows) -> List[Dict]:
+        """Convert summary table rows to plain dictionaries."""
+        records = self.protein_summary.iloc[rows].to_dict('records')
+        for record in records:
+            if not isinstance(record['uuid'], str):
+                record['uuid'] = None
+            if pd.isna(record['max_interaction_score']):
+                record['max_interaction_score'] = None
+            record['top_go_ids'] = list(record['top_go_ids'])
+            record['top_go_names'] = list(record['top_go_names'])
+        return records
+    
+    @timed("loader")
+    def get_protein_features(self, protein_id: str) -> Optional[Dict]:
+        """
+        Get the precomputed features of a protein.
+        
+        Args:
+            protein_id: The protein ID.
+            
+        Returns:
+            A dictionary of feature values (see FEATURE_LABELS), or None if
+            the protein is unknown.
+        """
+        row = self.protein_index.get_indexer([protein_id])[0]
+        if row < 0:
+            return None
+        return self.protein_features.row(row)
+    
+    @timed("loader")
+    def facet_search(
+        self,
+        protein_ids: Optional[List[str]] = None,
+        filters: Optional[Dict] = None,
+        sort_by: Optional[str] = None,
+        descending: bool = True,
+        offset: int = 0,
+        limit: Optional[int] = 50,
+    ) -> Dict:
+        """
+        Filter and sort proteins by their precomputed features.
+        
+        Args:
+            protein_ids: Proteins to restrict to, e.g. search results (None for all proteins).
+            filters: Feature name -> exact value or inclusive (min, max) range,
+                with None for an open end.
+            sort_by: Feature name to sort by (None keeps the input order).
+            descending: Whether to sort from the highest value.
+            offset: Number of matching proteins to skip.
+            limit: Maximum number of proteins to return (None for all).
+            
+        Returns:
+            A dictionary with the total number of matches and a page of
+            protein summaries (see get_protein_summaries).
+            
+        Raises:
+            ValueError: If a filter or the sort names an unknown feature.
+        """
+        rows = None
+        if protein_ids is not None:
+            rows = self.protein_index.get_indexer(protein_ids)
+            rows = rows[rows >= 0]
+        
+        matches = self.protein_features.query(filters, rows=rows, sort_by=sort_by, descending=descending)
+        stop = None if limit is None else offset + limit
+        proteins = self._summary_records(matches[offset:stop])
+        
+        return {'total': len(matches), 'proteins': proteins}
+    
+    @timed("loader")
+    def search_protein_ids(
+        self,
+        query: str,
+        search_type: str = "protein",
+        namespace: Optional[str] = None,
+        min_score: Optional[float] = None,
+    ) -> List[str]:
+        """
+        Run a search the way the search page does and return all matched protein IDs.
+        
+        Args:
+            query: The search term.
+            search_type: protein, go_term, go_query or sequence.
+            namespace: Namespace restriction for GO queries.
+            min_score: Minimum annotation score for GO queries.
+            
+        Returns:
+            Matched protein IDs, in result order.
+            
+        Raises:
+            ValueError: If the search type is not supported or the query is invalid.
+        """
+        if search_type == "protein":
+            return self.search_protein(query)
+        if search_type == "go_term":
+            go_term = self.go_id_to_term.get(query)
+            if go_term is None:
+                return []
+            protein_ids, _ = self.go_postings.page(go_term['id'])
+            return list(protein_ids)
+        if search_type == "go_query":
+            return self.query_go_terms(query, namespace=namespace, min_score=min_score)
+        if search_type == "sequence":
+            return [protein['protein_id'] for protein in self.search_sequence(query)]
+        raise ValueError(f"Unsupported search type: {search_type}")
+    
+    @timed("loader")
+    def get_protein_neighbors(self, protein_id: str, offset: int = 0, limit: Optional[int] = 50) -> Dict:
+        """
+        Get one page of a protein's interaction partners, highest score first.
+        
+        Args:
+            protein_id: The protein ID.
+            offset: Number of partners to skip.
+            limit: Maximum number of partners to return (None for all).
+            
+        Returns:
+            A dictionary with the total number of interactions and a page of
+            neighbors (protein_id, name, direction, score).
+        """
+        interactions = pd.concat(list(self.iter_interaction_batches(protein_id)), ignore_index=True)
+        outgoing = interactions['source'] == protein_id
+        neighbors = pd.DataFrame({
+            'protein_id': interactions['target'].where(outgoing, interactions['source']),
+            'name': interactions['target_name'].where(outgoing, interactions['source_name']),
+            'direction': np.where(outgoing, 'target', 'source'),
+            'score': interactions['score'],
+        })
+        neighbors['name'] = neighbors['name'].fillna(neighbors['protein_id'])
+        neighbors = neighbors.sort_values(['score', 'protein_id'], ascending=[False, True], na_position='last')
+        
+        stop = None if limit is None else offset + limit
+        page = neighbors.iloc[offset:stop].astype(object)
+        return {
+            'total': len(neighbors),
+            'neighbors': page.where(page.notna(), None).to_dict('records'),
+        }
+    
+    def iter_protein_summary_batches(
+        self, protein_ids: Optional[List[str]] = None, batch_size: int = 10000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream rows of the protein summary table in batches, e.g. for exports.
+        
+        Args:
+            protein_ids: Proteins to include, in order (None for all proteins).
+            batch_size: Number of rows per batch.
+            
+        Yields:
+            Slices of the summary table; at least one (possibly empty) batch.
+        """
+        if protein_ids is None:
+            rows = np.arange(len(self.protein_index))
+        else:
+            rows = self.protein_index.get_indexer(protein_ids)
+            rows = rows[rows >= 0]
+        
+        for start in range(0, max(len(rows), 1), batch_size):
+            yield self.protein_summary.iloc[rows[start:start + batch_size]]
+    
+    def iter_go_term_protein_batches(self, go_term_id: str, batch_size: int = 10000) -> Iterator[pd.DataFrame]:
+        """
+        Stream the proteins annotated with a GO term in batches, highest score first.
+        
+        Args:
+            go_term_id: The GO term ID (e.g. "GO:0005624").
+            batch_size: Number of proteins per batch.
+            
+        Yields:
+            DataFrames of protein summary columns plus the annotation score;
+            at least one (possibly empty) batch.
+            
+        Raises:
+            ValueError: If the GO term is unknown.
+        """
+        go_term = self.go_id_to_term.get(go_term_id)
+        if go_term is None:
+            raise ValueError(f"Unknown GO term: {go_term_id}")
+        
+        total = self.go_postings.count(go_term['id'])
+        for offset in range(0, max(total, 1), batch_size):
+            protein_ids, scores = self.go_postings.page(go_term['id'], offset, batch_size)
+            batch = pd.DataFrame({'protein_id': protein_ids}).merge(
+                self.protein_summary, on='protein_id', how='left'
+            )
+            batch.insert(3, 'score', scores)
+            yield batch
+    
+    def iter_interaction_batches(
+        self, protein_id: Optional[str] = None, batch_size: int = 100000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream protein-protein interactions in batches straight from DuckDB.
+        
+        Args:
+            protein_id: Only include interactions of this protein (None for all).
+            batch_size: Number of interactions per batch.
+            
+        Yields:
+            DataFrames with source, source_name, target, target_name and score
+            columns; at least one (possibly empty) batch.
+        """
+        # A cursor per export, so concurrent exports don't share a connection
+        cursor = self.duckdb_con.cursor()
+        cursor.register('edges_view', self.edges)
+        cursor.register('names_view', self.protein_summary[['protein_id', 'name']])
+        score = "e.string_combined_score" if 'string_combined_score' in self.edges.columns else "NULL"
+        query = f"""
+            SELECT e.source, s.name AS source_name, e.target, t.name AS target_name, {score} AS score
+            FROM edges_view e
+            LEFT JOIN names_view s ON s.protein_id = e.source
+            LEFT JOIN names_view t ON t.protein_id = e.target
+            WHERE e.relationship = ?
+        """
+        parameters = [self.PROTEIN_INTERACTION_TYPE]
+        if protein_id is not None:
+            query += " AND (e.source = ? OR e.target = ?)"
+            parameters += [protein_id, protein_id]
+        
+        try:
+            reader = cursor.execute(query, parameters).fetch_record_batch(batch_size)
+            empty = True
+            for batch in reader:
+                empty = False
+                yield batch.to_pandas()
+            if empty:
+                yield reader.schema.empty_table().to_pandas()
+        finally:
+            cursor.close()
+    
+    @timed("loader")
+    def search_by_go_term(self, go_term_id: str) -> List[Dict]:
+        """
+        Search for proteins by GO term.
+        
+        Args:
+            go_term_id: The GO term ID to search for.
+            
+        Returns:
+            A list of protein dictionaries associated with the GO term,
+            sorted by descending score.
+        """
+        return self.get_go_term_proteins(go_term_id, offset=0, limit=None)
@@ -0,0 +1,238 @@
+"""
+Memory footprint of the DataLoader's in-memory structures, with capacity extrapolation.
+"""
+import argparse
+import sys
+import types
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+from src.utils.timing import rss_bytes
+
+# Loader attribute -> what its size grows with
+PROTEIN_STRUCTURES = [
+    'protein_nodes',
+    'protein_ids',
+    'id_to_details',
+    'uuid_to_ids',
+    'identifier_to_ids',
+    'name_to_ids',
+    'id_to_uuid',
+    'protein_index',
+    'identifier_resolver',
+    'kmer_index',
+    'sequence_sketches',
+    'protein_features',
+    'protein_summary',
+    'similarity_index',
+]
+EDGE_STRUCTURES = ['edges', 'go_postings', 'go_bitmaps', 'go_enrichment']
+FIXED_STRUCTURES = ['go_terms', 'go_id_to_term', 'go_term_id_to_term', 'go_text_index']
+
+# Measured first, so that strings shared with the maps and indexes are attributed to the data
+MEASURE_ORDER = (
+    ['protein_nodes', 'go_terms', 'edges', 'protein_ids']
+    + [name for name in PROTEIN_STRUCTURES + EDGE_STRUCTURES + FIXED_STRUCTURES
+       if name not in ('protein_nodes', 'go_terms', 'edges', 'protein_ids')]
+)
+
+# Objects that are not data owned by a structure
+_SKIPPED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+
+def deep_size(obj, seen: Optional[Set[int]] = None) -> int:
+    """
+    Compute the memory held by an object graph, counting every object once.
+
+    Containers, instance attributes, NumPy arrays (including the objects in
+    object arrays) and pandas Index/Series/DataFrame contents are followed.
+    Objects whose id is in `seen` are skipped and new ones are added to it,
+    so passing one set through several calls attributes shared objects,
+    such as interned identifier strings, to the first structure reaching them.
+
+    Args:
+        obj: The object to measure.
+        seen: IDs of objects already counted (updated in place).
+
+    Returns:
+        Size in bytes.
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if item is None or id(item) in seen or isinstance(item, _SKIPPED_TYPES):
+            continue
+        seen.add(id(item))
+
+        if isinstance(item, pd.DataFrame):
+            stack.append(item.index)
+            stack.extend(item[column] for column in item.columns.unique())
+            continue
+        if isinstance(item, pd.Series):
+            stack.append(item.index)
+            values = item.array
+            if isinstance(item.dtype, np.dtype):
+                stack.append(item.to_numpy(copy=False))
+            else:
+                total += int(values.nbytes) if hasattr(values, 'nbytes') else int(item.memory_usage(deep=True))
+            continue
+        if isinstance(item, pd.Index):
+            if isinstance(item, pd.RangeIndex):
+                total += sys.getsizeof(item)
+            elif isinstance(item, pd.MultiIndex):
+                total += int(item.memory_usage(deep=True))
+            else:
+                stack.append(item.to_numpy(copy=False))
+            continue
+        if isinstance(item, np.ndarray):
+            if item.base is not None and isinstance(item.base, np.ndarray):
+                # Views share the memory of their base array
+                stack.append(item.base)
+                continue
+            total += sys.getsizeof(item) if item.base is None else int(item.nbytes)
+            if item.dtype == object:
+                stack.extend(item.ravel().tolist())
+            continue
+
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif not isinstance(item, (str, bytes, int, float, complex, bool, np.generic)):
+            if hasattr(item, '__dict__'):
+                stack.append(item.__dict__)
+            for slot in getattr(type(item), '__slots__', ()):
+                stack.append(getattr(item, slot, None))
+    return total
+
+
+def _item_count(obj) -> Optional[int]:
+    """Get the number of rows or entries of a structure, if it has a length."""
+    try:
+        return len(obj)
+    except TypeError:
+        return None
+
+
+def memory_report(loader, structures: Optional[List[str]] = None) -> Dict:
+    """
+    Measure the loader's data structures.
+
+    Args:
+        loader: A loaded DataLoader.
+        structures: Attribute names to measure (None for all known structures).
+
+    Returns:
+        A dictionary with the dataset sizes ('proteins', 'edges',
+        'go_terms'), 'structures' (one entry per attribute with 'name',
+        'scales_with', 'items', 'bytes' counting shared objects once across
+        structures, 'standalone_bytes' as if nothing were shared, and
+        'pandas_deep_bytes' for DataFrames), 'total_bytes', 'rss_bytes',
+        'fixed_bytes', 'bytes_per_protein' and 'bytes_per_edge'.
+    """
+    names = [name for name in MEASURE_ORDER if structures is None or name in structures]
+    seen: Set[int] = set()
+    entries = []
+    for name in names:
+        obj = getattr(loader, name, None)
+        if obj is None:
+            continue
+        entry = {
+            'name': name,
+            'scales_with': (
+                'proteins' if name in PROTEIN_STRUCTURES else 'edges' if name in EDGE_STRUCTURES else 'fixed'
+            ),
+            'items': _item_count(obj),
+            'bytes': deep_size(obj, seen),
+            'standalone_bytes': deep_size(obj),
+        }
+        if isinstance(obj, pd.DataFrame):
+            entry['pandas_deep_bytes'] = int(obj.memory_usage(deep=True).sum())
+        entries.append(entry)
+
+    n_proteins = len(loader.protein_index) if loader.protein_index is not None else 0
+    n_edges = len(loader.edges) if loader.edges is not None else 0
+    by_scale = {scale: sum(e['bytes'] for e in entries if e['scales_with'] == scale)
+                for scale in ('proteins', 'edges', 'fixed')}
+    return {
+        'proteins': n_proteins,
+        'edges': n_edges,
+        'go_terms': len(loader.go_terms) if loader.go_terms is not None else 0,
+        'structures': entries,
+        'total_bytes': sum(e['bytes'] for e in entries),
+        'rss_bytes': rss_bytes(),
+        'fixed_bytes': by_scale['fixed'],
+        'bytes_per_protein': by_scale['proteins'] / n_proteins if n_proteins else None,
+        'bytes_per_edge': by_scale['edges'] / n_edges if n_edges else None,
+    }
+
+
+def extrapolate(report: Dict, proteins: int, edges: int) -> Dict:
+    """
+    Project the footprint to another dataset size, assuming linear scaling per structure.
+
+    Args:
+        report: Result of memory_report.
+        proteins: Target number of proteins.
+        edges: Target number of edges.
+
+    Returns:
+        A dictionary with 'proteins', 'edges', 'structures' (name ->
+        projected bytes) and 'total_bytes'.
+    """
+    factors = {
+        'proteins': proteins / report['proteins'] if report['proteins'] else 0.0,
+        'edges': edges / report['edges'] if report['edges'] else 0.0,
+        'fixed': 1.0,
+    }
+    projected = {e['name']: e['bytes'] * factors[e['scales_with']] for e in report['structures']}
+    return {
+        'proteins': proteins,
+        'edges': edges,
+        'structures': projected,
+        'total_bytes': sum(projected.values()),
+    }
+
+
+def _megabytes(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value / 2 ** 20:,.1f}"
+
+
+if __name__ == "__main__":
+    from src.data.loader import DataLoader
+
+    parser = argparse.ArgumentParser(description="Report the memory footprint of the DataLoader")
+    parser.add_argument("--data-path", type=str, default="data", help="Directory containing the parquet files")
+    parser.add_argument("--scale", type=float, default=None, help="Extrapolate to this multiple of the dataset")
+    parser.add_argument("--proteins", type=int, default=None, help="Extrapolate to this many proteins")
+    parser.add_argument("--edges", type=int, default=None, help="Extrapolate to this many edges")
+    args = parser.parse_args()
+
+    loader = DataLoader(data_path=args.data_path)
+    report = loader.memory_report()
+
+    print(f"\n{report['proteins']:,} proteins, {report['edges']:,} edges, {report['go_terms']:,} GO terms")
+    print(f"{'structure':<22} {'scales with':<12} {'items':>10} {'MB':>10} {'standalone MB':>14} {'pandas MB':>10}")
+    for entry in report['structures']:
+        print(f"{entry['name']:<22} {entry['scales_with']:<12} {entry['items'] or '':>10} "
+              f"{_megabytes(entry['bytes']):>10} {_megabytes(entry['standalone_bytes']):>14} "
+              f"{_megabytes(entry.get('pandas_deep_bytes')):>10}")
+    print(f"\nTotal: {_megabytes(report['total_bytes'])} MB (process RSS {_megabytes(report['rss_bytes'])} MB)")
+    print(f"Per protein: {report['bytes_per_protein'] or 0:,.0f} bytes, per edge: {report['bytes_per_edge'] or 0:,.0f} bytes, "
+          f"fixed: {_megabytes(report['fixed_bytes'])} MB")
+
+    if args.scale or args.proteins or args.edges:
+        scale = args.scale or 1.0
+        target_proteins = args.proteins or int(report['proteins'] * scale)
+        target_edges = args.edges or int(report['edges'] * scale)
+        projection = extrapolate(report, target_proteins, target_edges)
+        print(f"\nProjected for {target_proteins:,} proteins and {target_edges:,} edges: "
+              f"{_megabytes(projection['total_bytes'])} MB")
+        for name, size in sorted(projection['structures'].items(), key=lambda item: -item[1])[:8]:
+            print(f"  {name:<22} {_megabytes(size):>10} MB")
@@ -0,0 +1,289 @@
+"""
+Parallel regex / PROSITE-style motif scanning over protein sequences.
+"""
+import os
+import re
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.data.sequence_index import KmerIndex
+from src.utils.processes import process_context
+
+PROSITE_ELEMENT = re.compile(
+    r"^(?P<residue>[A-Zx]|\[[A-Z]+>?\]|\{[A-Z]+\})(?:\((?P<min>\d+)(?:,(?P<max>\d+))?\))?$"
+)
+
+# (row, [(start, end, matched text), ...])
+ChunkMatches = List[Tuple[int, List[Tuple[int, int, str]]]]
+
+
+def is_prosite(pattern: str) -> bool:
+    """
+    Check whether a pattern uses PROSITE syntax (e.g. "C-x(2,4)-C-x(3)-[LIVMFYWC]").
+
+    Args:
+        pattern: The motif pattern.
+
+    Returns:
+        True if every '-'-separated element is a valid PROSITE element. A
+        single element also needs syntax a regular expression would read
+        differently (x, a repeat count, {...}, [..>] or an anchor), so
+        patterns like "[ST]" or "A" stay regular expressions.
+    """
+    stripped = pattern.strip().rstrip(".")
+    elements = stripped.lstrip("<").rstrip(">").split("-")
+    if not all(PROSITE_ELEMENT.match(element) for element in elements):
+        return False
+    if len(elements) > 1:
+        return True
+
+    match = PROSITE_ELEMENT.match(elements[0])
+    residue = match.group("residue")
+    return (
+        residue == "x"
+        or residue.startswith("{")
+        or residue.endswith(">]")
+        or match.group("min") is not None
+        or stripped != elements[0]
+    )
+
+
+def prosite_to_regex(pattern: str) -> Tuple[str, List[str]]:
+    """
+    Convert a PROSITE pattern to a regular expression.
+
+    Args:
+        pattern: PROSITE pattern (e.g. "<M-x(2)-[ST]-{P}-G>").
+
+    Returns:
+        Tuple of (regex, literal fragments). The fragments are runs of fixed
+        residues that every match must contain, usable for k-mer prefiltering.
+
+    Raises:
+        ValueError: If the pattern is not valid PROSITE syntax.
+    """
+    pattern = pattern.strip().rstrip(".")
+    prefix = "^" if pattern.startswith("<") else ""
+    suffix = "$" if pattern.endswith(">") else ""
+    pattern = pattern.lstrip("<").rstrip(">")
+
+    parts = []
+    fragments = []
+    current = ""
+    for element in pattern.split("-"):
+        match = PROSITE_ELEMENT.match(element)
+        if not match:
+            raise ValueError(f"Invalid PROSITE element: {element}")
+
+        residue = match.group("residue")
+        low, high = match.group("min"), match.group("max")
+        if residue == "x":
+            token = "."
+        elif residue.startswith("{"):
+            token = f"[^{residue[1:-1]}]"
+        elif residue.startswith("["):
+            # "[G>]" means G or the C-terminus
+            token = f"(?:[{residue[1:-2]}]|$)" if residue.endswith(">]") else residue
+        else:
+            token = residue
+
+        if low and high:
+            token += f"{{{low},{high}}}"
+        elif low:
+            token += f"{{{low}}}"
+        parts.append(token)
+
+        # Track runs of fixed residues for prefiltering
+        if len(residue) == 1 and residue != "x" and not high:
+            current += residue * int(low or 1)
+        else:
+            if current:
+                fragments.append(current)
+            current = ""
+    if current:
+        fragments.append(current)
+
+    return prefix + "".join(parts) + suffix, fragments
+
+
+def _scan_chunk(regex: str, rows: List[int], sequences: List[str]) -> ChunkMatches:
+    """
+    Scan one chunk of sequences for a motif (runs in a worker process).
+
+    Args:
+        regex: The motif as a regular expression.
+        rows: Protein row ids of the chunk.
+        sequences: Sequences of the chunk.
+
+    Returns:
+        A list of (row, matches) tuples for proteins with at least one match.
+    """
+    compiled = re.compile(regex)
+    results = []
+    for row, sequence in zip(rows, sequences):
+        matches = [(m.start(), m.end(), m.group(0)) for m in compiled.finditer(sequence)]
+        if matches:
+            results.append((row, matches))
+    return results
+
+
+def create_scan_pool(workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Create a long-lived process pool for motif scans and start its first worker.
+
+    Args:
+        workers: Number of worker processes (None for all cores).
+
+    Returns:
+        The pool; pass it to iter_motif_matches and shut it down on exit.
+    """
+    pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1, mp_context=process_context())
+    pool.submit(_scan_chunk, "", [], []).result()
+    return pool
+
+
+def _balanced_chunks(rows: np.ndarray, lengths: np.ndarray, n_chunks: int) -> List[np.ndarray]:
+    """Split rows into contiguous chunks with roughly equal total sequence length."""
+    if not len(rows):
+        return []
+    boundaries = np.searchsorted(
+        np.cumsum(lengths), np.linspace(0, lengths.sum(), n_chunks + 1)[1:-1], side="right"
+    )
+    return [chunk for chunk in np.split(rows, boundaries) if len(chunk)]
+
+
+def iter_motif_matches(
+    pattern: str,
+    kmer_index: KmerIndex,
+    workers: Optional[int] = None,
+    chunks_per_worker: int = 4,
+    prefilter: bool = True,
+    prosite: Optional[bool] = None,
+    pool: Optional[Executor] = None,
+) -> Iterator[ChunkMatches]:
+    """
+    Scan every sequence for a motif in a process pool, yielding matches per chunk.
+
+    Chunks are yielded as soon as each worker finishes, so callers can show
+    results progressively. Closing the iterator early cancels the chunks
+    that have not started.
+
+    Args:
+        pattern: PROSITE pattern or regular expression.
+        kmer_index: The k-mer index holding the sequences.
+        workers: Number of worker processes (None for all cores, 1 to scan inline
+            without a pool); with a pool, its size, used to split the chunks.
+        chunks_per_worker: Number of chunks per worker, for load balancing.
+        prefilter: Whether to restrict the scan with the k-mer index when the
+            motif has a fixed fragment of at least k residues.
+        prosite: Whether the pattern is PROSITE syntax (None to detect).
+        pool: Long-lived pool to scan in (see create_scan_pool); without one,
+            a pool is created for this scan.
+
+    Yields:
+        Lists of (row, [(start, end, matched text), ...]) tuples, with 0-based positions.
+
+    Raises:
+        ValueError: If the pattern is invalid.
+    """
+    if prosite is None:
+        prosite = is_prosite(pattern)
+    if prosite:
+        regex, fragments = prosite_to_regex(pattern)
+    else:
+        regex, fragments = pattern.strip(), []
+    try:
+        re.compile(regex)
+    except re.error as e:
+        raise ValueError(f"Invalid motif pattern: {e}")
+
+    sequences = kmer_index.sequences
+    rows = np.flatnonzero([sequence is not None for sequence in sequences])
+    if prefilter:
+        for fragment in fragments:
+            if len(fragment) >= kmer_index.k:
+                rows = np.intersect1d(rows, kmer_index.candidates(fragment))
+
+    workers = workers or os.cpu_count() or 1
+    lengths = np.array([len(sequences[row]) for row in rows], dtype=np.int64)
+    chunks = _balanced_chunks(rows, lengths, max(1, workers * chunks_per_worker))
+
+    if pool is None and (workers == 1 or len(chunks) <= 1):
+        for chunk in chunks:
+            yield _scan_chunk(regex, chunk.tolist(), sequences[chunk].tolist())
+        return
+
+    own_pool = pool is None
+    if own_pool:
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=process_context())
+    futures = [
+        pool.submit(_scan_chunk, regex, chunk.tolist(), sequences[chunk].tolist())
+        for chunk in chunks
+    ]
+    try:
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        if own_pool:
+            pool.shutdown(wait=False)
+
+
+class MotifScanJob:
+    """
+    A motif scan running on a background thread, collecting matches as chunks finish.
+    """
+
+    def __init__(self, chunks: Iterator[List[Dict]]):
+        """
+        Start consuming the scan.
+
+        Args:
+            chunks: Iterator yielding lists of match dictionaries.
+        """
+        self.matches: List[Dict] = []
+        self.chunks_done = 0
+        self.done = False
+        self.error: Optional[str] = None
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(chunks,), daemon=True)
+        self._thread.start()
+
+    def _run(self, chunks: Iterator[List[Dict]]):
+        try:
+            for chunk in chunks:
+                if self._cancelled.is_set():
+                    break
+                with self._lock:
+                    self.matches.extend(chunk)
+                    self.chunks_done += 1
+        except Exception as e:
+            self.error = str(e)
+        finally:
+            # Cancels the scan's pending chunks in the pool
+            close = getattr(chunks, "close", None)
+            if close:
+                close()
+            self.done = True
+
+    def cancel(self):
+        """Stop the scan: pending chunks are cancelled once the running ones finish."""
+        self._cancelled.set()
+
+    def snapshot(self, since: int = 0) -> Tuple[List[Dict], int, bool, Optional[str]]:
+        """
+        Get the matches found since an earlier snapshot.
+
+        Args:
+            since: Number of matches already taken.
+
+        Returns:
+            Tuple of (new matches, total matches, done, error).
+        """
+        with self._lock:
+            return self.matches[since:], len(self.matches), self.done, self.error
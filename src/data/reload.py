@@ -0,0 +1,250 @@
+"""
+Zero-downtime reloading of the dataset by building and swapping DataLoader generations.
+"""
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.data.delta import DELTA_FILES, list_deltas
+from src.data.loader import DataLoader
+from src.data.version import DATA_FILES
+from src.utils.logging import logger
+
+
+class ReloadableLoader:
+    """
+    Holds the current DataLoader and replaces it with freshly built generations.
+
+    A new generation is built completely on a background thread while the
+    current one keeps serving. The swap is a single reference assignment, so
+    callers that read `current` once per request finish on the generation
+    they started with; the old generation is released when its last request
+    drops the reference.
+
+    New deltas are applied to a copy of the current generation instead of
+    rebuilding it, and folded into the base files every `compact_after` deltas.
+    """
+
+    def __init__(
+        self,
+        data_path: str = "data",
+        loader_factory: Callable[[str], DataLoader] = DataLoader,
+        compact_after: int = 7,
+    ):
+        """
+        Load the first generation.
+
+        Args:
+            data_path: Directory containing the parquet files.
+            loader_factory: Builds a loaded DataLoader from a data path.
+            compact_after: Number of applied deltas that triggers compaction (0 to never compact).
+        """
+        self.data_path = Path(data_path)
+        self.loader_factory = loader_factory
+        self.compact_after = compact_after
+        self.generation = 0
+        self.reloading = False
+        self.last_reload: Optional[Dict] = None
+        self._swap_listeners: List[Callable[[Optional[DataLoader], DataLoader], None]] = []
+        self._lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        # Data file state the current generation was built from, for the watcher
+        self._loaded_files = self._build_files = self._file_state()
+
+        self.current: Optional[DataLoader] = None
+        try:
+            self.current = loader_factory(str(self.data_path))
+            self.generation = 1
+        except Exception as e:
+            logger.error(f"Error initializing DataLoader: {e}")
+
+    def on_swap(self, listener: Callable[[Optional[DataLoader], DataLoader], None]):
+        """
+        Register a function called with (old, new) after every swap, e.g. to invalidate caches.
+
+        Args:
+            listener: The function to call.
+        """
+        self._swap_listeners.append(listener)
+
+    def reload(self, wait: bool = False) -> bool:
+        """
+        Build a new generation in the background and swap it in when complete.
+
+        If building fails, the current generation keeps serving and the error
+        is recorded in `last_reload`.
+
+        Args:
+            wait: Whether to block until the reload has finished.
+
+        Returns:
+            False if a reload was already in progress, True otherwise.
+        """
+        return self._start(lambda: self.loader_factory(str(self.data_path)), "rebuild", wait)
+
+    def apply_deltas(self, wait: bool = False) -> bool:
+        """
+        Apply pending deltas to a copy of the current generation in the background and swap it in.
+
+        Falls back to a full rebuild if no generation is loaded, and compacts
+        the deltas into the base files once `compact_after` have been applied.
+
+        Args:
+            wait: Whether to block until the deltas have been applied.
+
+        Returns:
+            False if a reload was already in progress, True otherwise.
+        """
+        return self._start(self._with_deltas, "deltas", wait)
+
+    def _with_deltas(self) -> Optional[DataLoader]:
+        """Build the next generation from pending deltas (None if there are none)."""
+        current = self.current
+        if current is None:
+            return self.loader_factory(str(self.data_path))
+
+        loader = current.copy()
+        for stats in loader.apply_pending_deltas():
+            logger.info(
+                f"Applied delta {stats['delta']} in {stats['seconds']:.2f}s: "
+                f"+{stats['proteins_added']}/-{stats['proteins_removed']} proteins, "
+                f"+{stats['edges_added']}/-{stats['edges_removed']} edges"
+            )
+        if len(loader.applied_deltas) == len(current.applied_deltas):
+            return None
+
+        if self.compact_after and len(loader.applied_deltas) >= self.compact_after:
+            loader.compact()
+            self._build_files = self._file_state()
+            return self.loader_factory(str(self.data_path))
+        return loader
+
+    def _start(self, build: Callable[[], Optional[DataLoader]], kind: str, wait: bool) -> bool:
+        """Run build on a background thread and swap in its result, unless a reload is running."""
+        with self._lock:
+            if self.reloading:
+                return False
+            self.reloading = True
+
+        thread = threading.Thread(target=self._build_and_swap, args=(build, kind), name="loader-reload", daemon=True)
+        thread.start()
+        if wait:
+            thread.join()
+        return True
+
+    def _build_and_swap(self, build: Callable[[], Optional[DataLoader]], kind: str):
+        started = time.time()
+        try:
+            logger.info(f"Building loader generation {self.generation + 1} from {self.data_path} ({kind})...")
+            build_start = time.perf_counter()
+            self._build_files = self._file_state()
+            new_loader = build()
+            build_seconds = time.perf_counter() - build_start
+            if new_loader is None:
+                logger.info("No pending deltas; keeping the current generation")
+                return
+
+            swap_start = time.perf_counter()
+            with self._lock:
+                old_loader, self.current = self.current, new_loader
+                self.generation += 1
+                generation = self.generation
+            swap_seconds = time.perf_counter() - swap_start
+
+            for listener in self._swap_listeners:
+                try:
+                    listener(old_loader, new_loader)
+                except Exception as e:
+                    logger.error(f"Error in reload listener: {e}")
+
+            self.last_reload = {
+                "generation": generation,
+                "kind": kind,
+                "started": started,
+                "build_seconds": build_seconds,
+                "swap_seconds": swap_seconds,
+                "dataset_version": new_loader.dataset_version,
+                "applied_deltas": list(new_loader.applied_deltas),
+                "error": None,
+            }
+            logger.info(
+                f"Swapped in loader generation {generation} "
+                f"(dataset {new_loader.dataset_version}, built in {build_seconds:.2f}s, "
+                f"swapped in {swap_seconds * 1000:.3f}ms)"
+            )
+        except Exception as e:
+            self.last_reload = {"generation": self.generation, "kind": kind, "started": started, "error": str(e)}
+            logger.error(f"Error reloading data, keeping generation {self.generation}: {e}")
+        finally:
+            # Failed builds are not retried until the files change again
+            self._loaded_files = self._build_files
+            self.reloading = False
+
+    def status(self) -> Dict:
+        """
+        Describe the current generation and the last reload.
+
+        Returns:
+            A dictionary with generation, dataset_version, applied_deltas,
+            reloading, watching and last_reload.
+        """
+        loader = self.current
+        return {
+            "generation": self.generation,
+            "dataset_version": loader.dataset_version if loader else None,
+            "applied_deltas": list(loader.applied_deltas) if loader else [],
+            "reloading": self.reloading,
+            "watching": self._watcher is not None,
+            "last_reload": self.last_reload,
+        }
+
+    def _file_state(self) -> Tuple[Tuple, Tuple]:
+        """Get the (size, mtime) of every base file and delta file, None for missing files."""
+
+        def stat(paths):
+            state = []
+            for path in paths:
+                try:
+                    info = path.stat()
+                    state.append((str(path), info.st_size, info.st_mtime_ns))
+                except OSError:
+                    state.append(None)
+            return tuple(state)
+
+        deltas = [delta / name for delta in list_deltas(self.data_path) for name in DELTA_FILES]
+        return stat(self.data_path / name for name in DATA_FILES), stat(deltas)
+
+    def watch(self, interval: float = 5.0):
+        """
+        Poll the data files on a background thread and reload when they change.
+
+        A reload starts once the files have stayed unchanged for one full
+        interval, so a dataset that is still being copied is not picked up
+        half-written. Changes to the base files trigger a full rebuild;
+        changes only under deltas/ apply the new deltas.
+
+        Args:
+            interval: Seconds between polls.
+        """
+        if self._watcher is not None:
+            return
+
+        def poll():
+            pending = None
+            while True:
+                time.sleep(interval)
+                state = self._file_state()
+                if state == self._loaded_files:
+                    pending = None
+                elif state != pending:
+                    logger.info(f"Data files in {self.data_path} changed; waiting for them to settle")
+                    pending = state
+                elif state[0] != self._loaded_files[0]:
+                    self.reload()
+                else:
+                    self.apply_deltas()
+
+        self._watcher = threading.Thread(target=poll, name="data-watcher", daemon=True)
+        self._watcher.start()
+        logger.info(f"Watching {self.data_path} for data changes every {interval:g}s")
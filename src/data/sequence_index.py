@@ -0,0 +1,205 @@
+"""
+k-mer inverted index for exact peptide search over protein sequences.
+"""
+import copy
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# Standard amino acids followed by ambiguity and rare residue codes
+AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWYBXZUO"
+INVALID_CODE = 255
+
+_CODE_TABLE = np.full(256, INVALID_CODE, dtype=np.uint8)
+for _code, _residue in enumerate(AMINO_ACIDS):
+    _CODE_TABLE[ord(_residue)] = _code
+    _CODE_TABLE[ord(_residue.lower())] = _code
+
+
+def encode_sequence(sequence: str) -> np.ndarray:
+    """
+    Encode an amino-acid sequence as residue codes.
+
+    Args:
+        sequence: The amino-acid sequence.
+
+    Returns:
+        A uint8 array of residue codes (INVALID_CODE for unknown characters).
+    """
+    return _CODE_TABLE[np.frombuffer(sequence.encode("ascii", errors="replace"), dtype=np.uint8)]
+
+
+def kmer_codes(residues: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute integer codes of every k-mer in an encoded sequence.
+
+    Args:
+        residues: Residue codes from encode_sequence.
+        k: k-mer length.
+
+    Returns:
+        Tuple of (codes, valid) arrays, one entry per window; windows that
+        contain an unknown residue are marked invalid.
+    """
+    windows = len(residues) - k + 1
+    if windows <= 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+
+    codes = np.zeros(windows, dtype=np.int64)
+    for offset in range(k):
+        codes = codes * len(AMINO_ACIDS) + residues[offset:offset + windows]
+
+    invalid = np.concatenate([[0], np.cumsum(residues == INVALID_CODE)])
+    valid = (invalid[k:] - invalid[:windows]) == 0
+    return codes, valid
+
+
+class KmerIndex:
+    """
+    Inverted index from amino-acid k-mer codes to protein row ids.
+
+    k-mers are packed into base-25 integers; the distinct (k-mer, protein)
+    pairs are stored CSR-style as a sorted array of k-mer codes, offsets and
+    protein row ids. A peptide lookup intersects the posting lists of its
+    k-mers and verifies the surviving candidates against the sequences.
+
+    Sequences added or changed later (see with_sequences) are indexed in
+    separate segments whose posting lists are merged in at lookup time.
+    """
+
+    def __init__(self, sequences: List[Optional[str]], k: int = 5):
+        """
+        Build the index.
+
+        Args:
+            sequences: Sequence for every protein row id (None if missing).
+            k: k-mer length.
+        """
+        self.k = k
+        sequences = [sequence.upper() if isinstance(sequence, str) else None for sequence in sequences]
+        self.sequences = np.asarray(sequences, dtype=object)
+
+        rows = [i for i, sequence in enumerate(sequences) if sequence]
+        texts = [sequences[i] for i in rows]
+        # Join with an invalid separator so no k-mer spans two proteins
+        residues = encode_sequence("*".join(texts))
+        codes, valid = kmer_codes(residues, k)
+
+        lengths = np.array([len(text) + 1 for text in texts], dtype=np.int64)
+        owners = np.repeat(np.asarray(rows, dtype=np.int64), lengths)[:len(codes)]
+
+        pairs = np.unique(codes[valid] * len(sequences) + owners[valid])
+        pair_codes = pairs // max(len(sequences), 1)
+        self._rows = (pairs % max(len(sequences), 1)).astype(np.int32)
+        self._codes, starts = np.unique(pair_codes, return_index=True)
+        self._offsets = np.append(starts, len(pair_codes)).astype(np.int64)
+        self._segments: List[Tuple["KmerIndex", np.ndarray]] = []
+
+    def postings(self, code: int) -> np.ndarray:
+        """
+        Get the protein row ids containing a k-mer.
+
+        Args:
+            code: k-mer code from kmer_codes.
+
+        Returns:
+            Sorted array of protein row ids.
+        """
+        position = np.searchsorted(self._codes, code)
+        if position == len(self._codes) or self._codes[position] != code:
+            result = np.zeros(0, dtype=np.int32)
+        else:
+            result = self._rows[self._offsets[position]:self._offsets[position + 1]]
+
+        for segment, rows in self._segments:
+            extra = segment.postings(code)
+            if len(extra):
+                result = np.union1d(result, rows[extra])
+        return result
+
+    def with_sequences(self, rows: np.ndarray, sequences: List[Optional[str]]) -> "KmerIndex":
+        """
+        Get a copy of the index with the sequences of some rows replaced or added.
+
+        The changed sequences are indexed as a new segment and the existing
+        arrays are shared, so the cost depends only on the changed sequences.
+        k-mers of replaced sequences stay in the older posting lists; search
+        drops such candidates when it verifies them against the sequences.
+
+        Args:
+            rows: Protein row ids to set; ids beyond the current size extend the index.
+            sequences: New sequence for every row (None to clear it).
+
+        Returns:
+            A new KmerIndex.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        segment = KmerIndex(sequences, self.k)
+
+        index = copy.copy(self)
+        size = max(len(self.sequences), int(rows.max()) + 1 if len(rows) else 0)
+        index.sequences = np.empty(size, dtype=object)
+        index.sequences[:len(self.sequences)] = self.sequences
+        index.sequences[rows] = segment.sequences
+        index._segments = self._segments + [(segment, rows)]
+        return index
+
+    def candidates(self, peptide: str) -> np.ndarray:
+        """
+        Get proteins containing every k-mer of a peptide.
+
+        Args:
+            peptide: Peptide of at least k residues.
+
+        Returns:
+            Sorted array of candidate protein row ids.
+        """
+        codes, valid = kmer_codes(encode_sequence(peptide), self.k)
+        lists = sorted((self.postings(code) for code in np.unique(codes[valid])), key=len)
+        if not lists:
+            return np.zeros(0, dtype=np.int32)
+
+        result = lists[0]
+        for posting in lists[1:]:
+            if not len(result):
+                break
+            result = np.intersect1d(result, posting, assume_unique=True)
+        return result
+
+    def search(self, peptide: str) -> List[Tuple[int, List[int]]]:
+        """
+        Find all proteins containing a peptide.
+
+        Peptides shorter than k fall back to scanning every sequence.
+
+        Args:
+            peptide: The amino-acid peptide.
+
+        Returns:
+            A list of (protein row id, 0-based match positions) tuples.
+
+        Raises:
+            ValueError: If the peptide contains characters that are not amino acids.
+        """
+        peptide = peptide.strip().upper()
+        if not peptide or (encode_sequence(peptide) == INVALID_CODE).any():
+            raise ValueError(f"Invalid peptide sequence: {peptide}")
+
+        if len(peptide) >= self.k:
+            rows = self.candidates(peptide)
+        else:
+            rows = np.arange(len(self.sequences))
+
+        matches = []
+        for row in rows:
+            sequence = self.sequences[row]
+            if not isinstance(sequence, str):
+                continue
+            positions = []
+            position = sequence.find(peptide)
+            while position != -1:
+                positions.append(position)
+                position = sequence.find(peptide, position + 1)
+            if positions:
+                matches.append((int(row), positions))
+        return matches
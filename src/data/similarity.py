@@ -0,0 +1,267 @@
+"""
+Shared-GO-term protein similarity using MinHash signatures and LSH.
+
+The signature matrix is built offline and saved next to the parquet files:
+
+    python -m src.data.similarity --data-path data --workers 8
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from src.utils.processes import process_context
+
+MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+EMPTY_SIGNATURE = np.uint32(np.iinfo(np.uint32).max)
+KEY_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+SIGNATURE_FILE = "protein_minhash.npz"
+
+
+def _signature_chunk(indptr: np.ndarray, indices: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Compute MinHash signatures for a chunk of CSR rows.
+
+    Args:
+        indptr: CSR row pointers for the chunk (starting at 0).
+        indices: GO term column ids for the chunk.
+        a: Hash multipliers, one per permutation.
+        b: Hash offsets, one per permutation.
+
+    Returns:
+        A (rows x permutations) uint32 signature matrix.
+    """
+    n_rows = len(indptr) - 1
+    signatures = np.full((n_rows, len(a)), EMPTY_SIGNATURE, dtype=np.uint32)
+    if not len(indices):
+        return signatures
+
+    hashed = (np.outer(indices.astype(np.uint64), a) + b) % MERSENNE_PRIME
+    nonempty = np.flatnonzero(np.diff(indptr) > 0)
+    signatures[nonempty] = np.minimum.reduceat(hashed, indptr[nonempty], axis=0)
+    return signatures
+
+
+class MinHashIndex:
+    """
+    MinHash signatures of each protein's GO term set, with an LSH band index.
+
+    Each band of signature rows is folded into a 64-bit key; the keys are
+    kept sorted per band, so proteins sharing a bucket with the query are
+    found with binary searches.
+    """
+
+    def __init__(self, signatures: np.ndarray, protein_ids: np.ndarray, terms: np.ndarray, bands: int = 64):
+        """
+        Create the LSH index from a signature matrix.
+
+        Args:
+            signatures: (proteins x permutations) uint32 MinHash signatures.
+            protein_ids: Protein ID for every signature row.
+            terms: GO term ID for every incidence column the signatures were built from.
+            bands: Number of LSH bands; must divide the number of permutations.
+        """
+        n_proteins, n_perm = signatures.shape
+        if n_perm % bands:
+            raise ValueError(f"{bands} bands do not divide {n_perm} permutations")
+
+        self.signatures = signatures
+        self.protein_ids = np.asarray(protein_ids, dtype=object)
+        self.terms = np.asarray(terms, dtype=object)
+        self.bands = bands
+        self.annotated = signatures[:, 0] != EMPTY_SIGNATURE
+
+        rows_per_band = n_perm // bands
+        self._keys = np.zeros((bands, n_proteins), dtype=np.uint64)
+        for band in range(bands):
+            for column in signatures[:, band * rows_per_band:(band + 1) * rows_per_band].T:
+                self._keys[band] = self._keys[band] * KEY_MULTIPLIER ^ column.astype(np.uint64)
+        self._order = np.argsort(self._keys, axis=1, kind="stable")
+        self._sorted_keys = np.take_along_axis(self._keys, self._order, axis=1)
+
+    @classmethod
+    def build(
+        cls,
+        incidence: sparse.csr_matrix,
+        protein_ids: np.ndarray,
+        terms: np.ndarray,
+        num_perm: int = 128,
+        bands: int = 64,
+        workers: Optional[int] = None,
+        chunk_size: int = 1000,
+        seed: int = 42,
+    ) -> "MinHashIndex":
+        """
+        Compute MinHash signatures in a process pool and build the index.
+
+        Args:
+            incidence: (proteins x GO terms) CSR incidence matrix.
+            protein_ids: Protein ID for every incidence row.
+            terms: GO term ID for every incidence column.
+            num_perm: Number of hash permutations.
+            bands: Number of LSH bands.
+            workers: Number of worker processes (None for all cores, 1 to run inline).
+            chunk_size: Number of proteins per task.
+            seed: Seed for the hash functions.
+
+        Returns:
+            A MinHashIndex.
+        """
+        rng = np.random.default_rng(seed)
+        a = rng.integers(1, int(MERSENNE_PRIME), num_perm, dtype=np.uint64)
+        b = rng.integers(0, int(MERSENNE_PRIME), num_perm, dtype=np.uint64)
+
+        chunks = []
+        for start in range(0, incidence.shape[0], chunk_size):
+            stop = min(start + chunk_size, incidence.shape[0])
+            lo, hi = incidence.indptr[start], incidence.indptr[stop]
+            chunks.append((incidence.indptr[start:stop + 1] - lo, incidence.indices[lo:hi]))
+
+        if workers == 1 or len(chunks) <= 1:
+            results = [_signature_chunk(indptr, indices, a, b) for indptr, indices in chunks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=process_context()) as pool:
+                results = list(pool.map(
+                    _signature_chunk,
+                    [indptr for indptr, _ in chunks],
+                    [indices for _, indices in chunks],
+                    [a] * len(chunks),
+                    [b] * len(chunks),
+                ))
+
+        signatures = np.vstack(results) if results else np.zeros((0, num_perm), dtype=np.uint32)
+        return cls(signatures, protein_ids, terms, bands=bands)
+
+    def save(self, path: Path):
+        """
+        Save the signatures to a .npz file.
+
+        Args:
+            path: Output file path.
+        """
+        np.savez_compressed(
+            path,
+            signatures=self.signatures,
+            protein_ids=self.protein_ids.astype(str),
+            terms=self.terms.astype(str),
+            bands=self.bands,
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> "MinHashIndex":
+        """
+        Load signatures saved with save() and rebuild the LSH index.
+
+        Args:
+            path: Path to the .npz file.
+
+        Returns:
+            A MinHashIndex.
+        """
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data['signatures'], data['protein_ids'], data['terms'], bands=int(data['bands']))
+
+    def candidates(self, row: int) -> np.ndarray:
+        """
+        Get proteins sharing at least one LSH bucket with a protein.
+
+        Args:
+            row: Protein row id.
+
+        Returns:
+            Array of candidate protein row ids, excluding the protein itself.
+        """
+        if not self.annotated[row]:
+            return np.array([], dtype=np.int64)
+
+        found = []
+        for band in range(self.bands):
+            key = self._keys[band, row]
+            lo = np.searchsorted(self._sorted_keys[band], key, side="left")
+            hi = np.searchsorted(self._sorted_keys[band], key, side="right")
+            found.append(self._order[band, lo:hi])
+
+        candidates = np.unique(np.concatenate(found))
+        return candidates[(candidates != row) & self.annotated[candidates]]
+
+    def similar(
+        self, row: int, incidence: sparse.csr_matrix, k: int = 10
+    ) -> List[Tuple[int, float, float]]:
+        """
+        Find the proteins with the most similar GO term sets.
+
+        Candidates come from the LSH buckets and are reranked by exact Jaccard.
+
+        Args:
+            row: Protein row id.
+            incidence: The (proteins x GO terms) CSR incidence matrix.
+            k: Number of proteins to return.
+
+        Returns:
+            A list of (protein row id, exact Jaccard, estimated Jaccard) tuples, best first.
+        """
+        candidates = self.candidates(row)
+        if not len(candidates):
+            return []
+
+        estimated = (self.signatures[candidates] == self.signatures[row]).mean(axis=1)
+
+        query = incidence[row]
+        overlap = np.asarray((incidence[candidates] @ query.T).todense()).ravel()
+        sizes = np.diff(incidence.indptr)[candidates]
+        exact = overlap / (sizes + query.nnz - overlap)
+
+        order = np.lexsort((-estimated, -exact))[:k]
+        return [(int(candidates[i]), float(exact[i]), float(estimated[i])) for i in order]
+
+    def matches(self, protein_ids: pd.Index, terms: pd.Index) -> bool:
+        """
+        Check whether the signatures were built for this protein and GO term layout.
+
+        Args:
+            protein_ids: Protein IDs by row id.
+            terms: GO term IDs by incidence column.
+
+        Returns:
+            True if the rows and columns line up.
+        """
+        return (
+            len(self.protein_ids) == len(protein_ids)
+            and len(self.terms) == len(terms)
+            and bool(np.all(self.protein_ids == np.asarray(protein_ids, dtype=object)))
+            and bool(np.all(self.terms == np.asarray(terms, dtype=object)))
+        )
+
+
+if __name__ == "__main__":
+    from src.data.loader import DataLoader
+
+    parser = argparse.ArgumentParser(description="Build MinHash signatures for GO term similarity")
+    parser.add_argument("--data-path", type=str, default="data", help="Directory containing the parquet files")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Number of worker processes")
+    parser.add_argument("--num-perm", type=int, default=128, help="Number of hash permutations")
+    parser.add_argument("--bands", type=int, default=64, help="Number of LSH bands")
+    args = parser.parse_args()
+
+    # Load without the offline indexes, so the signatures are only built once, below
+    loader = DataLoader(data_path=args.data_path, offline_indexes=False)
+    start = time.perf_counter()
+    index = MinHashIndex.build(
+        loader.go_enrichment.incidence,
+        loader.protein_index,
+        loader.go_enrichment.terms,
+        num_perm=args.num_perm,
+        bands=args.bands,
+        workers=args.workers,
+    )
+    output = Path(args.data_path) / SIGNATURE_FILE
+    index.save(output)
+    print(f"Built {index.signatures.shape} signatures with {args.workers} workers "
+          f"in {time.perf_counter() - start:.2f}s -> {output}")
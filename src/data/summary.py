@@ -0,0 +1,120 @@
+"""
+Materialized per-protein summary table, built once per dataset version.
+"""
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.data.features import FEATURE_LABELS, ProteinFeatures
+
+SUMMARY_FILE = "protein_summary.parquet"
+VERSION_KEY = b"dataset_version"
+
+
+def build_protein_summary(
+    protein_index: pd.Index,
+    id_to_details: Dict[str, Dict],
+    id_to_uuid: Dict[str, str],
+    features: ProteinFeatures,
+    edges: pd.DataFrame,
+    go_terms: pd.DataFrame,
+    functional_types: List[str],
+    top_n: int = 3,
+) -> pd.DataFrame:
+    """
+    Build the protein summary table.
+
+    Args:
+        protein_index: Protein IDs by row id.
+        id_to_details: Protein ID -> protein node details.
+        id_to_uuid: Protein ID -> UUID.
+        features: Feature columns aligned to protein row ids.
+        edges: The edges DataFrame.
+        go_terms: The GO term nodes DataFrame.
+        functional_types: Relationship types of functional annotation edges.
+        top_n: Number of highest-scoring GO terms to keep per protein.
+
+    Returns:
+        A DataFrame with one row per protein row id: protein_id, name, uuid,
+        the feature columns, and top_go_ids / top_go_names lists.
+    """
+    summary = pd.DataFrame({
+        'protein_id': protein_index,
+        'name': [id_to_details.get(p, {}).get('name') or p for p in protein_index],
+        'uuid': [id_to_uuid.get(p) for p in protein_index],
+    })
+    for name, values in features.columns.items():
+        summary[name] = values
+
+    # Highest-scoring annotations per protein, joined with the GO term nodes
+    annotations = edges.loc[
+        edges['relationship'].isin(functional_types), ['source', 'target', 'ML_prediction_score']
+    ]
+    annotations = annotations.merge(
+        go_terms[['id', 'external_id', 'name']].drop_duplicates('id'),
+        left_on='target',
+        right_on='id',
+    )
+    top = (
+        annotations.sort_values(
+            ['source', 'ML_prediction_score'], ascending=[True, False], na_position='last', kind='stable'
+        )
+        .groupby('source', sort=False)
+        .head(top_n)
+        .groupby('source', sort=False)
+        .agg(top_go_ids=('external_id', list), top_go_names=('name', list))
+    )
+    top = top.reindex(protein_index)
+    summary['top_go_ids'] = [ids if isinstance(ids, list) else [] for ids in top['top_go_ids']]
+    summary['top_go_names'] = [names if isinstance(names, list) else [] for names in top['top_go_names']]
+    return summary
+
+
+def save_protein_summary(summary: pd.DataFrame, path: Path, version: str):
+    """
+    Write the summary table to parquet, tagged with the dataset version.
+
+    Args:
+        summary: Table from build_protein_summary.
+        path: Output file path.
+        version: Dataset version the table was built from.
+    """
+    table = pa.Table.from_pandas(summary, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[VERSION_KEY] = version.encode()
+    pq.write_table(table.replace_schema_metadata(metadata), path)
+
+
+def load_protein_summary(path: Path, version: str) -> Optional[pd.DataFrame]:
+    """
+    Read a saved summary table if it was built from this dataset version.
+
+    Args:
+        path: Path to the parquet file.
+        version: Current dataset version.
+
+    Returns:
+        The summary table, or None if the file is missing or stale.
+    """
+    if not Path(path).exists():
+        return None
+    metadata = pq.read_schema(path).metadata or {}
+    if metadata.get(VERSION_KEY) != version.encode():
+        return None
+    return pq.read_table(path).to_pandas()
+
+
+def summary_features(summary: pd.DataFrame) -> ProteinFeatures:
+    """
+    Get the feature columns of a summary table.
+
+    Args:
+        summary: Table from build_protein_summary.
+
+    Returns:
+        A ProteinFeatures table over the same rows.
+    """
+    return ProteinFeatures({name: summary[name].to_numpy() for name in FEATURE_LABELS})
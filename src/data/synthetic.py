@@ -0,0 +1,391 @@
+"""
+Synthetic datasets with the schema of the four parquet files, at any scale.
+
+Scale 1 matches the size of the real dataset (27,768 proteins, 498,731
+edges); the generator is vectorised and writes in row groups, so 50x
+(1.4M proteins, 25M edges) fits in a few GB of memory:
+
+    python -m src.data.synthetic --output data_synth --scale 10 --seed 0
+
+The data reproduces the shapes the application has to cope with:
+
+- Interaction and annotation degrees follow power laws, so a few hub
+  proteins and GO terms have orders of magnitude more edges than the median.
+- Identifier collisions: isoforms of a locus share its TAIR secondary ID,
+  some names are reused by unrelated proteins, ambiguous secondary IDs are
+  shared by small groups, and a few secondary IDs equal another protein's name.
+- Missing records: proteins without an ID record or a name or sequence,
+  proteins that only appear in edges, and ID records of proteins that have
+  no node.
+"""
+import argparse
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Size of the real dataset, i.e. scale 1
+BASE_PROTEINS = 27_768
+BASE_EDGES = 498_731
+BASE_GO_TERMS = 9_594
+
+# Fraction of edges that are functional annotations (the rest are protein-protein interactions)
+ANNOTATION_FRACTION = 0.6
+
+# Power law exponents of the rank-ordered weights: protein interaction and
+# annotation degree, and GO term popularity
+INTERACTION_EXPONENT = 0.6
+ANNOTATION_EXPONENT = 0.5
+GO_TERM_EXPONENT = 0.8
+
+# Default rates of the irregular cases, as fractions of the proteins
+COLLISION_RATES = {
+    'shared_name': 0.01,  # Name reused from an unrelated protein
+    'ambiguous': 0.1,  # Has an ambiguous secondary ID shared with ~3 proteins
+    'name_as_secondary': 0.002,  # Has a secondary ID equal to another protein's name
+}
+MISSING_RATES = {
+    'record': 0.05,  # Node without an ID record
+    'name': 0.005,  # Node without a name
+    'sequence': 0.002,  # Node without a sequence
+    'edge_only': 0.002,  # Extra proteins that only appear in interaction edges
+    'orphan_record': 0.001,  # Extra ID records without a node
+}
+
+# Amino acid background frequencies (UniProtKB/Swiss-Prot)
+AMINO_ACIDS = np.frombuffer(b"ARNDCQEGHILKMFPSTWYV", dtype=np.uint8)
+AMINO_ACID_FREQUENCIES = np.array([
+    8.25, 5.53, 4.06, 5.45, 1.37, 3.93, 6.75, 7.07, 2.27, 5.96,
+    9.66, 5.84, 2.42, 3.86, 4.70, 6.56, 5.34, 1.08, 2.92, 6.87,
+])
+AMINO_ACID_FREQUENCIES = AMINO_ACID_FREQUENCIES / AMINO_ACID_FREQUENCIES.sum()
+
+# Proteins and edges generated per parquet row group
+PROTEIN_CHUNK = 100_000
+EDGE_CHUNK = 2_000_000
+
+# GO node types and their share of the real go_term_nodes
+GO_NODE_TYPES = {'MolecularFunction': 0.46, 'BiologicalProcess': 0.44, 'CellularComponent': 0.10}
+INTERACTION = 'Protein-Protein-ProteinProteinInteraction'
+CHROMOSOMES = np.array(['1', '2', '3', '4', '5', 'C', 'M'])
+
+
+def _uuids(rng: np.random.Generator, n: int) -> np.ndarray:
+    """Generate n random UUID strings shaped like the dataset's (version 5, RFC 4122 variant)."""
+    raw = np.frombuffer(rng.bytes(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x50
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+    uuids = []
+    for row in raw:
+        h = row.tobytes().hex()
+        uuids.append(f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}")
+    return np.array(uuids, dtype=object)
+
+
+def _power_law_weights(rng: np.random.Generator, n: int, exponent: float) -> np.ndarray:
+    """Sampling probabilities proportional to rank^-exponent, in random order."""
+    weights = np.arange(1, n + 1, dtype=np.float64) ** -exponent
+    rng.shuffle(weights)
+    return weights / weights.sum()
+
+
+def _dictionary_array(codes: np.ndarray, dictionary: pa.Array) -> pa.DictionaryArray:
+    """Wrap codes into a dictionary-encoded string column (None for code -1)."""
+    indices = pa.array(codes.astype(np.int32), mask=codes < 0)
+    return pa.DictionaryArray.from_arrays(indices, dictionary)
+
+
+def generate_go_terms(rng: np.random.Generator, count: int = BASE_GO_TERMS) -> pd.DataFrame:
+    """
+    Generate GO term nodes with the columns of go_term_nodes.parquet.
+
+    Args:
+        rng: Random generator.
+        count: Number of terms.
+
+    Returns:
+        The GO term DataFrame.
+    """
+    node_types = rng.choice(list(GO_NODE_TYPES), size=count, p=list(GO_NODE_TYPES.values()))
+    numbers = rng.choice(np.arange(1, 2_200_000), size=count, replace=False)
+    return pd.DataFrame({
+        'id': [f"{node_type}::{uuid}" for node_type, uuid in zip(node_types, _uuids(rng, count))],
+        'date': pd.Timestamp('2024-12-26 19:12:39'),
+        'name': [f"synthetic {node_type} term {i}" for i, node_type in enumerate(node_types)],
+        'external_id': [f"GO:{number:07d}" for number in numbers],
+        'dataset': [['GENE_ONTOLOGY'] for _ in range(count)],
+        'description': [f"Synthetic {node_type} term {i}." for i, node_type in enumerate(node_types)],
+        'node_type': node_types,
+    })
+
+
+def _protein_names(rng: np.random.Generator, n: int, shared_name_rate: float, missing_name_rate: float) -> np.ndarray:
+    """
+    Generate Arabidopsis-style protein names (AT1G01010.1), isoforms sharing a locus.
+
+    Returns:
+        Object array of names, with None for the proteins missing one.
+    """
+    # 1-4 isoforms per locus, mostly 1
+    isoforms = np.minimum(rng.geometric(0.7, size=n), 4)
+    loci = np.repeat(np.arange(n), isoforms)[:n]
+    isoform_numbers = np.concatenate([np.arange(1, k + 1) for k in isoforms])[:n]
+
+    chromosomes = CHROMOSOMES[rng.choice(len(CHROMOSOMES), size=n, p=[0.2, 0.15, 0.18, 0.15, 0.2, 0.06, 0.06])]
+    locus_numbers = rng.permutation(n * 10)[:n]  # Unique per locus index
+    names = np.array(
+        [f"AT{chromosomes[locus]}G{locus_numbers[locus] % 100_000:05d}.{isoform}"
+         for locus, isoform in zip(loci, isoform_numbers)],
+        dtype=object,
+    )
+    # Unrelated proteins reusing another protein's name
+    shared = rng.random(n) < shared_name_rate
+    names[shared] = names[rng.integers(0, n, size=int(shared.sum()))]
+    names[rng.random(n) < missing_name_rate] = None
+    return names
+
+
+def _sequences(rng: np.random.Generator, n: int) -> list:
+    """Generate n amino acid sequences with log-normal lengths (median 350)."""
+    lengths = np.clip(rng.lognormal(np.log(350), 0.55, size=n), 20, 5000).astype(np.int64)
+    residues = AMINO_ACIDS[rng.choice(len(AMINO_ACIDS), size=int(lengths.sum()), p=AMINO_ACID_FREQUENCIES)]
+    text = residues.tobytes().decode('ascii')
+    ends = np.cumsum(lengths)
+    return [text[end - length:end] for end, length in zip(ends, lengths)]
+
+
+def _sample_edges(
+    rng: np.random.Generator,
+    count: int,
+    source_weights: np.ndarray,
+    target_weights: np.ndarray,
+    allow_self: bool = True,
+) -> np.ndarray:
+    """
+    Draw distinct (source, target) index pairs with the given endpoint weights.
+
+    Duplicate pairs are dropped, so a small surplus is drawn and the result
+    trimmed to count (fewer only if the weights are too concentrated).
+
+    Returns:
+        An int64 array of shape (pairs, 2).
+    """
+    n_targets = len(target_weights)
+    keys = np.empty(0, dtype=np.int64)
+    draw = int(count * 1.05) + 16
+    for _ in range(8):
+        sources = rng.choice(len(source_weights), size=draw, p=source_weights)
+        targets = rng.choice(n_targets, size=draw, p=target_weights)
+        if not allow_self:
+            keep = sources != targets
+            sources, targets = sources[keep], targets[keep]
+        keys = np.unique(np.concatenate([keys, sources.astype(np.int64) * n_targets + targets]))
+        if len(keys) >= count:
+            break
+        draw = int((count - len(keys)) * 1.5) + 16
+    keys = rng.permutation(keys)[:count]
+    keys.sort()
+    return np.column_stack([keys // n_targets, keys % n_targets])
+
+
+def generate_dataset(
+    output: str,
+    scale: float = 1.0,
+    seed: int = 0,
+    go_terms_path: Optional[str] = 'data/go_term_nodes.parquet',
+    annotation_fraction: float = ANNOTATION_FRACTION,
+    collision_rates: Optional[Dict[str, float]] = None,
+    missing_rates: Optional[Dict[str, float]] = None,
+) -> Dict:
+    """
+    Write a synthetic dataset: the four parquet files, in output.
+
+    Args:
+        output: Directory to write to (created if missing; existing files are replaced).
+        scale: Size relative to the real dataset (1 = 27,768 proteins and 498,731 edges).
+        seed: Random seed; the same seed and settings give the same files.
+        go_terms_path: GO term nodes to reuse, if the file exists; otherwise
+            BASE_GO_TERMS terms are generated. The ontology does not grow with scale.
+        annotation_fraction: Fraction of edges that are functional annotations.
+        collision_rates: Overrides of COLLISION_RATES.
+        missing_rates: Overrides of MISSING_RATES.
+
+    Returns:
+        A summary: row counts, degree statistics and the number of each irregular case.
+    """
+    collisions = {**COLLISION_RATES, **(collision_rates or {})}
+    missing = {**MISSING_RATES, **(missing_rates or {})}
+    rng = np.random.default_rng(seed)
+    out = Path(output)
+    out.mkdir(parents=True, exist_ok=True)
+
+    n_proteins = max(int(round(BASE_PROTEINS * scale)), 10)
+    n_edges = max(int(round(BASE_EDGES * scale)), 10)
+    n_edge_only = int(round(n_proteins * missing['edge_only']))
+    n_orphan_records = int(round(n_proteins * missing['orphan_record']))
+
+    # GO terms
+    if go_terms_path and Path(go_terms_path).exists():
+        go_terms = pd.read_parquet(go_terms_path)
+    else:
+        go_terms = generate_go_terms(rng)
+    go_terms.to_parquet(out / 'go_term_nodes.parquet', index=False)
+
+    # Protein IDs: nodes first, then edge-only proteins, then proteins that only have an ID record
+    uuids = _uuids(rng, n_proteins + n_edge_only + n_orphan_records)
+    protein_ids = np.array([f"Protein::{uuid}" for uuid in uuids], dtype=object)
+    names = _protein_names(rng, n_proteins + n_orphan_records, collisions['shared_name'], missing['name'])
+
+    # protein_nodes, in row groups
+    schema = pa.schema([('id', pa.string()), ('name', pa.string()), ('sequence', pa.string())])
+    missing_sequence = rng.random(n_proteins) < missing['sequence']
+    with pq.ParquetWriter(out / 'protein_nodes.parquet', schema) as writer:
+        for start in range(0, n_proteins, PROTEIN_CHUNK):
+            stop = min(start + PROTEIN_CHUNK, n_proteins)
+            sequences = _sequences(rng, stop - start)
+            for i in np.flatnonzero(missing_sequence[start:stop]):
+                sequences[i] = None
+            writer.write_table(pa.table({
+                'id': pa.array(protein_ids[start:stop], pa.string()),
+                'name': pa.array(names[start:stop], pa.string()),
+                'sequence': pa.array(sequences, pa.string()),
+            }, schema=schema))
+
+    # protein_id_records: nodes with a record, plus the orphan records
+    has_record = np.concatenate([rng.random(n_proteins) >= missing['record'], np.zeros(n_edge_only, dtype=bool)])
+    record_rows = np.concatenate([np.flatnonzero(has_record), n_proteins + n_edge_only + np.arange(n_orphan_records)])
+    record_names = np.concatenate([names[:n_proteins], np.full(n_edge_only, None, dtype=object), names[n_proteins:]])
+
+    n_ambiguous = max(int(len(record_rows) * collisions['ambiguous'] / 3), 1)
+    ambiguous = rng.random(len(record_rows)) < collisions['ambiguous']
+    ambiguous_groups = rng.integers(0, n_ambiguous, size=len(record_rows))
+    name_as_secondary = rng.random(len(record_rows)) < collisions['name_as_secondary']
+    named = np.flatnonzero(pd.notna(names))
+    borrowed_names = names[named[rng.integers(0, len(named), size=len(record_rows))]]
+    accessions = rng.choice(36 ** 7, size=len(record_rows), replace=False)
+
+    secondary_ids, ambiguous_ids = [], []
+    for i, row in enumerate(record_rows):
+        name = record_names[row]
+        ids = [f"UNIPROT_ACCESSION:A0A{np.base_repr(accessions[i], 36).rjust(7, '0')}"]
+        if name:
+            ids.insert(0, f"TAIR:{name.split('.')[0]}")  # Shared by the locus' isoforms
+        if name_as_secondary[i]:
+            ids.append(borrowed_names[i])
+        secondary_ids.append(ids)
+        ambiguous_ids.append([f"GENE_SYMBOL:SYN{ambiguous_groups[i]}"] if ambiguous[i] else [])
+
+    pd.DataFrame({
+        'uuid': uuids[record_rows],
+        'external_id': protein_ids[record_rows],
+        'secondary_ids': secondary_ids,
+        'ambiguous_secondary_ids': ambiguous_ids,
+    }).to_parquet(out / 'protein_id_records.parquet', index=False)
+
+    # Edges: annotations from node proteins to GO terms, interactions between all edge proteins
+    n_annotations = int(round(n_edges * annotation_fraction))
+    annotations = _sample_edges(
+        rng, n_annotations,
+        _power_law_weights(rng, n_proteins, ANNOTATION_EXPONENT),
+        _power_law_weights(rng, len(go_terms), GO_TERM_EXPONENT),
+    )
+    interaction_weights = _power_law_weights(rng, n_proteins + n_edge_only, INTERACTION_EXPONENT)
+    interactions = _sample_edges(rng, n_edges - len(annotations), interaction_weights, interaction_weights, allow_self=False)
+
+    # Dictionary-encoded endpoints: protein IDs followed by GO term IDs
+    endpoints = pa.array(np.concatenate([protein_ids[:n_proteins + n_edge_only], go_terms['id'].to_numpy(dtype=object)]), pa.string())
+    term_offset = n_proteins + n_edge_only
+    relationships = pa.array([f"{node_type}-Protein-FunctionalAnnotation" for node_type in GO_NODE_TYPES] + [INTERACTION])
+    relationship_codes = {node_type: i for i, node_type in enumerate(GO_NODE_TYPES)}
+    term_relationships = go_terms['node_type'].map(relationship_codes).fillna(0).to_numpy(dtype=np.int64)
+
+    schema = pa.schema([
+        ('source', pa.dictionary(pa.int32(), pa.string())),
+        ('target', pa.dictionary(pa.int32(), pa.string())),
+        ('relationship', pa.dictionary(pa.int32(), pa.string())),
+        ('ML_prediction_score', pa.float64()),
+        ('string_combined_score', pa.float64()),
+    ])
+    with pq.ParquetWriter(out / 'edges.parquet', schema) as writer:
+        for pairs, is_annotation in ((annotations, True), (interactions, False)):
+            for start in range(0, len(pairs), EDGE_CHUNK):
+                chunk = pairs[start:start + EDGE_CHUNK]
+                size = len(chunk)
+                if is_annotation:
+                    targets = chunk[:, 1] + term_offset
+                    relationship = term_relationships[chunk[:, 1]]
+                    ml_scores = np.round(rng.beta(5, 2, size=size), 4)
+                    string_scores = np.full(size, np.nan)
+                else:
+                    targets = chunk[:, 1]
+                    relationship = np.full(size, len(GO_NODE_TYPES))
+                    ml_scores = np.full(size, np.nan)
+                    string_scores = np.round(150 + 849 * rng.beta(1.2, 3, size=size))
+                writer.write_table(pa.table({
+                    'source': _dictionary_array(chunk[:, 0], endpoints),
+                    'target': _dictionary_array(targets, endpoints),
+                    'relationship': _dictionary_array(relationship, relationships),
+                    'ML_prediction_score': pa.array(ml_scores, mask=np.isnan(ml_scores)),
+                    'string_combined_score': pa.array(string_scores, mask=np.isnan(string_scores)),
+                }, schema=schema))
+
+    interaction_degree = np.bincount(interactions.ravel(), minlength=n_proteins + n_edge_only)
+    annotation_degree = np.bincount(annotations[:, 0], minlength=n_proteins)
+    term_degree = np.bincount(annotations[:, 1], minlength=len(go_terms))
+    name_counts = pd.Series(names[:n_proteins]).dropna().value_counts()
+
+    return {
+        'output': str(out),
+        'scale': scale,
+        'seed': seed,
+        'proteins': n_proteins,
+        'go_terms': len(go_terms),
+        'edges': len(annotations) + len(interactions),
+        'annotation_edges': len(annotations),
+        'interaction_edges': len(interactions),
+        'id_records': len(record_rows),
+        'interaction_degree': {
+            'median': float(np.median(interaction_degree)),
+            'p99': float(np.percentile(interaction_degree, 99)),
+            'max': int(interaction_degree.max()),
+        },
+        'annotations_per_protein': {
+            'median': float(np.median(annotation_degree)),
+            'max': int(annotation_degree.max()),
+            'none': int((annotation_degree == 0).sum()),
+        },
+        'proteins_per_go_term': {'median': float(np.median(term_degree)), 'max': int(term_degree.max())},
+        'shared_names': int((name_counts > 1).sum()),
+        'ambiguous_ids': int(len(np.unique(ambiguous_groups[ambiguous]))),
+        'names_as_secondary_ids': int(name_as_secondary.sum()),
+        'proteins_without_record': int(n_proteins - has_record.sum()),
+        'proteins_without_name': int(pd.isna(names[:n_proteins]).sum()),
+        'proteins_without_sequence': int(missing_sequence.sum()),
+        'edge_only_proteins': n_edge_only,
+        'records_without_node': n_orphan_records,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic dataset with the schema of the parquet files")
+    parser.add_argument("--output", type=str, required=True, help="Directory to write the parquet files to")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help=f"Size relative to the real dataset ({BASE_PROTEINS:,} proteins, {BASE_EDGES:,} edges)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--go-terms", type=str, default="data/go_term_nodes.parquet",
+                        help="GO term nodes to reuse (generated if the file does not exist)")
+    parser.add_argument("--annotation-fraction", type=float, default=ANNOTATION_FRACTION,
+                        help="Fraction of edges that are functional annotations")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    summary = generate_dataset(args.output, args.scale, args.seed, args.go_terms, args.annotation_fraction)
+    print(f"Wrote {summary['proteins']:,} proteins, {summary['go_terms']:,} GO terms, {summary['edges']:,} edges "
+          f"and {summary['id_records']:,} ID records to {summary['output']} in {time.perf_counter() - start:.1f}s")
+    for key, value in summary.items():
+        if key not in ('output', 'scale', 'seed', 'proteins', 'go_terms', 'edges', 'id_records'):
+            print(f"  {key}: {value}")
@@ -0,0 +1,158 @@
+"""
+Full-text search index over GO term names and definitions.
+"""
+import math
+import re
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into case-folded alphanumeric tokens.
+
+    Args:
+        text: The text to tokenize.
+
+    Returns:
+        A list of tokens.
+    """
+    if not isinstance(text, str):
+        return []
+    return TOKEN_PATTERN.findall(text.casefold())
+
+
+class GoTermTextIndex:
+    """
+    Inverted index over GO term names and descriptions with BM25 ranking.
+
+    The vocabulary is kept sorted and the postings are stored as one flat
+    array ordered by token, so the postings for a prefix are a single
+    contiguous slice. Matches in the name count more than matches in the
+    description.
+    """
+
+    NAME_WEIGHT = 3.0
+    DESCRIPTION_WEIGHT = 1.0
+    PREFIX_DISCOUNT = 0.8
+    EXACT_NAME_BOOST = 2.0
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, go_terms: pd.DataFrame):
+        """
+        Build the index.
+
+        Args:
+            go_terms: The GO terms DataFrame (needs 'name', optionally 'description').
+        """
+        names = go_terms['name'].tolist()
+        if 'description' in go_terms.columns:
+            descriptions = go_terms['description'].tolist()
+        else:
+            descriptions = [None] * len(names)
+
+        self.size = len(names)
+        self._name_rows = defaultdict(list)
+        for i, name in enumerate(names):
+            self._name_rows[" ".join(tokenize(name))].append(i)
+
+        term_frequencies = []
+        lengths = np.zeros(self.size)
+        document_frequency = Counter()
+        for i, (name, description) in enumerate(zip(names, descriptions)):
+            frequencies = defaultdict(float)
+            for token in tokenize(name):
+                frequencies[token] += self.NAME_WEIGHT
+            for token in tokenize(description):
+                frequencies[token] += self.DESCRIPTION_WEIGHT
+            term_frequencies.append(frequencies)
+            lengths[i] = sum(frequencies.values())
+            document_frequency.update(frequencies.keys())
+
+        average_length = lengths.mean() if self.size else 1.0
+
+        postings = defaultdict(list)
+        for i, frequencies in enumerate(term_frequencies):
+            norm = self.K1 * (1 - self.B + self.B * lengths[i] / average_length)
+            for token, tf in frequencies.items():
+                postings[token].append((i, tf * (self.K1 + 1) / (tf + norm)))
+
+        self.vocabulary = sorted(postings)
+        offsets = [0]
+        rows, weights = [], []
+        for token in self.vocabulary:
+            df = document_frequency[token]
+            idf = math.log(1 + (self.size - df + 0.5) / (df + 0.5))
+            for row, weight in postings[token]:
+                rows.append(row)
+                weights.append(weight * idf)
+            offsets.append(len(rows))
+
+        self._offsets = np.asarray(offsets, dtype=np.int64)
+        self._rows = np.asarray(rows, dtype=np.int32)
+        self._weights = np.asarray(weights, dtype=np.float32)
+
+    def _token_range(self, token: str) -> Tuple[int, int, bool]:
+        """Get the vocabulary range for a prefix, and whether it starts with an exact match."""
+        lo = bisect_left(self.vocabulary, token)
+        hi = bisect_left(self.vocabulary, token + "￿", lo)
+        exact = lo < len(self.vocabulary) and self.vocabulary[lo] == token
+        return lo, hi, exact
+
+    def search(self, query: str, limit: int = 20, prefix: bool = True) -> List[Tuple[int, float]]:
+        """
+        Search for GO terms matching every token of the query.
+
+        Args:
+            query: Free-text query (e.g. "kinase activ").
+            limit: Maximum number of results to return.
+            prefix: Whether query tokens also match longer tokens starting with them.
+
+        Returns:
+            A list of (row position, relevance score) tuples, best first.
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or not self.size:
+            return []
+
+        scores = np.zeros(self.size, dtype=np.float32)
+        matched = np.ones(self.size, dtype=bool)
+        for token in tokens:
+            lo, hi, exact = self._token_range(token)
+            if not prefix:
+                hi = lo + 1 if exact else lo
+            if lo == hi:
+                return []
+
+            token_scores = np.zeros(self.size, dtype=np.float32)
+            start = self._offsets[lo]
+            if exact:
+                exact_end = self._offsets[lo + 1]
+                token_scores[self._rows[start:exact_end]] = self._weights[start:exact_end]
+                start = exact_end
+            end = self._offsets[hi]
+            np.maximum.at(
+                token_scores, self._rows[start:end], self._weights[start:end] * self.PREFIX_DISCOUNT
+            )
+
+            matched &= token_scores > 0
+            scores += token_scores
+
+        # Rank a term whose whole name is the query above partial matches
+        exact_rows = self._name_rows.get(" ".join(tokenize(query)), [])
+        scores[exact_rows] *= self.EXACT_NAME_BOOST
+
+        candidates = np.flatnonzero(matched)
+        if not len(candidates):
+            return []
+
+        candidate_scores = scores[candidates].astype(float)
+        order = np.argsort(-candidate_scores, kind="stable")[:limit]
+        return [(int(candidates[j]), float(candidate_scores[j])) for j in order]
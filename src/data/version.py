@@ -0,0 +1,68 @@
+"""
+Dataset version identifiers derived from the contents of the data files.
+"""
+import hashlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional
+
+# Parquet files that make up a dataset
+DATA_FILES = [
+    "protein_nodes.parquet",
+    "go_term_nodes.parquet",
+    "edges.parquet",
+    "protein_id_records.parquet",
+]
+
+
+def dataset_version(data_path: Path, files: Iterable[str] = DATA_FILES, chunk_size: int = 1 << 20) -> str:
+    """
+    Hash the contents of the dataset files.
+
+    Args:
+        data_path: Directory containing the files.
+        files: File names to include, in a fixed order.
+        chunk_size: Number of bytes read at a time.
+
+    Returns:
+        A hex digest that changes whenever any file's contents change.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for name in files:
+        path = Path(data_path) / name
+        digest.update(name.encode())
+        if not path.exists():
+            continue
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dataset_modified(data_path: Path, files: Iterable[str] = DATA_FILES) -> Optional[datetime]:
+    """
+    Get the latest modification time of the dataset files.
+
+    Args:
+        data_path: Directory containing the files.
+        files: File names to include.
+
+    Returns:
+        The newest modification time in UTC, or None if no file exists.
+    """
+    times = [(Path(data_path) / name).stat().st_mtime for name in files if (Path(data_path) / name).exists()]
+    return datetime.fromtimestamp(max(times), tz=timezone.utc) if times else None
+
+
+def chain_version(version: str, delta_version: str) -> str:
+    """
+    Derive the version of a dataset after applying a delta.
+
+    Args:
+        version: Version of the dataset before the delta.
+        delta_version: Content hash of the delta files.
+
+    Returns:
+        A hex digest identifying the combined dataset.
+    """
+    return hashlib.blake2b(f"{version}+{delta_version}".encode(), digest_size=16).hexdigest()
@@ -0,0 +1,97 @@
+"""
+GO enrichment page for the Dash application.
+"""
+from typing import Dict
+
+import dash_bootstrap_components as dbc
+from dash import dash_table, dcc, html
+
+
+def create_enrichment_page():
+    """
+    Create the GO enrichment page layout.
+
+    Returns:
+        A Dash HTML layout
+    """
+    return html.Div(
+        [
+            html.H1("GO Enrichment Analysis", className="mb-4"),
+            html.P(
+                "Find GO terms over-represented in a set of proteins, compared with all annotated proteins.",
+                className="lead",
+            ),
+            dbc.Card(
+                dbc.CardBody(
+                    [
+                        dbc.Textarea(
+                            id="enrichment-input",
+                            placeholder="Paste protein IDs or identifiers, one per line...",
+                            rows=8,
+                            className="mb-2",
+                        ),
+                        dcc.Upload(
+                            id="enrichment-upload",
+                            children=html.Div(["Or drag and drop / ", html.A("select a text file")]),
+                            className="border border-secondary rounded text-center p-2 mb-2",
+                        ),
+                        dbc.Button("Run Enrichment", id="enrichment-button", color="primary"),
+                    ]
+                ),
+                className="mb-4",
+            ),
+            dbc.Spinner(html.Div(id="enrichment-results"), color="primary"),
+        ]
+    )
+
+
+def create_enrichment_results(enrichment: Dict):
+    """
+    Create a table of GO enrichment results.
+
+    Args:
+        enrichment: Dictionary returned by DataLoader.enrich_go_terms
+
+    Returns:
+        A Dash component with the enrichment summary and results table
+    """
+    terms = enrichment.get("terms", [])
+    unmapped = enrichment.get("unmapped", [])
+
+    summary = [
+        html.P(
+            f"{enrichment.get('study_size', 0)} annotated proteins in the set, "
+            f"tested against {enrichment.get('population_size', 0)} annotated proteins."
+        ),
+    ]
+    if unmapped:
+        summary.append(
+            html.P(
+                f"{len(unmapped)} identifiers could not be mapped: {', '.join(unmapped[:10])}"
+                + (" ..." if len(unmapped) > 10 else ""),
+                className="text-warning",
+            )
+        )
+
+    return html.Div(
+        summary + [
+            dash_table.DataTable(
+                data=terms,
+                columns=[
+                    {"name": "GO ID", "id": "go_id"},
+                    {"name": "Name", "id": "name"},
+                    {"name": "Namespace", "id": "namespace"},
+                    {"name": "In Set", "id": "study_count", "type": "numeric"},
+                    {"name": "Annotated", "id": "population_count", "type": "numeric"},
+                    {"name": "Fold", "id": "fold_enrichment", "type": "numeric", "format": {"specifier": ".2f"}},
+                    {"name": "P-value", "id": "p_value", "type": "numeric", "format": {"specifier": ".2e"}},
+                    {"name": "FDR", "id": "q_value", "type": "numeric", "format": {"specifier": ".2e"}},
+                ],
+                style_table={"overflowX": "auto"},
+                style_cell={"textAlign": "left"},
+                style_header={"fontWeight": "bold"},
+                sort_action="native",
+                page_size=20,
+            ) if terms else html.P("No enriched GO terms found."),
+        ]
+    )
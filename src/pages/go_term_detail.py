@@ -3,14 +3,17 @@ from dash import html, dcc, callback, Input, Output, State
 import dash_bootstrap_components as dbc
 from typing import Dict, List
 from src.components.go_term_card import create_go_term_proteins_list
+from src.components.search import create_export_links
 
-def create_go_term_detail_page(go_term_data: Dict, associated_proteins: List[Dict]):
+def create_go_term_detail_page(go_term_data: Dict, associated_proteins: List[Dict], page: int = 1, page_size: int = 50):
     """
     Create the GO term detail page layout.
     
     Args:
         go_term_data: Dictionary containing GO term information.
-        associated_proteins: List of proteins associated with the GO term.
+        associated_proteins: The current page of proteins associated with the GO term.
+        page: The current page number (1-based).
+        page_size: Number of proteins shown per page.
         
     Returns:
         A Dash component representing the GO term detail page.
@@ -27,6 +30,8 @@ def create_go_term_detail_page(go_term_data: Dict, associated_proteins: List[Dic
     go_id = go_term_data.get('go_id', 'N/A')
     name = go_term_data.get('name', 'N/A')
     namespace = go_term_data.get('namespace', 'N/A')
+    total = go_term_data.get('protein_count', len(associated_proteins))
+    max_page = max(1, -(-total // page_size))
     
     # Create header
     header = html.Div([
@@ -39,11 +44,23 @@ def create_go_term_detail_page(go_term_data: Dict, associated_proteins: List[Dic
     ])
     
     # Create proteins section
+    first = (page - 1) * page_size + 1 if associated_proteins else 0
+    last = (page - 1) * page_size + len(associated_proteins)
     proteins_section = html.Div([
-        html.H3(f"Associated Proteins ({len(associated_proteins)})", className="mb-3"),
+        html.H3(f"Associated Proteins ({total})", className="mb-3"),
+        html.P(f"Showing {first}-{last} of {total}, sorted by score.", className="text-muted"),
+        create_export_links(f"/api/export/go/{go_id}"),
         html.Div([
             create_go_term_proteins_list(associated_proteins)
         ]),
+        dbc.Pagination(
+            id="go-term-pagination",
+            active_page=page,
+            max_value=max_page,
+            first_last=True,
+            previous_next=True,
+            fully_expanded=False,
+        ) if max_page > 1 else html.Div(),
     ])
     
     # Create page
@@ -1,11 +1,14 @@
 """
 Protein detail page for the Dash application.
 """
+from urllib.parse import quote
+
 import dash_bootstrap_components as dbc
 import dash_cytoscape as cyto
 from dash import html
 
-from src.components.protein_card import create_protein_card
+from src.components.protein_card import create_protein_card, create_similar_proteins_card
+from src.components.search import create_export_links
 
 
 def create_protein_detail_page(protein_details=None):
@@ -130,6 +133,7 @@ def create_protein_detail_page(protein_details=None):
                 elements=nodes + edges,
                 stylesheet=cyto_stylesheet,
             ),
+            create_export_links(f"/api/export/interactions?protein_id={quote(main_id)}"),
         ],
         className="mt-4 mb-4",
     ) if interactions else html.Div()
@@ -155,7 +159,11 @@ def create_protein_detail_page(protein_details=None):
                 [
                     # Protein details card
                     dbc.Col(
-                        create_protein_card(protein_details),
+                        [
+                            create_protein_card(protein_details),
+                            create_similar_proteins_card(protein_details["similar_proteins"])
+                            if "similar_proteins" in protein_details else html.Div(),
+                        ],
                         width=12,
                         lg=6,
                     ),
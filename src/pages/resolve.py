@@ -0,0 +1,127 @@
+"""
+Bulk identifier mapping page for the Dash application.
+"""
+from typing import Dict
+
+import dash_bootstrap_components as dbc
+from dash import dash_table, dcc, html
+
+# Rows shown per table; the full mapping is available as a download
+PREVIEW_ROWS = 1000
+
+
+def create_resolve_page():
+    """
+    Create the identifier mapping page layout.
+
+    Returns:
+        A Dash HTML layout
+    """
+    return html.Div(
+        [
+            html.H1("Identifier Mapping", className="mb-4"),
+            html.P(
+                "Map a list of protein names, UUIDs, secondary or ambiguous identifiers to protein IDs.",
+                className="lead",
+            ),
+            dbc.Card(
+                dbc.CardBody(
+                    [
+                        dbc.Textarea(
+                            id="resolve-input",
+                            placeholder="Paste identifiers, one per line...",
+                            rows=8,
+                            className="mb-2",
+                        ),
+                        dcc.Upload(
+                            id="resolve-upload",
+                            children=html.Div(["Or drag and drop / ", html.A("select a text file")]),
+                            className="border border-secondary rounded text-center p-2 mb-2",
+                        ),
+                        dbc.Button("Map Identifiers", id="resolve-button", color="primary", className="me-2"),
+                        dbc.Button("Download CSV", id="resolve-download-button", color="secondary"),
+                        dcc.Download(id="resolve-download"),
+                    ]
+                ),
+                className="mb-4",
+            ),
+            dbc.Spinner(html.Div(id="resolve-results"), color="primary"),
+        ]
+    )
+
+
+def create_resolve_results(resolution: Dict):
+    """
+    Create tables of resolved, ambiguous and unresolved identifiers.
+
+    Args:
+        resolution: Dictionary returned by DataLoader.resolve_identifiers
+
+    Returns:
+        A Dash component with the mapping summary and result tables
+    """
+    resolved = resolution.get("resolved", [])
+    ambiguous = [
+        {"identifier": item["identifier"], "protein_ids": ", ".join(item["protein_ids"])}
+        for item in resolution.get("ambiguous", [])[:PREVIEW_ROWS]
+    ]
+    unresolved = [{"identifier": identifier} for identifier in resolution.get("unresolved", [])[:PREVIEW_ROWS]]
+
+    def table(data, columns):
+        return dash_table.DataTable(
+            data=data,
+            columns=[{"name": name, "id": column} for column, name in columns],
+            style_table={"overflowX": "auto"},
+            style_cell={"textAlign": "left"},
+            style_header={"fontWeight": "bold"},
+            page_size=20,
+        )
+
+    counts = [len(resolved), len(resolution.get("ambiguous", [])), len(resolution.get("unresolved", []))]
+    summary = f"{counts[0]} resolved, {counts[1]} ambiguous, {counts[2]} unresolved."
+    if max(counts) > PREVIEW_ROWS:
+        summary += f" Tables show the first {PREVIEW_ROWS} rows; download the CSV for all."
+
+    return html.Div(
+        [
+            html.P(summary),
+            dbc.Tabs(
+                [
+                    dbc.Tab(
+                        table(resolved[:PREVIEW_ROWS], [("identifier", "Identifier"), ("protein_id", "Protein ID")]),
+                        label="Resolved",
+                    ),
+                    dbc.Tab(
+                        table(ambiguous, [("identifier", "Identifier"), ("protein_ids", "Protein IDs")]),
+                        label="Ambiguous",
+                    ),
+                    dbc.Tab(table(unresolved, [("identifier", "Identifier")]), label="Unresolved"),
+                ]
+            ),
+        ]
+    )
+
+
+def resolution_to_csv(resolution: Dict) -> str:
+    """
+    Flatten a resolution into CSV text with one row per identifier and protein.
+
+    Args:
+        resolution: Dictionary returned by DataLoader.resolve_identifiers
+
+    Returns:
+        CSV text with identifier, status and protein_id columns
+    """
+    lines = ["identifier,status,protein_id"]
+
+    def quote(value):
+        return '"' + value.replace('"', '""') + '"' if any(c in value for c in ',"\n') else value
+
+    for item in resolution.get("resolved", []):
+        lines.append(f"{quote(item['identifier'])},resolved,{quote(item['protein_id'])}")
+    for item in resolution.get("ambiguous", []):
+        for protein_id in item["protein_ids"]:
+            lines.append(f"{quote(item['identifier'])},ambiguous,{quote(protein_id)}")
+    for identifier in resolution.get("unresolved", []):
+        lines.append(f"{quote(identifier)},unresolved,")
+    return "\n".join(lines) + "\n"
@@ -1,9 +1,16 @@
 """
 Logging configuration for the application.
 """
+import atexit
 import os
+import queue
+import random
 import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
+from typing import Dict, Iterator, List, Optional
 
 from loguru import logger
 
@@ -11,6 +18,78 @@ from loguru import logger
 log_dir = Path("logs")
 log_dir.mkdir(exist_ok=True)
 
+# LOG_FORMAT=json writes the log file as one JSON object per record, with bound fields
+LOG_FORMAT = os.environ.get("LOG_FORMAT", "text").lower()
+# Sink writes happen on a background thread unless LOG_ASYNC=0
+LOG_ASYNC = os.environ.get("LOG_ASYNC", "1").lower() not in ("0", "false")
+# Fraction of requests whose per-request (hot path) messages are logged
+HOT_LOG_SAMPLE_RATE = float(os.environ.get("HOT_LOG_SAMPLE_RATE", 1.0))
+
+# Records queued for the background writer before new ones are dropped
+MAX_QUEUED_RECORDS = 100_000
+
+# Set on the background writer thread while it passes records to the real sinks
+_writer_state = threading.local()
+
+
+def _from_writer(record) -> bool:
+    """Filter of the real sinks in async mode: accept records passed on by the background writer."""
+    return getattr(_writer_state, "active", False)
+
+
+def _not_from_writer(record) -> bool:
+    """Filter of the queueing sink: accept records logged by the application."""
+    return not getattr(_writer_state, "active", False)
+
+
+class BackgroundSink:
+    """
+    Loguru sink that hands records to a background thread for formatting and writing.
+
+    On the calling thread a record costs one queue append. The writer thread
+    logs each record again, unchanged, to the configured sinks, which in
+    async mode only accept records from the writer; so formatting, JSON
+    serialization, rotation and file I/O all happen off the request path.
+    When the queue is full (the sinks cannot keep up) records are dropped
+    and counted instead of blocking the caller.
+    """
+
+    def __init__(self, max_queued: int = MAX_QUEUED_RECORDS):
+        """
+        Start the writer thread.
+
+        Args:
+            max_queued: Queue length at which records are dropped.
+        """
+        self.queue = queue.Queue(maxsize=max_queued)
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, message):
+        """Queue a record (called by loguru on the logging thread)."""
+        try:
+            self.queue.put_nowait(message.record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        _writer_state.active = True
+        while True:
+            record = self.queue.get()
+            try:
+                # The patch restores the original time, caller, message, extra fields and exception
+                logger.patch(lambda r: r.update(record)).log(record["level"].name, "")
+            except Exception as e:
+                print(f"Error writing log record: {e}", file=sys.stderr)
+            finally:
+                self.queue.task_done()
+
+    def drain(self):
+        """Wait until every queued record has been written (not named flush: loguru calls flush after each write)."""
+        self.queue.join()
+
+
 # Configure loguru logger
 config = {
     "handlers": [
@@ -20,8 +99,9 @@ config = {
             "level": "INFO",
         },
         {
-            "sink": log_dir / "app.log",
+            "sink": log_dir / ("app.jsonl" if LOG_FORMAT == "json" else "app.log"),
             "format": "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}",
+            "serialize": LOG_FORMAT == "json",
             "level": "DEBUG",
             "rotation": "10 MB",
             "retention": "1 week",
@@ -32,13 +112,98 @@ config = {
 # Remove default logger
 logger.remove()
 
+
+def add_handlers(handlers: List[Dict], asynchronous: bool) -> Optional[BackgroundSink]:
+    """
+    Add loguru handlers, behind a BackgroundSink when asynchronous.
+
+    Args:
+        handlers: Keyword arguments of logger.add for each sink.
+        asynchronous: Whether to write through a background thread.
+
+    Returns:
+        The BackgroundSink, or None when synchronous.
+    """
+    for handler in handlers:
+        logger.add(**handler, filter=_from_writer if asynchronous else None)
+    if not asynchronous:
+        return None
+
+    sink = BackgroundSink()
+    # Queue only the levels some sink will write
+    min_level = min(logger.level(handler.get("level", "DEBUG")).no for handler in handlers)
+    logger.add(sink, format="{message}", level=min_level, filter=_not_from_writer, catch=False)
+    atexit.register(sink.drain)
+    return sink
+
+
 # Add configured handlers
-for handler in config["handlers"]:
-    logger.add(**handler)
+background_sink = add_handlers(config["handlers"], LOG_ASYNC)
+
+# Whether the current request's hot path messages are logged (None outside a sampled block)
+_hot_path_sampled: ContextVar[Optional[bool]] = ContextVar("hot_path_sampled", default=None)
+
+
+def set_hot_path_sample_rate(rate: float):
+    """
+    Change the fraction of requests whose hot path messages are logged.
+
+    Args:
+        rate: Between 0 (none) and 1 (all).
+    """
+    global HOT_LOG_SAMPLE_RATE
+    HOT_LOG_SAMPLE_RATE = rate
+
+
+@contextmanager
+def hot_path_sample() -> Iterator[bool]:
+    """
+    Decide once for a whole request whether its hot path messages are logged.
+
+    Nested blocks keep the outer decision, so a request's messages are
+    logged all together or not at all.
+
+    Yields:
+        Whether the request is sampled.
+    """
+    sampled = _hot_path_sampled.get()
+    if sampled is not None:
+        yield sampled
+        return
+    sampled = HOT_LOG_SAMPLE_RATE >= 1 or random.random() < HOT_LOG_SAMPLE_RATE
+    token = _hot_path_sampled.set(sampled)
+    try:
+        yield sampled
+    finally:
+        _hot_path_sampled.reset(token)
+
+
+def log_hot(message: str, *args, level: str = "INFO", **fields):
+    """
+    Log a per-request message, subject to hot path sampling.
+
+    The message uses {} placeholders filled from args, so it is only
+    formatted when a sink accepts the level; fields are bound as structured
+    values (e.g. latency_ms, result counts) and appear as keys in JSON logs.
+
+    Args:
+        message: Message template.
+        *args: Values for the placeholders.
+        level: Log level.
+        **fields: Structured fields.
+    """
+    sampled = _hot_path_sampled.get()
+    if sampled is None:
+        sampled = HOT_LOG_SAMPLE_RATE >= 1 or random.random() < HOT_LOG_SAMPLE_RATE
+    if sampled:
+        logger.opt(depth=1).bind(hot_path=True, **fields).log(level, message, *args)
+
+
+def flush_logs():
+    """Wait until queued log records have been written (no-op in synchronous mode)."""
+    if background_sink is not None:
+        background_sink.drain()
 
-# Set log level from environment variable if provided
-log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
-logger.level(log_level)
 
 # Export logger to be imported by other modules
-__all__ = ["logger"] 
\ No newline at end of file
+__all__ = ["logger", "log_hot", "hot_path_sample", "set_hot_path_sample_rate", "flush_logs"]
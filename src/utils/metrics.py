@@ -0,0 +1,253 @@
+"""
+In-process metrics: latency histograms, call and error counts, and cache hit rates, in Prometheus text format.
+"""
+import functools
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Callable, Dict, Optional, Tuple
+
+from src.utils.logging import hot_path_sample, log_hot
+from src.utils.profiling import profile_call, should_profile
+from src.utils.tracing import span
+
+# Prefix of every exported metric name
+NAMESPACE = "protein_explorer"
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Quantiles reported over the most recent observations of each series
+QUANTILES = (0.5, 0.95, 0.99)
+QUANTILE_WINDOW = 1024
+
+# Label name of each kind of timed function
+KIND_LABELS = {"callback": "callback", "loader": "method"}
+
+
+def _quantile(ordered, q: float) -> float:
+    """Get a quantile of sorted values by linear interpolation."""
+    if not ordered:
+        return float("nan")
+    position = q * (len(ordered) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class LatencySeries:
+    """Latency observations of one timed function: bucket counts, totals, errors and a recent window."""
+
+    def __init__(self):
+        """Create an empty series."""
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)  # Last bucket is +Inf
+        self.count = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.recent = deque(maxlen=QUANTILE_WINDOW)
+
+    def observe(self, seconds: float, error: bool = False):
+        """Record one call."""
+        self.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.errors += error
+        self.total_seconds += seconds
+        self.recent.append(seconds)
+
+    def quantiles(self) -> Dict[float, float]:
+        """Get the QUANTILES of the recent window (NaN when empty)."""
+        ordered = sorted(self.recent)
+        return {q: _quantile(ordered, q) for q in QUANTILES}
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of latency series and cache counters.
+
+    Latency series are keyed by kind ('callback' or 'loader') and function
+    name; cache counters by cache name. Recording takes a lock for a few
+    arithmetic operations, so it is cheap enough for every request.
+    """
+
+    def __init__(self):
+        """Create an empty registry."""
+        self._lock = threading.Lock()
+        self._latency: Dict[Tuple[str, str], LatencySeries] = {}
+        self._cache: Dict[str, list] = {}  # cache name -> [hits, misses]
+
+    def observe(self, kind: str, name: str, seconds: float, error: bool = False):
+        """
+        Record the latency of one call.
+
+        Args:
+            kind: 'callback' or 'loader'.
+            name: Function name.
+            seconds: Wall time of the call.
+            error: Whether the call raised.
+        """
+        with self._lock:
+            series = self._latency.get((kind, name))
+            if series is None:
+                series = self._latency[(kind, name)] = LatencySeries()
+            series.observe(seconds, error)
+
+    def record_cache(self, cache: str, hit: bool):
+        """
+        Record a cache lookup.
+
+        Args:
+            cache: Cache name.
+            hit: Whether the lookup was served from the cache.
+        """
+        with self._lock:
+            counts = self._cache.setdefault(cache, [0, 0])
+            counts[0 if hit else 1] += 1
+
+    def reset(self):
+        """Drop all recorded metrics."""
+        with self._lock:
+            self._latency.clear()
+            self._cache.clear()
+
+    def snapshot(self) -> Dict:
+        """
+        Get the current metrics as plain values.
+
+        Returns:
+            A dictionary with 'latency' (kind -> name -> count, errors,
+            total_seconds, p50, p95 and p99) and 'caches' (name -> hits,
+            misses and hit_rate).
+        """
+        with self._lock:
+            latency: Dict[str, Dict] = {}
+            for (kind, name), series in sorted(self._latency.items()):
+                quantiles = series.quantiles()
+                latency.setdefault(kind, {})[name] = {
+                    "count": series.count,
+                    "errors": series.errors,
+                    "total_seconds": series.total_seconds,
+                    **{f"p{round(q * 100)}": value for q, value in quantiles.items()},
+                }
+            caches = {
+                name: {"hits": hits, "misses": misses, "hit_rate": hits / (hits + misses) if hits + misses else None}
+                for name, (hits, misses) in sorted(self._cache.items())
+            }
+        return {"latency": latency, "caches": caches}
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Each kind gets a histogram (`*_duration_seconds`), a summary with the
+        recent-window quantiles (`*_latency_seconds`) and call and error
+        counters; caches get hit/miss counters and a hit ratio gauge.
+
+        Returns:
+            The exposition text.
+        """
+        lines = []
+        with self._lock:
+            for kind, label in KIND_LABELS.items():
+                series_by_name = sorted((name, s) for (k, name), s in self._latency.items() if k == kind)
+                if not series_by_name:
+                    continue
+                prefix = f"{NAMESPACE}_{kind}"
+
+                lines.append(f"# HELP {prefix}_duration_seconds Latency of {kind} calls.")
+                lines.append(f"# TYPE {prefix}_duration_seconds histogram")
+                for name, series in series_by_name:
+                    cumulative = 0
+                    for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), series.buckets):
+                        cumulative += count
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        lines.append(f'{prefix}_duration_seconds_bucket{{{label}="{name}",le="{le}"}} {cumulative}')
+                    lines.append(f'{prefix}_duration_seconds_sum{{{label}="{name}"}} {series.total_seconds!r}')
+                    lines.append(f'{prefix}_duration_seconds_count{{{label}="{name}"}} {series.count}')
+
+                lines.append(f"# HELP {prefix}_latency_seconds Latency quantiles of the last {QUANTILE_WINDOW} {kind} calls.")
+                lines.append(f"# TYPE {prefix}_latency_seconds summary")
+                for name, series in series_by_name:
+                    for q, value in series.quantiles().items():
+                        lines.append(f'{prefix}_latency_seconds{{{label}="{name}",quantile="{q}"}} {value!r}')
+                    lines.append(f'{prefix}_latency_seconds_sum{{{label}="{name}"}} {series.total_seconds!r}')
+                    lines.append(f'{prefix}_latency_seconds_count{{{label}="{name}"}} {series.count}')
+
+                for metric, help_text, attribute in (
+                    ("calls_total", "calls", "count"),
+                    ("errors_total", "calls that raised an exception", "errors"),
+                ):
+                    lines.append(f"# HELP {prefix}_{metric} Number of {kind} {help_text}.")
+                    lines.append(f"# TYPE {prefix}_{metric} counter")
+                    for name, series in series_by_name:
+                        lines.append(f'{prefix}_{metric}{{{label}="{name}"}} {getattr(series, attribute)}')
+
+            if self._cache:
+                lines.append(f"# HELP {NAMESPACE}_cache_requests_total Cache lookups by result.")
+                lines.append(f"# TYPE {NAMESPACE}_cache_requests_total counter")
+                for name, (hits, misses) in sorted(self._cache.items()):
+                    lines.append(f'{NAMESPACE}_cache_requests_total{{cache="{name}",result="hit"}} {hits}')
+                    lines.append(f'{NAMESPACE}_cache_requests_total{{cache="{name}",result="miss"}} {misses}')
+                lines.append(f"# HELP {NAMESPACE}_cache_hit_ratio Fraction of cache lookups that were hits.")
+                lines.append(f"# TYPE {NAMESPACE}_cache_hit_ratio gauge")
+                for name, (hits, misses) in sorted(self._cache.items()):
+                    lines.append(f'{NAMESPACE}_cache_hit_ratio{{cache="{name}"}} {hits / (hits + misses)!r}')
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide registry
+metrics = MetricsRegistry()
+
+
+def timed(kind: str, name: Optional[str] = None, ignore: Tuple[type, ...] = ()) -> Callable:
+    """
+    Decorate a function to record its latency and errors in the registry.
+
+    Each call is also a tracing span named '<kind>.<name>' (see
+    src.utils.tracing), and sampled calls are profiled when profiling is
+    enabled (see src.utils.profiling). A call starts a hot path logging
+    sample, and callbacks log their latency at DEBUG level when sampled.
+
+    Args:
+        kind: 'callback' or 'loader'.
+        name: Series name (defaults to the function name).
+        ignore: Exception types that are control flow rather than errors,
+            such as Dash's PreventUpdate.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        series_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with hot_path_sample():
+                start = time.perf_counter()
+                error = False
+                try:
+                    with span(f"{kind}.{series_name}"):
+                        if should_profile():
+                            return profile_call(kind, series_name, func, args, kwargs)
+                        return func(*args, **kwargs)
+                except ignore:
+                    raise
+                except Exception:
+                    error = True
+                    raise
+                finally:
+                    seconds = time.perf_counter() - start
+                    metrics.observe(kind, series_name, seconds, error)
+                    if kind == "callback":
+                        log_hot(
+                            "Callback {} finished in {:.1f}ms", series_name, seconds * 1000,
+                            level="DEBUG", callback=series_name, latency_ms=seconds * 1000, error=error,
+                        )
+
+        return wrapper
+
+    return decorator
+
+
+__all__ = ["metrics", "timed", "MetricsRegistry"]
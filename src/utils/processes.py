@@ -0,0 +1,27 @@
+"""
+Process pools that are safe to start from the threaded server.
+"""
+import multiprocessing
+
+# Modules holding worker functions, imported once by the fork server
+WORKER_MODULES = ["src.data.motif", "src.data.similarity", "src.data.sequence_sketch"]
+
+
+def process_context() -> multiprocessing.context.BaseContext:
+    """
+    Get a multiprocessing context that does not fork the calling process.
+
+    Forking a threaded server (request threads, the log writer) can copy
+    held locks into the children. A fork server is a fresh single-threaded
+    process that workers are forked from; it only preloads the worker
+    modules, not the application. Platforms without it spawn fresh
+    interpreters instead.
+
+    Returns:
+        The context to pass as mp_context to a ProcessPoolExecutor.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(WORKER_MODULES)
+        return context
+    return multiprocessing.get_context("spawn")
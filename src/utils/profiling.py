@@ -0,0 +1,138 @@
+"""
+Opt-in profiling of sampled calls, keeping the profiles of slow ones for offline analysis.
+"""
+import cProfile
+import json
+import os
+import random
+import reprlib
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from src.utils.logging import logger
+
+# Shortened argument representations for the profile metadata
+_arg_repr = reprlib.Repr()
+_arg_repr.maxstring = 200
+_arg_repr.maxother = 200
+_arg_repr.maxlist = _arg_repr.maxdict = 20
+
+# cProfile allows one active profiler per thread, so nested calls run inside the outer profile
+_active = threading.local()
+
+
+class ProfilingConfig:
+    """
+    Profiling settings, read from the environment at import.
+
+    PROFILE_SAMPLE_RATE is the fraction of calls profiled (0 disables
+    profiling), PROFILE_SLOW_MS the wall time above which a profile is kept
+    and PROFILE_DIR where profiles are written.
+    """
+
+    def __init__(self):
+        """Read the settings from the environment."""
+        self.sample_rate = float(os.environ.get("PROFILE_SAMPLE_RATE", 0))
+        self.slow_ms = float(os.environ.get("PROFILE_SLOW_MS", 500))
+        self.directory = Path(os.environ.get("PROFILE_DIR", "logs/profiles"))
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any calls are profiled."""
+        return self.sample_rate > 0
+
+
+config = ProfilingConfig()
+
+
+def configure(sample_rate: Optional[float] = None, slow_ms: Optional[float] = None, directory: Optional[str] = None):
+    """
+    Change the profiling settings at runtime.
+
+    Args:
+        sample_rate: Fraction of calls to profile (0 disables profiling).
+        slow_ms: Only calls slower than this many milliseconds keep their profile.
+        directory: Directory for the profile files.
+    """
+    if sample_rate is not None:
+        config.sample_rate = sample_rate
+    if slow_ms is not None:
+        config.slow_ms = slow_ms
+    if directory is not None:
+        config.directory = Path(directory)
+
+
+def should_profile() -> bool:
+    """Decide whether to profile the next call: sampled, and not already inside a profile."""
+    return (
+        config.sample_rate > 0
+        and not getattr(_active, "profiling", False)
+        and (config.sample_rate >= 1 or random.random() < config.sample_rate)
+    )
+
+
+def profile_call(kind: str, name: str, func: Callable, args: tuple, kwargs: dict):
+    """
+    Run a call under cProfile and save the profile if it was slow.
+
+    The profile is written as a pstats file (for `python -m pstats`,
+    snakeviz and similar tools) next to a JSON file with the call name,
+    shortened arguments, wall time and outcome.
+
+    Args:
+        kind: 'callback' or 'loader'.
+        name: Function name.
+        func: The function to call.
+        args: Positional arguments.
+        kwargs: Keyword arguments.
+
+    Returns:
+        The function's return value.
+    """
+    profiler = cProfile.Profile()
+    _active.profiling = True
+    start = time.perf_counter()
+    error = None
+    try:
+        profiler.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.disable()
+    except Exception as e:
+        error = repr(e)
+        raise
+    finally:
+        _active.profiling = False
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms >= config.slow_ms:
+            _save_profile(profiler, kind, name, args, kwargs, elapsed_ms, error)
+
+
+def _save_profile(profiler: cProfile.Profile, kind: str, name: str, args: tuple, kwargs: dict,
+                  elapsed_ms: float, error: Optional[str]):
+    """Write the profile and its metadata, logging rather than raising on failure."""
+    try:
+        config.directory.mkdir(parents=True, exist_ok=True)
+        stem = f"{datetime.now():%Y%m%d-%H%M%S-%f}_{kind}_{name}_{elapsed_ms:.0f}ms"
+        profile_path = config.directory / f"{stem}.prof"
+        profiler.dump_stats(profile_path)
+        metadata = {
+            "kind": kind,
+            "name": name,
+            "args": [_arg_repr.repr(arg) for arg in args],
+            "kwargs": {key: _arg_repr.repr(value) for key, value in kwargs.items()},
+            "elapsed_ms": elapsed_ms,
+            "threshold_ms": config.slow_ms,
+            "error": error,
+            "thread": threading.current_thread().name,
+            "profile": profile_path.name,
+        }
+        with open(config.directory / f"{stem}.json", "w") as f:
+            json.dump(metadata, f, indent=2)
+        logger.warning(f"Slow {kind} {name} took {elapsed_ms:.0f}ms; profile saved to {profile_path}")
+    except OSError as e:
+        logger.error(f"Could not save profile of {kind} {name}: {e}")
@@ -0,0 +1,139 @@
+"""
+Wall time, CPU time and memory instrumentation for multi-phase operations such as data loading.
+"""
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+from src.utils.logging import logger
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# Whether the missing RSS measurement has been logged
+_rss_warned = False
+
+
+def rss_bytes() -> Optional[int]:
+    """
+    Get the current resident set size of this process.
+
+    Returns:
+        RSS in bytes, or None if it cannot be measured on this platform.
+    """
+    global _rss_warned
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        if not _rss_warned:
+            _rss_warned = True
+            logger.warning("RSS cannot be read without psutil on this platform; memory deltas are omitted")
+        return None
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    Get the peak resident set size of this process so far.
+
+    Returns:
+        Peak RSS in bytes, or None if it cannot be measured on this platform.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _difference(after: Optional[int], before: Optional[int]) -> Optional[int]:
+    return None if after is None or before is None else after - before
+
+
+class PhaseRecorder:
+    """
+    Records consecutive phases of an operation and logs each one as it ends.
+
+    Every phase gets wall and CPU seconds, the change in RSS, the growth of
+    the peak RSS (how far the phase pushed the high-water mark), and a row
+    count or other fields the caller fills in.
+    """
+
+    def __init__(self, operation: str):
+        """
+        Create an empty recorder.
+
+        Args:
+            operation: Name of the instrumented operation, used in log records.
+        """
+        self.operation = operation
+        self.phases: List[Dict] = []
+
+    @contextmanager
+    def phase(self, name: str, rows: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Measure one phase.
+
+        Args:
+            name: Phase name.
+            rows: Number of rows processed, if known up front.
+
+        Yields:
+            The phase record; set 'rows' or other fields on it inside the block.
+        """
+        record = {'phase': name, 'rows': rows}
+        rss_before, peak_before = rss_bytes(), peak_rss_bytes()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        finally:
+            record['wall_seconds'] = time.perf_counter() - wall_start
+            record['cpu_seconds'] = time.process_time() - cpu_start
+            record['rss_delta_bytes'] = _difference(rss_bytes(), rss_before)
+            record['peak_rss_delta_bytes'] = _difference(peak_rss_bytes(), peak_before)
+            self.phases.append(record)
+            logger.bind(operation=self.operation, **record).debug(
+                f"{self.operation} {name}: {record['wall_seconds']:.3f}s wall, "
+                f"{record['cpu_seconds']:.3f}s CPU, rows={record['rows']}"
+            )
+
+    def report(self) -> Dict:
+        """
+        Summarize the recorded phases.
+
+        Returns:
+            A dictionary with 'operation', 'phases' (the phase records in
+            order) and 'total' (summed wall/CPU seconds and RSS changes, plus
+            the current peak RSS in bytes).
+        """
+        total = {
+            'wall_seconds': sum(p['wall_seconds'] for p in self.phases),
+            'cpu_seconds': sum(p['cpu_seconds'] for p in self.phases),
+            'rss_delta_bytes': sum(p['rss_delta_bytes'] or 0 for p in self.phases),
+            'peak_rss_delta_bytes': sum(p['peak_rss_delta_bytes'] or 0 for p in self.phases),
+            'peak_rss_bytes': peak_rss_bytes(),
+        }
+        return {'operation': self.operation, 'phases': [dict(p) for p in self.phases], 'total': total}
+
+    def log_summary(self):
+        """Log the totals and the slowest phase at INFO level."""
+        report = self.report()
+        total = report['total']
+        slowest = max(self.phases, key=lambda p: p['wall_seconds'], default=None)
+        peak = total['peak_rss_bytes']
+        logger.bind(operation=self.operation, **total).info(
+            f"{self.operation} took {total['wall_seconds']:.2f}s wall, {total['cpu_seconds']:.2f}s CPU"
+            + (f", peak RSS {peak / 2 ** 20:.0f} MB" if peak is not None else "")
+            + (f"; slowest phase {slowest['phase']} ({slowest['wall_seconds']:.2f}s)" if slowest else "")
+        )
@@ -0,0 +1,192 @@
+"""
+Request-scoped tracing: nested timed spans with attributes, written as JSON lines.
+"""
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from src.utils.logging import logger
+
+# Header a client can send to choose the correlation ID of its request
+CORRELATION_HEADER = "X-Request-ID"
+
+
+class Span:
+    """One timed operation within a trace."""
+
+    def __init__(self, name: str, trace_id: str, parent: Optional["Span"], attributes: Dict):
+        """
+        Start a span.
+
+        Args:
+            name: Operation name, e.g. 'loader.get_protein_details'.
+            trace_id: Correlation ID shared by every span of the request.
+            parent: The enclosing span (None for the root).
+            attributes: Initial attributes.
+        """
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent = parent
+        self.root = parent.root if parent else self
+        self.attributes = attributes
+        self.start = time.time()
+        self.error: Optional[str] = None
+        self.finished: List[Dict] = []  # Records of the trace's ended spans, kept on the root
+        self._start = time.perf_counter()
+
+    def set(self, key: str, value):
+        """Set an attribute, such as a protein ID or a result count."""
+        self.attributes[key] = value
+
+    def end(self) -> Dict:
+        """Stop the span and get its record."""
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent.span_id if self.parent else None,
+            "name": self.name,
+            "start": self.start,
+            "duration_ms": (time.perf_counter() - self._start) * 1000,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class _NoopSpan:
+    """Stands in for a span when tracing is disabled."""
+
+    trace_id = None
+
+    def set(self, key: str, value):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class TraceWriter:
+    """Appends finished traces to a JSON lines file, one line per span."""
+
+    def __init__(self, path: Optional[str]):
+        """
+        Create a writer.
+
+        Args:
+            path: File to append to (None disables tracing).
+        """
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are recorded."""
+        return self.path is not None
+
+    def write(self, records: List[Dict]):
+        """Append the span records of one trace in a single write."""
+        text = "".join(json.dumps(record, default=str) + "\n" for record in records)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(text)
+
+
+# Tracing is enabled by setting TRACE_FILE, e.g. to logs/traces.jsonl
+writer = TraceWriter(os.environ.get("TRACE_FILE") or None)
+
+
+def configure(path: Optional[str]):
+    """
+    Enable tracing to a file, or disable it.
+
+    Args:
+        path: JSON lines file to append spans to (None disables tracing).
+    """
+    writer.path = Path(path) if path else None
+
+
+def _request_correlation_id() -> Optional[str]:
+    """Get the correlation ID sent with the current HTTP request, if any."""
+    try:
+        from flask import has_request_context, request
+    except ImportError:
+        return None
+    if has_request_context():
+        return request.headers.get(CORRELATION_HEADER) or None
+    return None
+
+
+def current_span():
+    """
+    Get the innermost active span.
+
+    Returns:
+        The span, or a no-op stand-in when tracing is disabled or no span is active.
+    """
+    return _current.get() or NOOP_SPAN
+
+
+def continue_trace(trace_id: Optional[str]):
+    """
+    Move the active spans into an earlier trace, to join a follow-up request to it.
+
+    Call it before any child span has ended; spans already finished keep
+    their original trace ID.
+
+    Args:
+        trace_id: The trace to continue (ignored if empty or tracing is off).
+    """
+    current = _current.get()
+    if not trace_id or current is None:
+        return
+    while current is not None:
+        current.trace_id = trace_id
+        current = current.parent
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator:
+    """
+    Time a block as a span nested in the active one.
+
+    A span without an enclosing one starts a trace, whose ID is taken from
+    the request's X-Request-ID header or generated. The trace's spans are
+    written together when that root span ends.
+
+    Args:
+        name: Operation name.
+        **attributes: Initial attributes.
+
+    Yields:
+        The span (a no-op stand-in when tracing is disabled).
+    """
+    if not writer.enabled:
+        yield NOOP_SPAN
+        return
+
+    parent = _current.get()
+    trace_id = parent.trace_id if parent else _request_correlation_id() or uuid.uuid4().hex
+    current = Span(name, trace_id, parent, attributes)
+    token = _current.set(current)
+    try:
+        yield current
+    except Exception as e:
+        current.error = repr(e)
+        raise
+    finally:
+        _current.reset(token)
+        current.root.finished.append(current.end())
+        if parent is None:
+            try:
+                writer.write(current.finished)
+            except OSError as e:
+                logger.error(f"Could not write trace {trace_id}: {e}")
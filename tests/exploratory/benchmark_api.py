@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+"""
+Measure requests per second and latency of the JSON API on a running server.
+
+Usage:
+    python run.py &
+    python tests/exploratory/benchmark_api.py --url http://localhost:8050 --concurrency 8 --duration 10
+"""
+import argparse
+import json
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+def fetch_json(url):
+    """GET a URL and decode its JSON body."""
+    with urllib.request.urlopen(url) as response:
+        return json.loads(response.read())
+
+
+def run_endpoint(url, concurrency, duration):
+    """Hit one URL from several threads for a fixed time; return (latencies, errors, elapsed)."""
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                with urllib.request.urlopen(url) as response:
+                    response.read()
+                ok = True
+            except urllib.error.URLError:
+                ok = False
+            elapsed = time.perf_counter() - start
+            with lock:
+                if ok:
+                    latencies.append(elapsed)
+                else:
+                    errors += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(worker)
+    return latencies, errors, time.perf_counter() - start
+
+
+def main():
+    """Benchmark the main /api/v1 endpoints."""
+    parser = argparse.ArgumentParser(description="Benchmark the JSON API")
+    parser.add_argument("--url", type=str, default="http://localhost:8050", help="Base URL of the running app")
+    parser.add_argument("--concurrency", type=int, default=8, help="Number of concurrent clients")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds per endpoint")
+    args = parser.parse_args()
+
+    base = args.url.rstrip("/") + "/api/v1"
+    print(f"Dataset: {fetch_json(base + '/version')}")
+
+    # Pick real IDs from the data for the parameterized endpoints
+    protein = fetch_json(base + "/search?q=AT1G&limit=1")["results"][0]
+    go_id = protein["top_go_ids"][0] if protein["top_go_ids"] else "GO:0005634"
+    endpoints = {
+        "protein": f"/proteins/{protein['protein_id']}",
+        "neighbors": f"/proteins/{protein['protein_id']}/neighbors",
+        "search": "/search?q=AT1G",
+        "go_term_proteins": f"/go/{go_id}/proteins",
+    }
+
+    print(f"\n{'endpoint':<18} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for name, path in endpoints.items():
+        latencies, errors, elapsed = run_endpoint(base + path, args.concurrency, args.duration)
+        if not latencies:
+            print(f"{name:<18} {'-':>8} {'-':>8} {'-':>8} {'-':>8} {errors:>7}")
+            continue
+        quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+        print(
+            f"{name:<18} {len(latencies) / elapsed:>8.1f} {quantiles[49] * 1000:>8.1f} "
+            f"{quantiles[94] * 1000:>8.1f} {quantiles[98] * 1000:>8.1f} {errors:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+Compare applying a delta with a full rebuild of the DataLoader.
+
+The dataset is copied to a temporary directory, where a delta of new
+edges, removed edges, new proteins and removed proteins is generated.
+
+Usage:
+    python tests/exploratory/benchmark_delta_ingest.py --data-path data --fraction 0.01
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.data.delta import DELTA_DIR, write_delta
+from src.data.loader import DataLoader
+from src.data.version import DATA_FILES
+
+
+def make_delta(data_path: Path, delta_path: Path, fraction: float, seed: int = 0):
+    """Write a delta changing about `fraction` of the edges and proteins."""
+    nodes = pd.read_parquet(data_path / "protein_nodes.parquet")
+    records = pd.read_parquet(data_path / "protein_id_records.parquet")
+    edges = pd.read_parquet(data_path / "edges.parquet")
+
+    n_edges = max(1, int(len(edges) * fraction))
+    n_proteins = max(1, int(len(nodes) * fraction))
+
+    # New proteins copy existing rows under new IDs
+    new_nodes = nodes.sample(n_proteins, random_state=seed).copy()
+    new_nodes["id"] = [f"Protein::delta-{i}" for i in range(n_proteins)]
+    new_records = records.sample(min(n_proteins, len(records)), random_state=seed).copy()
+    new_records["external_id"] = new_nodes["id"].to_numpy()[:len(new_records)]
+    new_records["uuid"] = [f"delta-{i}" for i in range(len(new_records))]
+
+    # New edges are existing ones rewired to other sources
+    new_edges = edges.sample(n_edges, random_state=seed + 1).copy()
+    new_edges["source"] = nodes["id"].sample(n_edges, replace=True, random_state=seed + 2).to_numpy()
+
+    write_delta(
+        delta_path,
+        protein_nodes=new_nodes,
+        protein_ids=new_records,
+        edges=new_edges,
+        removed_proteins=nodes["id"].sample(max(1, n_proteins // 4), random_state=seed + 3).tolist(),
+        removed_edges=edges.sample(n_edges, random_state=seed + 4),
+    )
+
+
+def main():
+    """Time a full load against loading the base once and applying a delta to a copy."""
+    parser = argparse.ArgumentParser(description="Benchmark incremental delta ingest")
+    parser.add_argument("--data-path", type=str, default="data", help="Directory containing the parquet files")
+    parser.add_argument("--fraction", type=float, default=0.01, help="Delta size as a fraction of the dataset")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = Path(tmp) / "data"
+        data_path.mkdir()
+        for name in DATA_FILES:
+            shutil.copy(Path(args.data_path) / name, data_path / name)
+
+        start = time.perf_counter()
+        loader = DataLoader(data_path=str(data_path))
+        full_seconds = time.perf_counter() - start
+
+        make_delta(data_path, data_path / DELTA_DIR / "0001", args.fraction)
+        start = time.perf_counter()
+        updated = loader.copy()
+        stats = updated.apply_pending_deltas()[0]
+        delta_seconds = time.perf_counter() - start
+
+    print(f"\nDelta ({args.fraction:.1%}): +{stats['proteins_added']}/-{stats['proteins_removed']} proteins, "
+          f"+{stats['edges_added']}/-{stats['edges_removed']} edges")
+    print(f"{'full rebuild':>14}: {full_seconds:.3f}s")
+    print(f"{'copy + delta':>14}: {delta_seconds:.3f}s ({delta_seconds / full_seconds:.1%} of a full rebuild)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+"""
+Measure how much logging adds to request latency with each logging mode.
+
+Several threads run a simulated callback that logs like perform_search
+(two hot path messages and a completion line). Each mode replaces the
+handlers with a file sink in a temporary directory, written synchronously,
+through loguru's enqueue=True or through the app's background writer. The
+"slow disk" modes use a sink that sleeps on every write, to show whether
+sink I/O reaches the caller.
+
+Usage:
+    python tests/exploratory/benchmark_logging.py --threads 8 --requests 2000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.utils.logging import add_handlers, hot_path_sample, log_hot, logger, set_hot_path_sample_rate
+
+FILE_FORMAT = "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}"
+
+# name -> (serialize, writer, hot path sample rate, slow sink); writer is "sync",
+# "enqueue" (loguru's enqueue=True) or "background" (the app's BackgroundSink)
+MODES = {
+    "no handlers": None,
+    "sync text": (False, "sync", 1.0, False),
+    "sync json": (True, "sync", 1.0, False),
+    "enqueue json": (True, "enqueue", 1.0, False),
+    "background text": (False, "background", 1.0, False),
+    "background json": (True, "background", 1.0, False),
+    "background 10%": (True, "background", 0.1, False),
+    "sync slow disk": (False, "sync", 1.0, True),
+    "enqueue slow disk": (False, "enqueue", 1.0, True),
+    "bg slow disk": (False, "background", 1.0, True),
+}
+
+
+def slow_sink(message):
+    """A sink standing in for a disk that takes 1ms per write."""
+    time.sleep(0.001)
+
+
+def simulated_request(i: int):
+    """Log like one search request."""
+    with hot_path_sample():
+        start = time.perf_counter()
+        log_hot("Performing search: {} (type: {})", f"AT1G{i:05d}", "protein", search_term=f"AT1G{i:05d}", search_type="protein")
+        log_hot("Found {} proteins", i % 7, results=i % 7)
+        log_hot("Callback {} finished in {:.1f}ms", "perform_search", 0.5, level="DEBUG",
+                callback="perform_search", latency_ms=0.5, error=False)
+        return time.perf_counter() - start
+
+
+def run_mode(name: str, settings, log_path: Path, threads: int, requests: int):
+    """Run the simulated requests under one logging mode and return latency statistics."""
+    logger.remove()
+    background = None
+    if settings is not None:
+        serialize, writer, rate, slow = settings
+        set_hot_path_sample_rate(rate)
+        handler = {"sink": slow_sink, "level": "DEBUG"} if slow else {
+            "sink": log_path, "format": FILE_FORMAT, "level": "DEBUG", "serialize": serialize,
+        }
+        if writer == "enqueue":
+            handler["enqueue"] = True
+        background = add_handlers([handler], asynchronous=writer == "background")
+
+    latencies = [[] for _ in range(threads)]
+
+    def worker(index):
+        for i in range(requests):
+            latencies[index].append(simulated_request(i))
+
+    start = time.perf_counter()
+    workers = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+
+    drain_start = time.perf_counter()
+    if background is not None:
+        background.drain()
+    logger.remove()  # Also waits for the queue of enqueued sinks to be written
+    drain = time.perf_counter() - drain_start
+
+    values = np.concatenate([np.asarray(l) for l in latencies]) * 1e6
+    return {
+        "mode": name,
+        "requests_per_second": threads * requests / elapsed,
+        "p50_us": float(np.percentile(values, 50)),
+        "p99_us": float(np.percentile(values, 99)),
+        "max_us": float(values.max()),
+        "drain_seconds": drain,
+    }
+
+
+def main():
+    """Print per-request logging overhead for every mode."""
+    parser = argparse.ArgumentParser(description="Benchmark logging overhead on the request path")
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent request threads")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per thread")
+    parser.add_argument("--slow-requests", type=int, default=200, help="Requests per thread in the slow disk modes")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, settings in MODES.items():
+            requests = args.slow_requests if settings and settings[3] else args.requests
+            results.append(run_mode(name, settings, Path(tmp) / f"{name.replace(' ', '_')}.log", args.threads, requests))
+
+    print(f"\n{args.threads} threads; logging cost per request (3 messages)")
+    print(f"{'mode':<18} {'req/s':>10} {'p50 us':>9} {'p99 us':>9} {'max us':>10} {'drain s':>8}")
+    for r in results:
+        print(f"{r['mode']:<18} {r['requests_per_second']:>10,.0f} {r['p50_us']:>9.1f} {r['p99_us']:>9.1f} "
+              f"{r['max_us']:>10.0f} {r['drain_seconds']:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
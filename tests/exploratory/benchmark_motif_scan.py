@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""
+Benchmark parallel motif scanning at increasing worker counts.
+
+Each worker count scans in a long-lived pool like the app's, started
+before timing, so process startup is not counted.
+
+Usage:
+    python tests/exploratory/benchmark_motif_scan.py --data-path data --repeat 4
+"""
+import argparse
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.data.loader import DataLoader
+from src.data.motif import create_scan_pool, iter_motif_matches
+
+
+def main():
+    """Time a full motif scan for 1, 2, 4, ... workers and report the speedup."""
+    parser = argparse.ArgumentParser(description="Benchmark parallel motif scanning")
+    parser.add_argument("--data-path", type=str, default="data", help="Directory containing the parquet files")
+    parser.add_argument("--pattern", type=str, default="C-x(2,4)-C-x(3)-[LIVMFYWC]-x(8)-H-x(3,5)-H",
+                        help="PROSITE pattern or regex to scan for")
+    parser.add_argument("--repeat", type=int, default=1, help="Scan the proteome this many times over")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count(), help="Largest worker count to try")
+    parser.add_argument("--min-workers", type=int, default=1, help="Smallest worker count to try (doubled each step)")
+    args = parser.parse_args()
+
+    print("Initializing DataLoader...")
+    loader = DataLoader(data_path=args.data_path)
+
+    # Full scan without prefiltering, over the proteome repeated to enlarge the workload
+    sequences = np.tile(loader.kmer_index.sequences, args.repeat)
+    index = SimpleNamespace(sequences=sequences, k=loader.kmer_index.k)
+    residues = sum(len(s) for s in sequences if s)
+    print(f"Scanning {len(sequences)} sequences ({residues:,} residues) for {args.pattern}\n")
+
+    workers = args.min_workers
+    baseline = None
+    print(f"{'workers':>8} {'seconds':>10} {'speedup':>8} {'matches':>8}")
+    while workers <= args.max_workers:
+        pool = create_scan_pool(workers) if workers > 1 else None
+        start = time.perf_counter()
+        matches = sum(
+            len(chunk) for chunk in iter_motif_matches(args.pattern, index, workers=workers, prefilter=False, pool=pool)
+        )
+        elapsed = time.perf_counter() - start
+        if pool is not None:
+            pool.shutdown()
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>10.3f} {baseline / elapsed:>8.2f} {matches:>8}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
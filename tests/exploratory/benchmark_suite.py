@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+"""
+Micro-benchmarks of DataLoader hot paths, with stored baselines and regression checks.
+
+Inputs (identifiers, low- and high-degree proteins, GO terms) are picked
+deterministically from the loaded data, so runs on the same dataset are
+comparable. Each benchmark reports the median, minimum and p95 time per call;
+comparisons use the median.
+
+Usage:
+    # Measure and store a baseline
+    python tests/exploratory/benchmark_suite.py run --data-path data --save tests/exploratory/baselines/main.json
+
+    # Measure again and flag benchmarks more than 15% slower than the baseline (exit code 1)
+    python tests/exploratory/benchmark_suite.py compare --data-path data --baseline tests/exploratory/baselines/main.json
+
+    # Compare two stored runs without measuring
+    python tests/exploratory/benchmark_suite.py compare --baseline old.json --current new.json
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.data.loader import DataLoader
+
+# Default slowdown of the median (as a fraction) reported as a regression
+DEFAULT_TOLERANCE = 0.15
+
+
+def measure(func: Callable, setup: Optional[Callable] = None, repeat: int = 7, min_time: float = 0.05) -> Dict:
+    """
+    Time a function.
+
+    Without setup, calls are batched so that each of the `repeat` samples
+    lasts at least `min_time` seconds; with setup, every call is a sample
+    and setup runs untimed before it. Garbage collection is paused while
+    timing.
+
+    Args:
+        func: The function to time.
+        setup: Called before each timed call, if given.
+        repeat: Number of samples.
+        min_time: Minimum duration of a batched sample.
+
+    Returns:
+        A dictionary with median_s, min_s and p95_s per call, samples and number (calls per sample).
+    """
+    number = 1
+    if setup is None:
+        func()  # Warm up
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            if time.perf_counter() - start >= min_time:
+                break
+            number *= 2
+
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        for _ in range(repeat):
+            if setup is not None:
+                setup()
+            gc.disable()
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            samples.append((time.perf_counter() - start) / number)
+            if gc_was_enabled:
+                gc.enable()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return {
+        "median_s": float(np.median(samples)),
+        "min_s": float(np.min(samples)),
+        "p95_s": float(np.percentile(samples, 95)),
+        "samples": repeat,
+        "number": number,
+    }
+
+
+def pick_inputs(loader: DataLoader) -> Dict:
+    """Choose benchmark inputs deterministically from the loaded data."""
+    names = sorted(n for n in loader.name_to_ids if isinstance(n, str) and len(n) >= 5)
+    name = names[len(names) // 2]
+    exact = next(
+        identifier for identifier in sorted(loader.uuid_to_ids)
+        if identifier in loader.identifier_to_ids and identifier not in loader.name_to_ids
+    ) if loader.uuid_to_ids else loader.protein_index[0]
+
+    # A name fragment that is not itself a name, to force the fuzzy scan
+    fuzzy = name[1:-1].lower()
+    if fuzzy in loader.identifier_to_ids or fuzzy in loader.name_to_ids:
+        fuzzy = name[1:].lower()
+
+    degree = np.nan_to_num(loader.protein_features.columns['interaction_degree'].astype(float))
+    connected = np.flatnonzero(degree > 0)
+    low = loader.protein_index[connected[np.argmin(degree[connected])]] if len(connected) else loader.protein_index[0]
+    high = loader.protein_index[int(np.argmax(degree))]
+
+    annotations = loader.edges[loader.edges['relationship'].isin(loader.FUNCTIONAL_ANNOTATION_TYPES)]
+    term_counts = annotations['target'].value_counts()
+    largest = loader.go_term_id_to_term[term_counts.index[0]]
+    typical = loader.go_term_id_to_term[term_counts.index[len(term_counts) // 2]]
+
+    return {
+        "exact": exact,
+        "name": name,
+        "fuzzy": fuzzy,
+        "low_degree": low,
+        "high_degree": high,
+        "go_term_largest": largest.get('external_id'),
+        "go_term_typical": typical.get('external_id'),
+    }
+
+
+def reset_lookup_maps(loader: DataLoader):
+    """Empty the maps that _create_lookup_maps fills, so it runs as on a fresh load."""
+    loader.id_to_details = {}
+    loader.uuid_to_ids = {}
+    loader.identifier_to_ids = {}
+    loader.name_to_ids = {}
+    loader.id_to_uuid = {}
+
+
+def run_suite(data_path: str, only: Optional[List[str]] = None, load_repeat: int = 3) -> Dict:
+    """
+    Run every benchmark (or those whose name starts with one of `only`).
+
+    Returns:
+        The run: environment and dataset metadata, the chosen inputs and the results by benchmark name.
+    """
+
+    def selected(name):
+        return not only or any(name.startswith(prefix) for prefix in only)
+
+    results = {}
+    if selected("load_data"):
+        print("Timing load_data...")
+        results["load_data"] = measure(lambda: DataLoader(data_path=data_path), setup=lambda: None, repeat=load_repeat)
+
+    loader = DataLoader(data_path=data_path)
+    inputs = pick_inputs(loader)
+
+    benchmarks = {
+        "search_protein.exact": (lambda: loader.search_protein(inputs["exact"]), None),
+        "search_protein.name": (lambda: loader.search_protein(inputs["name"]), None),
+        "search_protein.fuzzy": (lambda: loader.search_protein(inputs["fuzzy"]), None),
+        "get_protein_details.low_degree": (lambda: loader.get_protein_details(inputs["low_degree"]), None),
+        "get_protein_details.high_degree": (lambda: loader.get_protein_details(inputs["high_degree"]), None),
+        "search_by_go_term.largest": (lambda: loader.search_by_go_term(inputs["go_term_largest"]), None),
+        "search_by_go_term.typical": (lambda: loader.search_by_go_term(inputs["go_term_typical"]), None),
+        # Last, as it rebuilds the maps the other benchmarks read
+        "_create_lookup_maps": (loader._create_lookup_maps, lambda: reset_lookup_maps(loader)),
+    }
+    for name, (func, setup) in benchmarks.items():
+        if selected(name):
+            print(f"Timing {name}...")
+            results[name] = measure(func, setup=setup, repeat=5 if setup else 7)
+
+    return {
+        "created": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "dataset_version": loader.dataset_version,
+        "proteins": len(loader.protein_index),
+        "edges": len(loader.edges),
+        "inputs": inputs,
+        "results": results,
+    }
+
+
+def compare(baseline: Dict, current: Dict, tolerance: float) -> List[str]:
+    """
+    Print current medians against the baseline.
+
+    Returns:
+        Names of the benchmarks slower than the baseline by more than the tolerance.
+    """
+    if baseline.get("dataset_version") != current.get("dataset_version"):
+        print(f"Warning: dataset versions differ (baseline {baseline.get('dataset_version')}, "
+              f"current {current.get('dataset_version')}); timings may not be comparable")
+
+    regressions = []
+    print(f"\n{'benchmark':<34} {'baseline ms':>12} {'current ms':>12} {'change':>9}")
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<34} {'-':>12} {result['median_s'] * 1000:>12.3f} {'new':>9}")
+            continue
+        change = result["median_s"] / before["median_s"] - 1
+        flag = ""
+        if change > tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        elif change < -tolerance:
+            flag = "  faster"
+        print(f"{name:<34} {before['median_s'] * 1000:>12.3f} {result['median_s'] * 1000:>12.3f} {change:>+9.1%}{flag}")
+    return regressions
+
+
+def print_results(run: Dict):
+    """Print the results of one run."""
+    print(f"\n{run['proteins']:,} proteins, {run['edges']:,} edges (dataset {run['dataset_version']})")
+    print(f"{'benchmark':<34} {'median ms':>10} {'min ms':>10} {'p95 ms':>10} {'calls':>7}")
+    for name, result in run["results"].items():
+        print(f"{name:<34} {result['median_s'] * 1000:>10.3f} {result['min_s'] * 1000:>10.3f} "
+              f"{result['p95_s'] * 1000:>10.3f} {result['samples'] * result['number']:>7}")
+
+
+def main():
+    """Run the suite, store it, or compare it with a baseline."""
+    parser = argparse.ArgumentParser(description="DataLoader micro-benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks")
+    compare_parser = subparsers.add_parser("compare", help="Run (or load) the benchmarks and compare with a baseline")
+    for sub in (run_parser, compare_parser):
+        sub.add_argument("--data-path", type=str, default="data", help="Directory containing the parquet files")
+        sub.add_argument("--only", nargs="*", default=None, help="Benchmark name prefixes to run")
+        sub.add_argument("--load-repeat", type=int, default=3, help="Number of full loads timed for load_data")
+        sub.add_argument("--save", type=str, default=None, help="Write the run to this JSON file")
+    compare_parser.add_argument("--baseline", type=str, required=True, help="Baseline JSON file")
+    compare_parser.add_argument("--current", type=str, default=None, help="Compare this stored run instead of measuring")
+    compare_parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                                help="Allowed slowdown of the median as a fraction")
+    args = parser.parse_args()
+
+    if args.command == "compare" and args.current:
+        with open(args.current) as f:
+            run = json.load(f)
+    else:
+        run = run_suite(args.data_path, args.only, args.load_repeat)
+        print_results(run)
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump(run, f, indent=2)
+        print(f"\nSaved to {args.save}")
+
+    if args.command == "compare":
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, run, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.tolerance:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+"""
+Check that applying deltas gives the same loader as a fresh load of the compacted files.
+
+A small synthetic dataset is generated in a temporary directory. Three
+deltas are applied one generation at a time through ReloadableLoader:
+
+- 0001: new proteins with ID records, interactions and GO annotations
+- 0002: replaced nodes and ID records of existing and newly added proteins
+- 0003: removed proteins (existing and newly added) and removed edges
+
+The last generation is then compacted, and its lookup maps, summary rows,
+edges and search results are compared with a new DataLoader built on the
+compacted files. Exits with status 1 on any difference.
+
+Usage:
+    python tests/exploratory/check_delta_apply.py --scale 0.05 --seed 0
+"""
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.data.delta import DELTA_DIR, EDGE_KEY, write_delta
+from src.data.loader import DataLoader
+from src.data.reload import ReloadableLoader
+from src.data.synthetic import generate_dataset
+
+LOOKUP_MAPS = ['identifier_to_ids', 'name_to_ids', 'uuid_to_ids', 'id_to_uuid', 'id_to_details']
+
+
+def write_deltas(data_path: Path, rng: np.random.Generator, count: int) -> List[Dict]:
+    """
+    Write the add, replace and remove deltas for the dataset in data_path.
+
+    Args:
+        data_path: Directory containing the base parquet files.
+        rng: Random generator choosing the proteins and edges.
+        count: Number of proteins (and edges) each delta touches.
+
+    Returns:
+        Keyword arguments of write_delta for each delta, in application order.
+    """
+    nodes = pd.read_parquet(data_path / "protein_nodes.parquet")
+    records = pd.read_parquet(data_path / "protein_id_records.parquet")
+    edges = pd.read_parquet(data_path / "edges.parquet")
+    interactions = edges[edges['relationship'] == "Protein-Protein-ProteinProteinInteraction"]
+    annotations = edges[edges['relationship'].str.endswith("-Protein-FunctionalAnnotation")]
+
+    def sample(frame: pd.DataFrame, n: int) -> pd.DataFrame:
+        return frame.iloc[rng.choice(len(frame), size=min(n, len(frame)), replace=False)].copy()
+
+    # 0001: new proteins copied from existing rows, wired to existing proteins and GO terms
+    added = sample(nodes, count)
+    added['id'] = [f"Protein::delta-{i}" for i in range(len(added))]
+    added['name'] = [f"DELTA{i}.1" for i in range(len(added))]
+    added_records = sample(records, len(added))
+    added_records['external_id'] = added['id'].to_numpy()
+    added_records['uuid'] = [f"delta-{i}" for i in range(len(added))]
+    added_records['secondary_ids'] = [[f"TAIR:DELTA{i}"] for i in range(len(added))]
+    new_interactions = sample(interactions, count)
+    new_interactions['source'] = added['id'].to_numpy()[:len(new_interactions)]
+    new_annotations = sample(annotations, count)
+    new_annotations['source'] = added['id'].to_numpy()[:len(new_annotations)]
+    add = {
+        'protein_nodes': added,
+        'protein_ids': added_records,
+        'edges': pd.concat([new_interactions, new_annotations], ignore_index=True),
+    }
+
+    # 0002: new names, sequences and secondary IDs for existing and added proteins
+    replaced = pd.concat([sample(nodes, count), added.iloc[:max(1, count // 4)]], ignore_index=True)
+    replaced['name'] = [f"REPLACED{i}.1" for i in range(len(replaced))]
+    replaced['sequence'] = replaced['sequence'].where(replaced['sequence'].isna(), replaced['sequence'] + "WW")
+    replaced_records = pd.concat([records, added_records], ignore_index=True)
+    replaced_records = replaced_records[replaced_records['external_id'].isin(replaced['id'])].copy()
+    replaced_records['secondary_ids'] = [[f"TAIR:REPLACED{i}"] for i in range(len(replaced_records))]
+    replace = {'protein_nodes': replaced, 'protein_ids': replaced_records}
+
+    # 0003: remove existing and added proteins, and existing and added edges
+    removed = sample(nodes, count)['id'].tolist() + added['id'].iloc[-max(1, count // 4):].tolist()
+    removed_edges = pd.concat([sample(edges, count), new_annotations.iloc[:max(1, count // 4)]], ignore_index=True)
+    remove = {'removed_proteins': removed, 'removed_edges': removed_edges[EDGE_KEY]}
+
+    return [add, replace, remove]
+
+
+def normalize_map(mapping: Dict) -> Dict:
+    """Make a lookup map comparable: list values become sorted lists, dict values sorted items."""
+    result = {}
+    for key, value in mapping.items():
+        if isinstance(value, list):
+            value = sorted(value, key=str)
+        elif isinstance(value, dict):
+            value = sorted(
+                (k, tuple(v) if isinstance(v, (list, np.ndarray)) else v) for k, v in value.items()
+            )
+        result[key] = value
+    return result
+
+
+def compare(name: str, incremental, fresh, problems: List[str]):
+    """Record a problem if two values differ, with a sample of the differing keys."""
+    if incremental == fresh:
+        print(f"  {name}: match")
+        return
+    detail = ""
+    if isinstance(incremental, dict) and isinstance(fresh, dict):
+        keys = set(incremental) ^ set(fresh)
+        keys |= {key for key in set(incremental) & set(fresh) if incremental[key] != fresh[key]}
+        detail = f" ({len(keys)} keys, e.g. {sorted(keys, key=str)[:3]})"
+    problems.append(f"{name} differs{detail}")
+    print(f"  {name}: DIFFERS{detail}")
+
+
+def edge_keys(edges: pd.DataFrame) -> List[tuple]:
+    """The sorted (source, target, relationship) keys of an edge table."""
+    return sorted(map(tuple, edges[EDGE_KEY].astype(str).to_numpy().tolist()))
+
+
+def main():
+    """Apply the deltas, compact them and compare with a fresh load."""
+    parser = argparse.ArgumentParser(description="Check incremental deltas against a fresh load")
+    parser.add_argument("--scale", type=float, default=0.05, help="Synthetic dataset size (1 = the real dataset)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the dataset and the deltas")
+    parser.add_argument("--count", type=int, default=40, help="Proteins and edges touched per delta")
+    parser.add_argument("--go-terms", type=str, default="data/go_term_nodes.parquet",
+                        help="GO term nodes to reuse (generated if missing)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = Path(tmp) / "data"
+        generate_dataset(str(data_path), scale=args.scale, seed=args.seed, go_terms_path=args.go_terms)
+        deltas = write_deltas(data_path, np.random.default_rng(args.seed), args.count)
+
+        loaders = ReloadableLoader(str(data_path), compact_after=0)
+        for i, delta in enumerate(deltas, start=1):
+            write_delta(data_path / DELTA_DIR / f"{i:04d}", **delta)
+            loaders.apply_deltas(wait=True)
+            if len(loaders.current.applied_deltas) != i:
+                print(f"Delta {i:04d} was not applied: {(loaders.last_reload or {}).get('error')}")
+                sys.exit(1)
+        incremental = loaders.current
+        print(f"\nApplied deltas: {', '.join(incremental.applied_deltas)}")
+
+        incremental.compact()
+        fresh = DataLoader(data_path=str(data_path))
+
+        print("\nComparing with a fresh load of the compacted files:")
+        problems = []
+        for name in LOOKUP_MAPS:
+            compare(name, normalize_map(getattr(incremental, name)), normalize_map(getattr(fresh, name)), problems)
+
+        protein_ids = list(fresh.protein_index)
+        compare(
+            "summary rows",
+            {row['protein_id']: row for row in incremental.get_protein_summaries(protein_ids)},
+            {row['protein_id']: row for row in fresh.get_protein_summaries(protein_ids)},
+            problems,
+        )
+        compare("edges", edge_keys(incremental.edges), edge_keys(fresh.edges), problems)
+        compare(
+            "GO term protein counts",
+            {term: incremental.go_postings.count(term) for term in fresh.go_id_to_term},
+            {term: fresh.go_postings.count(term) for term in fresh.go_id_to_term},
+            problems,
+        )
+        peptides = [sequence[:6] for sequence in fresh.protein_nodes['sequence'].dropna().head(5)] + ["WW"]
+        compare(
+            "peptide searches",
+            {p: sorted(r['protein_id'] for r in incremental.search_sequence(p)) for p in peptides},
+            {p: sorted(r['protein_id'] for r in fresh.search_sequence(p)) for p in peptides},
+            problems,
+        )
+
+        # Spot checks against the deltas themselves
+        added, removed = deltas[0]['protein_nodes'], set(deltas[2]['removed_proteins'])
+        kept = [p for p in added['id'] if p not in removed]
+        compare("added proteins found", [bool(incremental.search_protein(p)) for p in kept], [True] * len(kept), problems)
+        compare("removed proteins found", [p for p in removed if incremental.search_protein(p)], [], problems)
+
+    if problems:
+        print(f"\n{len(problems)} differences:")
+        for problem in problems:
+            print(f"  - {problem}")
+        sys.exit(1)
+    print("\nIncremental deltas match a fresh load.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,418 @@
+#!/usr/bin/env python
+"""
+End-to-end load test of the Dash server, replaying user sessions through /_dash-update-component.
+
+Each virtual user repeats a session of three callback requests, with the
+payloads the browser sends:
+
+1. search: perform_search for a protein name
+2. view_details: view_protein_details for one of the result buttons
+3. network_view: display_page for /protein with the stored protein, which
+   renders the detail page and its interaction network
+
+The callbacks' outputs, inputs and state are read from /_dash-dependencies.
+Each concurrency level runs for a fixed time; the report gives throughput
+and latency percentiles per step, and the highest level whose p99 stays
+under --max-p99-ms.
+
+Usage:
+    # Generate synthetic data, start a server on it and test 1 to 32 concurrent users
+    python -m src.data.synthetic --output data_synth --scale 1
+    python tests/exploratory/load_test.py --start-server --data-path data_synth --concurrency 1 2 4 8 16 32
+
+    # Test a server that is already running
+    python tests/exploratory/load_test.py --url http://localhost:8050 --data-path data_synth --concurrency 8
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import requests
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+sys.path.insert(0, PROJECT_ROOT)
+
+STEPS = ["search", "view_details", "network_view"]
+PERCENTILES = [50, 90, 95, 99]
+
+# A callback is found by one of its outputs
+STEP_OUTPUTS = {
+    "search": "search-results-content.children",
+    "view_details": "protein-store.data",
+    "network_view": "page-content.children",
+}
+
+
+def split_outputs(output: str) -> List[Dict]:
+    """Turn a callback output key ('a.b' or '..a.b...c.d..') into the outputs list of a request."""
+    def parse(key):
+        component_id, prop = key.rsplit(".", 1)
+        if component_id.startswith("{"):
+            component_id = json.loads(component_id)
+        return {"id": component_id, "property": prop}
+
+    if output.startswith(".."):
+        return [parse(key) for key in output[2:-2].split("...")]
+    return parse(output)
+
+
+def pattern_id(index: int, type_: str) -> str:
+    """The string form of a pattern-matching component ID, as in changedPropIds."""
+    return json.dumps({"index": index, "type": type_}, sort_keys=True, separators=(",", ":"))
+
+
+class DashClient:
+    """Builds and posts the callback requests of a session."""
+
+    def __init__(self, url: str, dependencies: List[Dict]):
+        """
+        Find the session's callbacks in the app's dependencies.
+
+        Args:
+            url: Base URL of the server.
+            dependencies: The JSON of /_dash-dependencies.
+
+        Raises:
+            ValueError: If a callback of the session is missing.
+        """
+        self.url = url.rstrip("/")
+        self.callbacks = {}
+        for step, output in STEP_OUTPUTS.items():
+            matches = [d for d in dependencies if output in d["output"].strip(".").split("...")]
+            if not matches:
+                raise ValueError(f"No callback with output {output}")
+            self.callbacks[step] = matches[0]
+        self.session = requests.Session()
+
+    def _payload(self, step: str, values: Dict, changed: List[str], lists: Optional[Dict] = None) -> Dict:
+        """
+        Build the request body of a callback.
+
+        Args:
+            step: Session step.
+            values: Value of each plain input and state, by 'id.property'.
+            changed: changedPropIds.
+            lists: Entries of each pattern-matching (ALL) input and state, by property.
+
+        Returns:
+            The JSON body.
+        """
+        callback = self.callbacks[step]
+
+        def entries(dependencies):
+            result = []
+            for dependency in dependencies:
+                if dependency["id"].startswith("{"):
+                    result.append(lists[dependency["property"]])
+                else:
+                    key = f"{dependency['id']}.{dependency['property']}"
+                    result.append({**dependency, "value": values.get(key)})
+            return result
+
+        return {
+            "output": callback["output"],
+            "outputs": split_outputs(callback["output"]),
+            "inputs": entries(callback["inputs"]),
+            "state": entries(callback.get("state", [])),
+            "changedPropIds": changed,
+        }
+
+    def post(self, payload: Dict) -> Dict:
+        """Post a callback request and decode the response."""
+        response = self.session.post(f"{self.url}/_dash-update-component", json=payload, timeout=120)
+        response.raise_for_status()
+        return response.json()
+
+    def search(self, term: str, search_type: str) -> Dict:
+        """The search button click."""
+        return self._payload(
+            "search",
+            {
+                "search-button.n_clicks": 1,
+                "search-input.value": term,
+                "search-type.value": search_type,
+            },
+            ["search-button.n_clicks"],
+        )
+
+    def view_details(self, protein_ids: List[str], clicked: int) -> Dict:
+        """The click on the View Details button of result `clicked`."""
+        return self._payload(
+            "view_details",
+            {},
+            [f"{pattern_id(clicked, 'protein-button')}.n_clicks"],
+            lists={
+                "n_clicks": [
+                    {"id": {"index": i, "type": "protein-button"}, "property": "n_clicks", "value": 1 if i == clicked else None}
+                    for i in range(len(protein_ids))
+                ],
+                "data-protein": [
+                    {"id": {"index": i, "type": "protein-data"}, "property": "data-protein", "value": protein_id}
+                    for i, protein_id in enumerate(protein_ids)
+                ],
+            },
+        )
+
+    def network_view(self, protein_data: Dict) -> Dict:
+        """The navigation to /protein that renders the detail page and network."""
+        return self._payload(
+            "network_view",
+            {"url.pathname": "/protein", "url.search": "", "protein-store.data": protein_data},
+            ["url.pathname"],
+        )
+
+
+def result_protein_ids(component) -> List[str]:
+    """Collect the protein IDs of the result cards in a search response, in index order."""
+    found = {}
+    stack = [component]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, dict):
+            props = node.get("props", {})
+            component_id = props.get("id")
+            if isinstance(component_id, dict) and component_id.get("type") == "protein-data":
+                found[component_id["index"]] = props.get("data-protein")
+            stack.extend(value for value in props.values() if isinstance(value, (list, dict)))
+    return [found[i] for i in sorted(found)]
+
+
+def run_session(client: DashClient, term: str, search_type: str, rng: random.Random, record, think: float):
+    """
+    Run one session, recording (step, seconds, ok) for each request.
+
+    Returns:
+        Whether the session reached the network view.
+    """
+    def timed(step, payload):
+        start = time.perf_counter()
+        try:
+            result = client.post(payload)
+        except (requests.RequestException, ValueError):
+            record(step, time.perf_counter() - start, False)
+            return None
+        record(step, time.perf_counter() - start, True)
+        if think:
+            time.sleep(think)
+        return result
+
+    result = timed("search", client.search(term, search_type))
+    if result is None:
+        return False
+    protein_ids = result_protein_ids(result["response"].get("search-results-content", {}).get("children"))
+    if not protein_ids:
+        return False
+
+    clicked = rng.randrange(len(protein_ids))
+    result = timed("view_details", client.view_details(protein_ids, clicked))
+    if result is None:
+        return False
+    protein_data = result["response"].get("protein-store", {}).get("data")
+    if not protein_data:
+        return False
+
+    return timed("network_view", client.network_view(protein_data)) is not None
+
+
+def run_level(url: str, dependencies: List[Dict], terms: List[str], search_type: str,
+              concurrency: int, duration: float, think: float, seed: int) -> Dict:
+    """
+    Run sessions from `concurrency` virtual users for `duration` seconds.
+
+    Users start no new session after the deadline; the elapsed time includes
+    the sessions still running then.
+
+    Returns:
+        Latency samples and error counts per step, sessions completed and elapsed time.
+    """
+    latencies = {step: [] for step in STEPS}
+    errors = {step: 0 for step in STEPS}
+    completed = [0]
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def record(step, seconds, ok):
+        with lock:
+            if ok:
+                latencies[step].append(seconds)
+            else:
+                errors[step] += 1
+
+    def user(index):
+        client = DashClient(url, dependencies)
+        rng = random.Random(seed * 1000 + index)
+        while time.perf_counter() < deadline:
+            if run_session(client, rng.choice(terms), search_type, rng, record, think):
+                with lock:
+                    completed[0] += 1
+
+    start = time.perf_counter()
+    users = [threading.Thread(target=user, args=(i,)) for i in range(concurrency)]
+    for u in users:
+        u.start()
+    for u in users:
+        u.join()
+    return {
+        "concurrency": concurrency,
+        "elapsed": time.perf_counter() - start,
+        "sessions": completed[0],
+        "latencies": latencies,
+        "errors": errors,
+    }
+
+
+def summarize(samples: List[float], errors: int, elapsed: float) -> Dict:
+    """Throughput and latency percentiles (ms) of one set of requests."""
+    values = np.asarray(samples) * 1000
+    summary = {"requests": len(values), "errors": errors, "throughput": len(values) / elapsed}
+    for p in PERCENTILES:
+        summary[f"p{p}"] = float(np.percentile(values, p)) if len(values) else float("nan")
+    summary["max"] = float(values.max()) if len(values) else float("nan")
+    return summary
+
+
+def print_level(level: Dict):
+    """Print the per-step table of one concurrency level."""
+    print(f"\n{level['concurrency']} users: {level['sessions']} sessions in {level['elapsed']:.1f}s "
+          f"({level['sessions'] / level['elapsed']:.2f} sessions/s)")
+    print(f"{'step':<14} {'requests':>9} {'errors':>7} {'req/s':>8} "
+          + " ".join(f"{f'p{p} ms':>9}" for p in PERCENTILES) + f" {'max ms':>9}")
+    all_samples = []
+    for step in STEPS + ["all"]:
+        if step == "all":
+            samples, errors = all_samples, sum(level["errors"].values())
+        else:
+            samples, errors = level["latencies"][step], level["errors"][step]
+            all_samples = all_samples + samples
+        s = summarize(samples, errors, level["elapsed"])
+        print(f"{step:<14} {s['requests']:>9} {s['errors']:>7} {s['throughput']:>8.1f} "
+              + " ".join(f"{s[f'p{p}']:>9.1f}" for p in PERCENTILES) + f" {s['max']:>9.1f}")
+
+
+def load_terms(data_path: str, count: int, seed: int) -> List[str]:
+    """Sample protein names to search for from protein_nodes.parquet."""
+    names = pd.read_parquet(os.path.join(data_path, "protein_nodes.parquet"), columns=["name"])["name"].dropna().unique()
+    rng = np.random.default_rng(seed)
+    return list(rng.choice(names, size=min(count, len(names)), replace=False))
+
+
+def start_server(data_path: str, port: int, timeout: float) -> subprocess.Popen:
+    """
+    Start run.py on a dataset and wait until it serves the app.
+
+    Raises:
+        RuntimeError: If the server exits or is not up within the timeout.
+    """
+    log = tempfile.NamedTemporaryFile(prefix="load_test_server_", suffix=".log", delete=False)
+    print(f"Starting server on {data_path} (port {port}, output in {log.name})...")
+    server = subprocess.Popen(
+        [sys.executable, "run.py", "--data-path", os.path.abspath(data_path), "--port", str(port)],
+        cwd=PROJECT_ROOT, stdout=log, stderr=subprocess.STDOUT,
+    )
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        if server.poll() is not None:
+            raise RuntimeError(f"Server exited with status {server.returncode}; see {log.name}")
+        try:
+            if requests.get(f"http://localhost:{port}/_dash-dependencies", timeout=5).ok:
+                print(f"Server up after {time.perf_counter() - start:.1f}s")
+                return server
+        except requests.RequestException:
+            pass
+        time.sleep(1)
+    server.terminate()
+    raise RuntimeError(f"Server not up after {timeout:.0f}s; see {log.name}")
+
+
+def main():
+    """Run the load test at each concurrency level and report."""
+    parser = argparse.ArgumentParser(description="Load test the Dash server with replayed user sessions")
+    parser.add_argument("--url", type=str, default=None, help="Base URL of a running server")
+    parser.add_argument("--start-server", action="store_true", help="Start run.py on --data-path for the test")
+    parser.add_argument("--port", type=int, default=8099, help="Port of the started server")
+    parser.add_argument("--startup-timeout", type=float, default=900, help="Seconds to wait for the started server")
+    parser.add_argument("--data-path", type=str, default="data_synth", help="Dataset the server runs on (search terms are sampled from it)")
+    parser.add_argument("--scale", type=float, default=None,
+                        help="Generate a synthetic dataset of this scale in --data-path if it has none")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="Concurrent users per level")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds per concurrency level")
+    parser.add_argument("--think-ms", type=float, default=0, help="Pause of each user after every response")
+    parser.add_argument("--search-type", type=str, default="protein", help="Search type of the sessions")
+    parser.add_argument("--terms", type=int, default=1000, help="Number of protein names to sample as search terms")
+    parser.add_argument("--max-p99-ms", type=float, default=1000, help="p99 latency (all steps) a level must stay under")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the terms and clicks")
+    parser.add_argument("--save", type=str, default=None, help="Write the summaries to this JSON file")
+    args = parser.parse_args()
+
+    if not os.path.exists(os.path.join(args.data_path, "protein_nodes.parquet")):
+        if args.scale is None:
+            parser.error(f"No protein_nodes.parquet in {args.data_path}; pass --scale to generate a synthetic dataset")
+        from src.data.synthetic import generate_dataset
+        print(f"Generating a synthetic dataset at scale {args.scale} in {args.data_path}...")
+        generate_dataset(args.data_path, scale=args.scale, seed=args.seed,
+                         go_terms_path=os.path.join(PROJECT_ROOT, "data", "go_term_nodes.parquet"))
+
+    if not args.start_server and not args.url:
+        parser.error("Pass --url of a running server or --start-server")
+    server = start_server(args.data_path, args.port, args.startup_timeout) if args.start_server else None
+    url = args.url or f"http://localhost:{args.port}"
+
+    try:
+        dependencies = requests.get(f"{url}/_dash-dependencies", timeout=30).json()
+        terms = load_terms(args.data_path, args.terms, args.seed)
+
+        # Warm up caches and lazily built indexes with a few sessions
+        run_level(url, dependencies, terms, args.search_type, 1, 2, 0, args.seed)
+
+        levels = []
+        for concurrency in args.concurrency:
+            level = run_level(url, dependencies, terms, args.search_type, concurrency,
+                              args.duration, args.think_ms / 1000, args.seed)
+            print_level(level)
+            levels.append(level)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(f"\n{'users':>6} {'sessions/s':>11} {'req/s':>8} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    summaries = []
+    for level in levels:
+        samples = [s for step in STEPS for s in level["latencies"][step]]
+        overall = summarize(samples, sum(level["errors"].values()), level["elapsed"])
+        summaries.append({
+            "concurrency": level["concurrency"],
+            "sessions_per_second": level["sessions"] / level["elapsed"],
+            "overall": overall,
+            "steps": {
+                step: summarize(level["latencies"][step], level["errors"][step], level["elapsed"]) for step in STEPS
+            },
+        })
+        print(f"{level['concurrency']:>6} {level['sessions'] / level['elapsed']:>11.2f} {overall['throughput']:>8.1f} "
+              f"{overall['p50']:>9.1f} {overall['p99']:>9.1f} {overall['errors']:>7}")
+
+    within = [s["concurrency"] for s in summaries if s["overall"]["p99"] < args.max_p99_ms and not s["overall"]["errors"]]
+    if within:
+        print(f"\nHighest concurrency with p99 under {args.max_p99_ms:.0f} ms and no errors: {max(within)} users")
+    else:
+        print(f"\nNo level kept p99 under {args.max_p99_ms:.0f} ms without errors")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"url": url, "data_path": args.data_path, "duration": args.duration, "levels": summaries}, f, indent=2)
+        print(f"Saved to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
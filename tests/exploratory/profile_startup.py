@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Profile DataLoader startup per phase and track it across runs and dataset versions.
+
+Usage:
+    python tests/exploratory/profile_startup.py --data-path data --history logs/load_reports.jsonl
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from src.data.loader import DataLoader
+
+
+def megabytes(value):
+    """Format a byte count as MB, or '-' if unknown."""
+    return "-" if value is None else f"{value / 2 ** 20:.1f}"
+
+
+def main():
+    """Load the data once, print the phase table and optionally compare with the previous run."""
+    parser = argparse.ArgumentParser(description="Profile DataLoader startup phases")
+    parser.add_argument("--data-path", type=str, default="data", help="Directory containing the parquet files")
+    parser.add_argument("--history", type=str, default=None, help="JSON lines file to append the report to")
+    args = parser.parse_args()
+
+    report = DataLoader(data_path=args.data_path).load_report()
+    report["timestamp"] = time.time()
+
+    previous = None
+    if args.history and os.path.exists(args.history):
+        with open(args.history) as f:
+            lines = [line for line in f if line.strip()]
+        previous = json.loads(lines[-1]) if lines else None
+    before = {p["phase"]: p for p in previous["phases"]} if previous else {}
+
+    print(f"\nDataset version: {report['dataset_version']}")
+    print(f"{'phase':<34} {'rows':>9} {'wall s':>8} {'cpu s':>8} {'RSS MB':>8} {'peak MB':>8} {'vs last':>8}")
+    for phase in report["phases"] + [dict(report["total"], phase="total", rows=None)]:
+        last = before.get(phase["phase"]) if phase["phase"] != "total" else (previous or {}).get("total")
+        change = f"{phase['wall_seconds'] / last['wall_seconds'] - 1:+.0%}" if last and last["wall_seconds"] else ""
+        print(f"{phase['phase']:<34} {phase['rows'] if phase['rows'] is not None else '':>9} "
+              f"{phase['wall_seconds']:>8.3f} {phase['cpu_seconds']:>8.3f} "
+              f"{megabytes(phase['rss_delta_bytes']):>8} {megabytes(phase['peak_rss_delta_bytes']):>8} {change:>8}")
+
+    if args.history:
+        with open(args.history, "a") as f:
+            f.write(json.dumps(report) + "\n")
+        print(f"\nAppended report to {args.history}")
+
+
+if __name__ == "__main__":
+    main()
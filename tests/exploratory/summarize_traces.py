@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""
+Summarize a trace file written with TRACE_FILE: time per span name, and the slowest traces.
+
+Usage:
+    python tests/exploratory/summarize_traces.py logs/traces.jsonl --root callback.view_protein_details
+"""
+import argparse
+import json
+from collections import defaultdict
+
+import numpy as np
+
+
+def main():
+    """Print per-span latency percentiles and the span tree of the slowest traces."""
+    parser = argparse.ArgumentParser(description="Summarize tracing spans")
+    parser.add_argument("path", type=str, help="JSON lines trace file")
+    parser.add_argument("--root", type=str, default=None, help="Only traces whose root span has this name")
+    parser.add_argument("--slowest", type=int, default=3, help="Number of slowest traces to print in full")
+    args = parser.parse_args()
+
+    # A trace ID may cover several requests, e.g. the click and the page render it causes
+    by_trace = defaultdict(list)
+    with open(args.path) as f:
+        for line in f:
+            span = json.loads(line)
+            by_trace[span["trace_id"]].append(span)
+    if args.root:
+        by_trace = {
+            trace_id: spans for trace_id, spans in by_trace.items()
+            if any(s["parent_id"] is None and s["name"] == args.root for s in spans)
+        }
+
+    durations = defaultdict(list)
+    for spans in by_trace.values():
+        for span in spans:
+            durations[span["name"]].append(span["duration_ms"])
+
+    print(f"\n{len(by_trace)} traces")
+    print(f"{'span':<36} {'count':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'total ms':>10}")
+    for name, values in sorted(durations.items(), key=lambda item: -sum(item[1])):
+        p50, p95, p99 = np.percentile(values, [50, 95, 99])
+        print(f"{name:<36} {len(values):>7} {p50:>9.2f} {p95:>9.2f} {p99:>9.2f} {sum(values):>10.1f}")
+
+    def total(spans):
+        return sum(s["duration_ms"] for s in spans if s["parent_id"] is None)
+
+    for trace_id, spans in sorted(by_trace.items(), key=lambda item: -total(item[1]))[:args.slowest]:
+        print(f"\nTrace {trace_id} ({total(spans):.1f} ms)")
+        children = defaultdict(list)
+        for span in spans:
+            children[span["parent_id"]].append(span)
+
+        def show(parent_id, depth):
+            for span in sorted(children[parent_id], key=lambda s: s["start"]):
+                print(f"{'  ' * depth}{span['name']} {span['duration_ms']:.2f} ms {span['attributes'] or ''}"
+                      + (f" ERROR {span['error']}" if span["error"] else ""))
+                show(span["span_id"], depth + 1)
+
+        show(None, 1)
+
+
+if __name__ == "__main__":
+    main()